@@ -0,0 +1,205 @@
+"""
+Headless HTTP API over Storage and logic.
+
+Run with:  python -m src.cli serve --port 8080
+Nothing in this module imports Streamlit.
+"""
+import json
+import queue
+import sys
+import threading
+import traceback
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import gspread
+
+from src.models import Cycle, CycleInfo, TacticStatus
+from src.concurrency import Conflict
+from src.logic import apply_metric_updates, apply_tactic_statuses
+from src.reports import REPORT_FORMATS, render_wam_report
+from src.storage import DEFAULT_CYCLE_ID, HeadlessNotifier, Storage, StorageError, load_settings
+from src.transport import transport_stats
+
+
+class StoragePool:
+    """
+    A small pool of Storage connections shared by all API/CLI requests.
+    Reads may run in parallel; writes are serialized so each transaction merges against the previous one.
+    """
+    def __init__(self, settings: Optional[dict] = None, size: int = 4, cycle_id: Optional[str] = None):
+        self.settings = settings if settings is not None else load_settings()
+        self.cycle_id = cycle_id
+        self.size = size
+        self._idle: "queue.LifoQueue[Storage]" = queue.LifoQueue()
+        self._created = 0
+        self._create_lock = threading.Lock()
+        self.write_lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, cycle_id: Optional[str] = None):
+        """
+        Borrows a connection bound to cycle_id (or the pool's default cycle).
+        """
+        try:
+            storage = self._idle.get_nowait()
+        except queue.Empty:
+            with self._create_lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                storage = Storage(self.settings, notifier=HeadlessNotifier())
+            else:
+                storage = self._idle.get()
+        try:
+            storage.select_cycle(cycle_id or self.cycle_id or DEFAULT_CYCLE_ID)
+            yield storage
+        finally:
+            self._idle.put(storage)
+
+    def load_cycle(self, cycle_id: Optional[str] = None) -> Cycle:
+        with self.connection(cycle_id) as storage:
+            return storage.get_cycle()
+
+    def list_cycles(self) -> List[CycleInfo]:
+        with self.connection() as storage:
+            return storage.list_cycles()
+
+    @contextmanager
+    def transaction(self, cycle_id: Optional[str] = None, conflicts: Optional[List[Conflict]] = None):
+        """
+        Loads the cycle, yields it for modification and saves it once at the end.
+        Edits that conflicted with another session's save are added to `conflicts`.
+        """
+        with self.write_lock, self.connection(cycle_id) as storage:
+            cycle = storage.get_cycle()
+            yield cycle
+            saved_conflicts = storage.save_cycle(cycle)
+            if conflicts is not None:
+                conflicts.extend(saved_conflicts)
+
+
+# --- Batch operations (shared by the HTTP API and CLI) ---
+
+def update_metrics(pool: StoragePool, updates: List[dict], cycle_id: Optional[str] = None) -> dict:
+    """
+    updates: [{"metric_id": "m1_g1", "current_value": 12.5}, ...]
+    """
+    values: Dict[str, float] = {str(u["metric_id"]): float(u["current_value"]) for u in updates}
+    conflicts: List[Conflict] = []
+    with pool.transaction(cycle_id, conflicts) as cycle:
+        missing = apply_metric_updates(cycle, values)
+    return {"updated": len(values) - len(missing) - len(conflicts), "missing": missing,
+            "conflicts": [c.describe() for c in conflicts]}
+
+
+def set_tactic_statuses(pool: StoragePool, updates: List[dict], cycle_id: Optional[str] = None) -> dict:
+    """
+    updates: [{"tactic_id": "t100_0", "status": "Completed"}, ...]
+    """
+    statuses: Dict[str, TacticStatus] = {str(u["tactic_id"]): TacticStatus(u["status"]) for u in updates}
+    conflicts: List[Conflict] = []
+    with pool.transaction(cycle_id, conflicts) as cycle:
+        missing = apply_tactic_statuses(cycle, statuses)
+    return {"updated": len(statuses) - len(missing) - len(conflicts), "missing": missing,
+            "conflicts": [c.describe() for c in conflicts]}
+
+
+def parse_weeks(spec: str) -> range:
+    """
+    Parses "5" or "1-4" into a range of week numbers.
+    """
+    first, _, last = spec.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+
+# --- HTTP ---
+
+class ApiHandler(BaseHTTPRequestHandler):
+    pool: StoragePool = None
+
+    def _send(self, status: int, payload, content_type: str = "application/json"):
+        body = payload.encode("utf-8") if isinstance(payload, str) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_updates(self) -> List[dict]:
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length) or b"{}")
+        updates = data.get("updates") if isinstance(data, dict) else data
+        if not isinstance(updates, list):
+            raise ValueError("Expected a JSON list of updates or {\"updates\": [...]}")
+        return updates
+
+    def _handle(self, fn):
+        try:
+            fn()
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+        except StorageError as e:
+            self._send(502, {"error": str(e)})
+        except Exception as e:
+            # Anything else must still answer with JSON rather than drop the connection
+            print(f"{self.command} {self.path} failed:", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+            # Sheets API and network errors (requests' exceptions are OSErrors) come from the backend
+            backend = isinstance(e, (gspread.exceptions.GSpreadException, OSError))
+            self._send(502 if backend else 500, {"error": f"{type(e).__name__}: {e}"})
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        cycle_id = query.get("cycle", [None])[0]
+
+        def handle():
+            if url.path == "/health":
+                self._send(200, {"status": "ok"})
+            elif url.path == "/metrics":
+                self._send(200, {"transport": transport_stats()})
+            elif url.path == "/cycles":
+                self._send(200, [c.model_dump(mode="json") for c in self.pool.list_cycles()])
+            elif url.path == "/cycle":
+                self._send(200, self.pool.load_cycle(cycle_id).model_dump(mode="json"))
+            elif url.path == "/reports/wam":
+                fmt = query.get("format", ["JSON"])[0]
+                if fmt not in REPORT_FORMATS:
+                    raise ValueError(f"format must be one of {REPORT_FORMATS}")
+                weeks = parse_weeks(query.get("weeks", ["1-13"])[0])
+                content_type = {"JSON": "application/json", "CSV": "text/csv"}.get(fmt, "text/markdown")
+                self._send(200, render_wam_report(self.pool.load_cycle(cycle_id), weeks, fmt), content_type)
+            else:
+                self._send(404, {"error": f"Unknown path {url.path}"})
+
+        self._handle(handle)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        cycle_id = parse_qs(url.query).get("cycle", [None])[0]
+
+        def handle():
+            if url.path == "/metrics":
+                self._send(200, update_metrics(self.pool, self._read_updates(), cycle_id))
+            elif url.path == "/tactics/status":
+                self._send(200, set_tactic_statuses(self.pool, self._read_updates(), cycle_id))
+            else:
+                self._send(404, {"error": f"Unknown path {url.path}"})
+
+        self._handle(handle)
+
+
+def serve(pool: StoragePool, host: str = "127.0.0.1", port: int = 8080):
+    handler = type("BoundApiHandler", (ApiHandler,), {"pool": pool})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving 12-Week Year API on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
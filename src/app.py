@@ -1,25 +1,35 @@
 import streamlit as st
 import streamlit_shadcn_ui as ui
-import plotly.graph_objects as go
 import sys
 import os
 from datetime import date, datetime, time
+from itertools import groupby
 
 # Add the project root to sys.path so we can import from src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.models import Cycle, Goal, Tactic, TacticStatus
-from src.logic import calculate_weekly_execution_score
-from src.storage import Storage
-
-# Initialize Storage globally
-storage = Storage()
-
-# --- Helper Functions ---
-def get_current_week_num(start_date: date) -> int:
-    # Simple logic: days since start / 7 + 1
-    days_diff = (date.today() - start_date).days
-    return max(1, min(13, (days_diff // 7) + 1))
+from src.models import Cycle, CycleStatus, Goal, Tactic, TacticStatus, new_id
+from src.logic import set_tactic_status
+from src.storage import DEFAULT_CYCLE_ID, Storage
+from src.reports import REPORT_FORMATS, render_cycle_summary
+from src.profiling import profiling_enabled, run_profiled
+from src.charts import lag_metrics_figure, metric_points, score_history, score_history_figure
+from src.session_memory import BlobCache, SessionCycle
+from src.forecast import STATUS_AT_RISK, STATUS_OFF_TRACK, forecast_metrics
+from src.scoring import active_engine, week_score
+from src.precompute import schedule as schedule_precompute, wam_draft, week_plan
+from src.plan_view import GOALS_PER_PAGE, TACTICS_PER_PAGE, WEEK_OPTIONS, page_bounds, tactic_positions, week_label
+
+# Profiling mode: run this whole rerun again under the profiler, then stop the unprofiled one
+if profiling_enabled(st.query_params) and run_profiled(__file__, lambda: st.session_state.get("nav_page", "Dashboard")):
+    st.stop()
+
+# Initialize Storage globally (bound to the cycle selected in this session)
+storage = Storage(cycle_id=st.session_state.get("cycle_id"))
+if st.session_state.get("cycle_id", storage.cycle_info.id) != storage.cycle_info.id:
+    # The session's cycle is no longer registered and Storage fell back to the default one
+    st.session_state.cycle_id = storage.cycle_info.id
+    st.session_state.pop("cycle", None)
 
 # Page Config
 st.set_page_config(page_title="12-Week Year OS", layout="wide")
@@ -27,12 +37,18 @@ st.set_page_config(page_title="12-Week Year OS", layout="wide")
 # State Management
 # storage = Storage() # initialized at top
 
-if "cycle" not in st.session_state or not hasattr(st.session_state.cycle, "vision_3_year"):
+if not isinstance(st.session_state.get("cycle"), SessionCycle) or st.session_state.cycle.cycle_id != storage.cycle_info.id:
     # Load from Google Sheets (or default if empty)
-    # Also reload if the schema has changed (missing new attributes)
-    st.session_state.cycle = storage.get_cycle()
+    # Also reload if the session holds state from an older version of the app
+    st.session_state.cycle = SessionCycle(storage.get_cycle())
+
+# Materialized again here if the session sat idle long enough to be packed
+cycle = st.session_state.cycle.get()
 
-cycle = st.session_state.cycle
+# Large derived values (figures, decoded images) live here under the session memory budget
+if "blobs" not in st.session_state:
+    st.session_state.blobs = BlobCache()
+blobs = st.session_state.blobs
 
 # --- Sidebar ---
 with st.sidebar:
@@ -44,17 +60,58 @@ with st.sidebar:
     # Navigation
     page = st.radio(
         "Navigate",
-        ["Dashboard", "Vision", "Plan", "Execute", "Review"],
+        ["Dashboard", "Vision", "Plan", "Execute", "Review", "Search"],
         index=0,
+        key="nav_page",
         label_visibility="collapsed",
         format_func=lambda x: f" {x}" # Add spacing if needed, icons handled below if we mapped them
     )
     
     st.markdown("---")
-    st.caption(f"Current Cycle: **{cycle.id}**")
-    st.caption(f"Week: **{get_current_week_num(cycle.start_date)}**")
+    # Cycle Switcher
+    # Closed cycles drop out of the switcher (unless one is the cycle being viewed)
+    cycles = {c.id: c for c in storage.list_cycles() if c.status == CycleStatus.ACTIVE or c.id == cycle.id}
+    cycle_ids = list(cycles)
+    selected_cycle = st.selectbox(
+        "Cycle",
+        cycle_ids,
+        index=cycle_ids.index(cycle.id) if cycle.id in cycles else 0,
+        format_func=lambda cid: f"{cid} · {cycles[cid].owner}" if cycles[cid].owner else cid
+    )
+    if selected_cycle != cycle.id:
+        st.session_state.cycle_id = selected_cycle
+        storage.select_cycle(selected_cycle)
+        st.session_state.cycle = SessionCycle(storage.get_cycle())
+        st.rerun()
+    
+    st.caption(f"Week: **{cycle.calendar.current_week()}**")
+    
+    with st.popover("⚙️ Cycle Settings"):
+        new_start = st.date_input("Start Date", value=cycle.start_date, key=f"start_date_{cycle.id}")
+        if new_start != cycle.start_date:
+            storage.update_cycle(cycle.id, start_date=new_start)
+            cycle.start_date = new_start
+            st.rerun()
+        if cycle.id != DEFAULT_CYCLE_ID and storage.cycle_info.status == CycleStatus.ACTIVE:
+            if st.button("Close This Cycle", help="Hides it from the switcher; its data and search results are kept"):
+                storage.close_cycle(cycle.id)
+                st.session_state.cycle_id = DEFAULT_CYCLE_ID
+                del st.session_state.cycle
+                st.rerun()
+        
+        st.markdown("---")
+        st.caption("New Cycle")
+        new_owner = st.text_input("Owner / Team", key="new_cycle_owner")
+        new_cycle_start = st.date_input("Start Date", value=date.today(), key="new_cycle_start")
+        if st.button("Create Cycle"):
+            info = storage.create_cycle(new_owner, new_cycle_start)
+            st.session_state.cycle_id = info.id
+            del st.session_state.cycle
+            st.rerun()
     
     if st.button("🔄 Reload Data"):
+        storage.refresh_registry()
+        blobs.clear()
         del st.session_state.cycle
         st.rerun()
 
@@ -69,10 +126,10 @@ if page == "Vision":
     with st.expander("🖼️ Vision Board (Visual Anchor)", expanded=True):
         import base64
         
-        # Load existing image
-        current_img_b64 = storage.get_vision_image()
-        if current_img_b64:
-            st.image(base64.b64decode(current_img_b64), use_container_width=True)
+        # Load existing image (only the decoded bytes are kept, in the session's blob cache)
+        current_img = blobs.get(("vision_image", cycle.id), lambda: base64.b64decode(storage.get_vision_image()))
+        if current_img:
+            st.image(current_img, use_container_width=True)
         
         uploaded_file = st.file_uploader("Upload a new vision board image", type=['png', 'jpg', 'jpeg'])
         if uploaded_file is not None:
@@ -81,6 +138,7 @@ if page == "Vision":
             
             if st.button("Save Image"):
                 if storage.save_vision_image(b64_str):
+                    blobs.discard(("vision_image", cycle.id))
                     st.success("Image saved!")
                     st.rerun()
 
@@ -114,28 +172,39 @@ if page == "Vision":
 
 
 
-current_week = get_current_week_num(cycle.start_date)
+current_week = cycle.calendar.current_week()
+# Prepare this and next week's plans and the WAM draft in the background, once per edit
+schedule_precompute(cycle, current_week)
+
+def pager(total: int, page_size: int, key: str, label: str = "Page"):
+    """
+    Renders a page picker when there is more than one page; returns the (start, end) slice to show.
+    """
+    page = 1
+    _, _, page_count = page_bounds(total, page, page_size)
+    if page_count > 1:
+        page = st.selectbox(label, range(1, page_count + 1), key=key, format_func=lambda p: f"{label} {p} of {page_count}", label_visibility="collapsed")
+    start, end, _ = page_bounds(total, page, page_size)
+    return start, end
 
 # --- Pages ---
 
 if page == "Dashboard":
     st.title("Dashboard")
     
-    # Metrics
-    # Metrics
-    all_tactics = [t for g in cycle.goals for t in g.tactics if t.due_week == current_week]
-    score = calculate_weekly_execution_score(all_tactics)
+    # Metrics (read from the materialized score rollup; weighted if team scoring rules are configured)
+    score = week_score(cycle, current_week)
     
     # Cycle Progress
-    total_cycle_tactics = sum(len(g.tactics) for g in cycle.goals)
-    total_completed_tactics = sum(len([t for t in g.tactics if t.is_completed]) for g in cycle.goals)
-    cycle_progress = total_completed_tactics / total_cycle_tactics if total_cycle_tactics > 0 else 0.0
+    total_cycle_tactics = cycle.scores.cycle.total
+    total_completed_tactics = cycle.scores.cycle.completed
+    cycle_progress = cycle.scores.cycle.progress
 
     cols = st.columns(3)
     with cols[0]:
         ui.metric_card(title="Current Week", content=f"Week {current_week}/12", description="Execution Phase")
     with cols[1]:
-        ui.metric_card(title="Weekly Score", content=f"{score}%", description="Target: 85%+")
+        ui.metric_card(title="Weekly Score", content=f"{score}%", description=f"Target: {active_engine().rules.threshold:g}%+")
     with cols[2]:
         ui.metric_card(title="Cycle Progress", content=f"{int(cycle_progress*100)}%", description=f"{total_completed_tactics}/{total_cycle_tactics} Tactics")
 
@@ -143,82 +212,75 @@ if page == "Dashboard":
     st.markdown("---")
     st.subheader("📈 Results (Lag Indicators)")
     
-    metrics_data = []
-    for goal in cycle.goals:
-        for m in goal.metrics:
-            metrics_data.append(m)
+    metrics_data = [m for goal in cycle.goals for m in goal.metrics]
             
     if not metrics_data:
         st.info("No lag metrics tracked yet.")
     else:
-        # Create a simple bar chart comparing Current vs Target for each metric
-        # Normalize to % for a combined chart? Or just list them?
-        # Let's do a row of small charts or a table for now, or a normalized bar chart.
-        # User requested: "Graph the Lag Metric progress alongside the Execution Score"
-        # Since units vary, a normalized % to target chart is best.
-        
-        metric_names = []
-        metric_percentages = []
-        metric_texts = []
-        
-        for m in metrics_data:
-            metric_names.append(m.title)
-            # Avoid division by zero
-            range_val = m.target_value - m.starting_value
-            if range_val == 0:
-                pct = 100 if m.current_value >= m.target_value else 0
-            else:
-                pct = ((m.current_value - m.starting_value) / range_val) * 100
-            
-            metric_percentages.append(pct)
-            metric_texts.append(f"{m.current_value} / {m.target_value} {m.unit}")
-            
-        fig_m = go.Figure(go.Bar(
-            x=metric_names,
-            y=metric_percentages,
-            text=metric_texts,
-            textposition='auto',
-            marker_color='#3b82f6'
-        ))
-        fig_m.update_layout(
-            title="Goal Progress (Lag Indicators)",
-            yaxis_title="% to Target",
-            yaxis_range=[0, 110],
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)"
-        )
+        # Normalized % to target chart (units vary); rebuilt only when a metric changes
+        fig_m = lag_metrics_figure(blobs, metric_points(metrics_data))
         st.plotly_chart(fig_m, use_container_width=True)
 
+        # Week-12 forecast per metric (pace since the cycle start scaled by execution momentum)
+        forecasts = forecast_metrics(cycle)
+        at_risk = [f for f in forecasts if f.status in (STATUS_AT_RISK, STATUS_OFF_TRACK)]
+        with st.expander(f"🔮 Forecast ({len(at_risk)} at risk)" if at_risk else "🔮 Forecast (all on track)", expanded=bool(at_risk)):
+            st.caption("Each metric continues at its pace from its starting value to its latest update, faster or slower with recent execution scores.")
+            st.dataframe(
+                [{
+                    "Metric": f.title,
+                    "Status": f.status,
+                    "Now": f"{f.progress:.0%}",
+                    "Projected (Week 12)": f"{f.projected_progress:.0%}",
+                    "Projected Value": f.projected_value,
+                    "Target Reached": f.completion_date.isoformat() if f.completion_date else "—",
+                } for f in forecasts],
+                use_container_width=True,
+                hide_index=True
+            )
+
     st.markdown("---")
-    st.subheader("Active Goals")
+    h1, h2 = st.columns([3, 1])
+    with h1:
+        st.subheader("Active Goals")
+    with h2:
+        dash_week = st.selectbox("Week", WEEK_OPTIONS, key="dash_week", format_func=week_label, label_visibility="collapsed")
     
     if not cycle.goals:
         st.info("No goals set. Go to the Plan tab to get started.")
+    
+    g_start, g_end = pager(len(cycle.goals), GOALS_PER_PAGE, key="dash_goal_page", label="Goals page")
+    for goal in cycle.goals[g_start:g_end]:
+        # Goal Progress (from the score rollup, for the filtered week if any)
+        counts = cycle.scores.goal(goal.id, dash_week)
         
-    for goal in cycle.goals:
-        # Calculate Goal Progress
-        g_total = len(goal.tactics)
-        g_completed = len([t for t in goal.tactics if t.is_completed])
-        g_progress = g_completed / g_total if g_total > 0 else 0.0
-        
-        with st.expander(f"{goal.title} ({int(g_progress*100)}%)"):
-            st.progress(g_progress)
-            if not goal.tactics:
+        with st.expander(f"{goal.title} ({int(counts.progress*100)}% · {counts.completed}/{counts.total})"):
+            st.progress(counts.progress)
+            if not counts.total:
                 st.caption("No tactics.")
-            for t in goal.tactics:
+                continue
+            positions = tactic_positions(goal.tactics, dash_week)
+            start, end = pager(len(positions), TACTICS_PER_PAGE, key=f"dash_page_{goal.id}")
+            # One markdown element per page, however many tactics it lists
+            lines = []
+            for j in positions[start:end]:
+                t = goal.tactics[j]
                 icon = "✅" if t.is_completed else "⬜"
-                st.markdown(f"{icon} **{t.title}** (Week {t.due_week}) - *{t.status.value}*")
+                lines.append(f"{icon} **{t.title}** (Week {t.due_week}) - *{t.status.value}*")
+            st.markdown("  \n".join(lines))
 
 elif page == "Execute":
     st.title("Execute: Week " + str(current_week))
     st.caption("Focus on today's tactics.")
     
-    if not any(t for g in cycle.goals for t in g.tactics if t.due_week == current_week):
+    plan = week_plan(cycle, current_week)
+    if not plan.positions:
         st.info("No tactics scheduled for this week.")
     
-    # Group by Goal
-    for goal in cycle.goals:
-        week_tactics = [t for t in goal.tactics if t.due_week == current_week]
+    # Group by Goal (the plan lists tactics in goal order)
+    for goal_idx, group in groupby(plan.positions, key=lambda pos: pos[0]):
+        goal = cycle.goals[goal_idx]
+        week_tactics = [goal.tactics[j] for _, j in group]
         if week_tactics:
             st.subheader(goal.title)
             for tactic in week_tactics:
@@ -235,12 +297,8 @@ elif page == "Execute":
                             
                         new_status = st.selectbox("Status", options=status_options, index=current_index, key=f"exec_status_{tactic.id}", label_visibility="collapsed")
                         if new_status != tactic.status.value:
-                            tactic.status = TacticStatus(new_status)
-                            # Sync is_completed
-                            if new_status == TacticStatus.COMPLETED.value:
-                                tactic.is_completed = True
-                            else:
-                                tactic.is_completed = False
+                            with cycle.scores.tracking(goal.id, tactic):
+                                set_tactic_status(tactic, TacticStatus(new_status))
                             storage.save_cycle(cycle)
                             st.rerun()
                             
@@ -261,20 +319,13 @@ elif page == "Execute":
                             if st.button("Add Event", key=f"cal_{tactic.id}", type="primary"):
                                 # Check for Strategic Block alignment
                                 if tactic.block_type == "Strategic":
-                                    day_name = d.strftime("%A")
                                     # Check if this day has a strategic block
-                                    blocks = [sb for sb in cycle.strategic_blocks if sb.day_of_week == day_name]
+                                    blocks = cycle.calendar.blocks_on(d)
                                     if not blocks:
-                                        st.warning(f"⚠️ You are scheduling a Strategic tactic on {day_name}, but you have no Strategic Blocks defined for this day.")
+                                        st.warning(f"⚠️ You are scheduling a Strategic tactic on {cycle.calendar.weekday_name(d)}, but you have no Strategic Blocks defined for this day.")
                                     else:
-                                        # Simple check: is the start time within any block?
-                                        is_aligned = False
-                                        sched_start = t.strftime("%H:%M")
-                                        for sb in blocks:
-                                            if sb.start_time <= sched_start < sb.end_time:
-                                                is_aligned = True
-                                                break
-                                        if not is_aligned:
+                                        # Is the start time within any block?
+                                        if cycle.calendar.block_at(d, t) is None:
                                             st.warning(f"⚠️ Strategic Tactic scheduled outside of your protected blocks ({', '.join([f'{b.start_time}-{b.end_time}' for b in blocks])}).")
 
                                 start_dt = datetime.combine(d, t).isoformat()
@@ -292,23 +343,37 @@ elif page == "Plan":
         new_goal_title = st.text_input("Goal Title")
         if st.button("Add Goal"):
             if new_goal_title:
-                cycle.goals.append(Goal(id=f"g{len(cycle.goals)+1}", title=new_goal_title))
+                cycle.goals.append(Goal(id=new_id("g"), title=new_goal_title))
                 storage.save_cycle(cycle)
                 st.rerun()
 
-    st.subheader("Current Goals & Tactics")
+    h1, h2 = st.columns([3, 1])
+    with h1:
+        st.subheader("Current Goals & Tactics")
+    with h2:
+        plan_week = st.selectbox("Week", WEEK_OPTIONS, key="plan_week", format_func=week_label, label_visibility="collapsed")
+    # Small plans open every goal; in larger ones a goal's widgets are only created once it is opened
+    open_by_default = cycle.scores.cycle.total <= TACTICS_PER_PAGE
     
-    # Iterate over a copy to allow modification during iteration (for deletes)
-    for i, goal in enumerate(cycle.goals):
+    g_start, g_end = pager(len(cycle.goals), GOALS_PER_PAGE, key="plan_goal_page", label="Goals page")
+    for i in range(g_start, g_end):
+        goal = cycle.goals[i]
         # Calculate Progress
-        total_tactics = len(goal.tactics)
-        completed_tactics = len([t for t in goal.tactics if t.is_completed])
-        progress = completed_tactics / total_tactics if total_tactics > 0 else 0.0
+        progress = cycle.scores.goal(goal.id).progress
         
-        with st.expander(f"{goal.title} ({int(progress*100)}% Complete)", expanded=True):
+        with st.container(border=True):
+            gh1, gh2 = st.columns([4, 1])
+            with gh1:
+                st.markdown(f"**{goal.title}** ({int(progress*100)}% Complete)")
+            with gh2:
+                is_open = st.toggle("Open", value=open_by_default, key=f"open_goal_{goal.id}")
             
             # Goal Progress Bar
             st.progress(progress)
+            if not is_open:
+                counts = cycle.scores.goal(goal.id, plan_week)
+                st.caption(f"{counts.total} tactics ({counts.completed} completed) · {len(goal.metrics)} metrics")
+                continue
             
             # Goal Actions
             c1, c2 = st.columns([4, 1])
@@ -321,6 +386,7 @@ elif page == "Plan":
                     st.rerun()
             with c2:
                 if st.button("🗑️ Delete Goal", key=f"del_goal_{goal.id}", type="primary"):
+                    cycle.scores.remove_goal(goal)
                     cycle.goals.pop(i)
                     storage.save_cycle(cycle)
                     st.rerun()
@@ -350,7 +416,7 @@ elif page == "Plan":
                 if st.button("Add Metric", key=f"add_m_{goal.id}", type="primary"):
                     from src.models import Metric, MetricType
                     new_metric = Metric(
-                        id=f"m{len(goal.metrics)+1}_{goal.id}",
+                        id=new_id("m"),
                         title=m_title,
                         type=MetricType.LAG,
                         starting_value=m_start,
@@ -365,11 +431,14 @@ elif page == "Plan":
             st.markdown("---")
             st.caption("Tactics")
             
-            # Tactics List (Editable)
-            if not goal.tactics:
-                st.info("No tactics yet.")
+            # Tactics List (Editable): only the visible page creates widgets
+            positions = tactic_positions(goal.tactics, plan_week)
+            if not positions:
+                st.info("No tactics yet." if plan_week is None else f"No tactics due in {week_label(plan_week)}.")
             
-            for j, tactic in enumerate(goal.tactics):
+            start, end = pager(len(positions), TACTICS_PER_PAGE, key=f"plan_page_{goal.id}")
+            for j in positions[start:end]:
+                tactic = goal.tactics[j]
                 # Columns: Title, Status, Week, Delete
                 tc1, tc2, tc3, tc4 = st.columns([3, 1.5, 1, 0.5])
                 
@@ -389,24 +458,22 @@ elif page == "Plan":
                         
                     new_status = st.selectbox("Status", options=status_options, index=current_index, key=f"t_status_{tactic.id}", label_visibility="collapsed")
                     if new_status != tactic.status.value:
-                        tactic.status = TacticStatus(new_status)
-                        # Sync is_completed based on status
-                        if new_status == TacticStatus.COMPLETED.value:
-                            tactic.is_completed = True
-                        else:
-                            tactic.is_completed = False
+                        with cycle.scores.tracking(goal.id, tactic):
+                            set_tactic_status(tactic, TacticStatus(new_status))
                         storage.save_cycle(cycle)
                         st.rerun()
 
                 with tc3:
                     t_week = st.number_input("Week", min_value=1, max_value=13, value=tactic.due_week, key=f"t_week_{tactic.id}", label_visibility="collapsed")
                     if t_week != tactic.due_week:
-                        tactic.due_week = t_week
+                        with cycle.scores.tracking(goal.id, tactic):
+                            tactic.due_week = t_week
                         storage.save_cycle(cycle)
                         st.rerun()
                         
                 with tc4:
                     if st.button("🗑️", key=f"del_tactic_{tactic.id}"):
+                        cycle.scores.remove(goal.id, tactic)
                         goal.tactics.pop(j)
                         storage.save_cycle(cycle)
                         st.rerun()
@@ -419,46 +486,29 @@ elif page == "Plan":
                 with c1:
                     t_title = st.text_input("New Tactic Title")
                 with c2:
-                    t_week = st.number_input("Week", min_value=1, max_value=13, value=current_week)
+                    t_week = st.number_input("Week", min_value=1, max_value=13, value=plan_week or current_week)
                 
                 if st.form_submit_button("Add Tactic"):
                     new_tactic = Tactic(
-                        id=f"t{len(goal.tactics)+100}_{i}", # Ensure unique ID
+                        id=new_id("t"),
                         title=t_title, 
                         due_week=t_week
                     )
                     goal.tactics.append(new_tactic)
+                    cycle.scores.add(goal.id, new_tactic)
                     storage.save_cycle(cycle)
                     st.rerun()
 
 elif page == "Review":
     st.title("Weekly Review")
     
-    # 1. Calculate Score for Current Week
-    week_tactics = [t for g in cycle.goals for t in g.tactics if t.due_week == current_week]
-    current_score = calculate_weekly_execution_score(week_tactics)
-    
-    # 2. Historical Chart
-    # Create a map of week_num -> score from saved reviews
-    history_map = {r.week_num: r.score for r in cycle.reviews}
-    # Add current week's live score
-    history_map[current_week] = current_score
-    
-    weeks = sorted(history_map.keys())
-    scores = [history_map[w] for w in weeks]
+    # 1. This week's tactics (precomputed) and score
+    plan = week_plan(cycle, current_week)
+    week_tactics = [t for _, t in plan.tactics(cycle)]
+    current_score = week_score(cycle, current_week)
     
-    # Color code: Green if >= 85, else Red
-    colors = ['#22c55e' if s >= 85 else '#ef4444' for s in scores]
-    
-    fig = go.Figure(data=[go.Bar(x=weeks, y=scores, marker_color=colors)])
-    fig.update_layout(
-        title="Execution Score History", 
-        xaxis_title="Week", 
-        yaxis_title="Score (%)", 
-        yaxis_range=[0, 100],
-        plot_bgcolor="rgba(0,0,0,0)",
-        paper_bgcolor="rgba(0,0,0,0)"
-    )
+    # 2. Historical Chart (saved review scores plus this week's live score)
+    fig = score_history_figure(blobs, score_history(cycle.reviews, current_week, current_score), active_engine().rules.threshold)
     st.plotly_chart(fig, use_container_width=True)
     
     # 3. Review Form
@@ -537,7 +587,6 @@ elif page == "Review":
                 cycle.reviews.append(new_review)
                 st.toast("Review Submitted!")
             
-            storage.save_cycle(cycle)
             storage.save_cycle(cycle)
             st.balloons()
 
@@ -545,34 +594,25 @@ elif page == "Review":
     st.markdown("---")
     st.subheader("📢 WAM Report (Weekly Accountability Meeting)")
     
+    c_wam1, c_wam2 = st.columns([3, 1])
+    with c_wam1:
+        wam_weeks = st.slider("Weeks", min_value=1, max_value=13, value=(current_week, current_week), key="wam_weeks")
+    with c_wam2:
+        wam_format = st.selectbox("Format", REPORT_FORMATS, key="wam_format")
+    
     if st.button("Generate WAM Report"):
-        # Gather data
-        wins_text = existing_review.wins if existing_review else "No wins recorded."
-        struggles_text = existing_review.lessons if existing_review else "No struggles recorded."
-        
-        # Get next week's tactics
-        next_week = current_week + 1
-        next_tactics = [t for g in cycle.goals for t in g.tactics if t.due_week == next_week]
-        commitment_text = "\n".join([f"- {t.title}" for t in next_tactics]) if next_tactics else "No tactics scheduled."
-        
-        wam_report = f"""
-**12-Week Year WAM Report**
-**Week {current_week}**
-
-**Execution Score:** {current_score}%
-
-**Top Wins:**
-{wins_text}
-
-**Key Struggles:**
-{struggles_text}
-
-**Commitments for Week {next_week}:**
-{commitment_text}
-"""
-        st.code(wam_report, language="markdown")
+        wam_report = wam_draft(cycle, range(wam_weeks[0], wam_weeks[1] + 1), wam_format)
+        st.code(wam_report, language=wam_format.lower())
+        st.download_button("Download", wam_report, file_name=f"wam_weeks_{wam_weeks[0]}-{wam_weeks[1]}.{wam_format.lower().replace('markdown', 'md')}")
         st.caption("Copy the text above and share it with your accountability partner.")
 
+    with st.expander("📚 Cycle Summary (All Archived Cycles)"):
+        summary_format = st.selectbox("Format", REPORT_FORMATS, key="summary_format")
+        if st.button("Generate Cycle Summary"):
+            summary = render_cycle_summary(storage, cycle, summary_format)
+            st.code(summary, language=summary_format.lower())
+            st.download_button("Download", summary, file_name=f"cycle_summary.{summary_format.lower().replace('markdown', 'md')}")
+
     # --- Cycle Archival ---
     if current_week >= 12:
         st.markdown("---")
@@ -583,7 +623,27 @@ elif page == "Review":
             if storage.archive_cycle(cycle):
                 # Reset local state
                 cycle.goals = []
+                cycle.rebuild_scores()
                 cycle.reviews = []
+                cycle.start_date = storage.cycle_info.start_date
                 # Keep vision and settings
-                st.session_state.cycle = cycle
                 st.rerun()
+
+elif page == "Search":
+    st.title("Search")
+    st.caption('Search tactics, goals, reviews and vision across every cycle. Use "quotes" for phrases and a trailing * for prefixes.')
+    
+    query = st.text_input("Search", placeholder='e.g. "deep work" or launch*', label_visibility="collapsed")
+    if query:
+        hits = storage.search(query)
+        if not hits:
+            st.info("No matches.")
+        for hit in hits:
+            with st.container(border=True):
+                st.markdown(f"**{hit.title}** · {hit.kind} · Cycle `{hit.cycle}`")
+                if hit.snippet != hit.title:
+                    st.caption(hit.snippet)
+    
+    if st.button("Rebuild Index"):
+        storage.rebuild_search_index()
+        st.toast("Search index rebuilt!")
@@ -0,0 +1,87 @@
+"""
+Plotly figures for the Dashboard and Review pages, memoized by a fingerprint of their inputs
+in the session's BlobCache (so they count against the session memory budget).
+"""
+from typing import Dict, List, Tuple
+
+import plotly.graph_objects as go
+
+from src.logic import SCORE_THRESHOLD
+from src.models import Metric
+from src.session_memory import BlobCache
+
+# (title, starting, target, current, unit) per metric
+MetricPoints = Tuple[Tuple[str, float, float, float, str], ...]
+
+
+# --- Fingerprints (plain tuples: cheap to build, hash and compare) ---
+
+def metric_points(metrics: List[Metric]) -> MetricPoints:
+    return tuple((m.title, m.starting_value, m.target_value, m.current_value, m.unit) for m in metrics)
+
+
+def score_history(reviews, current_week: int, current_score: float) -> Tuple[Tuple[int, float], ...]:
+    """
+    Saved review scores by week, with the live score of the current week taking precedence.
+    """
+    history: Dict[int, float] = {r.week_num: r.score for r in reviews}
+    history[current_week] = current_score
+    return tuple(sorted(history.items()))
+
+
+# --- Figures ---
+
+def lag_metrics_figure(cache: BlobCache, points: MetricPoints) -> go.Figure:
+    return cache.get(("lag_metrics", points), lambda: _build_lag_metrics(points))
+
+
+def score_history_figure(cache: BlobCache, history: Tuple[Tuple[int, float], ...], threshold: float = SCORE_THRESHOLD) -> go.Figure:
+    return cache.get(("score_history", history, threshold), lambda: _build_score_history(history, threshold))
+
+
+def _build_lag_metrics(points: MetricPoints) -> go.Figure:
+    # Units vary between metrics, so each is normalized to % of its target range
+    names, percentages, texts = [], [], []
+    for title, starting, target, current, unit in points:
+        names.append(title)
+        range_val = target - starting
+        if range_val == 0:
+            pct = 100 if current >= target else 0
+        else:
+            pct = ((current - starting) / range_val) * 100
+        percentages.append(pct)
+        texts.append(f"{current} / {target} {unit}")
+
+    fig = go.Figure(go.Bar(
+        x=names,
+        y=percentages,
+        text=texts,
+        textposition='auto',
+        marker_color='#3b82f6'
+    ))
+    fig.update_layout(
+        title="Goal Progress (Lag Indicators)",
+        yaxis_title="% to Target",
+        yaxis_range=[0, 110],
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)"
+    )
+    return fig
+
+
+def _build_score_history(history: Tuple[Tuple[int, float], ...], threshold: float) -> go.Figure:
+    weeks = [w for w, _ in history]
+    scores = [s for _, s in history]
+    # Color code: Green at or above the scoring rules' threshold (85 by default), else Red
+    colors = ['#22c55e' if s >= threshold else '#ef4444' for s in scores]
+
+    fig = go.Figure(data=[go.Bar(x=weeks, y=scores, marker_color=colors)])
+    fig.update_layout(
+        title="Execution Score History",
+        xaxis_title="Week",
+        yaxis_title="Score (%)",
+        yaxis_range=[0, 100],
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)"
+    )
+    return fig
@@ -0,0 +1,126 @@
+"""
+Command line interface for automations.
+
+Examples:
+    python -m src.cli cycle
+    python -m src.cli update-metrics metrics.json
+    python -m src.cli set-status --set t100_0=Completed --set t101_0="In Progress"
+    python -m src.cli report --weeks 1-4 --format CSV
+    python -m src.cli score --archived --rules scoring.toml
+    python -m src.cli export backup.12wk --compress
+    python -m src.cli export changes.12wk --base backup.12wk
+    python -m src.cli import changes.12wk --base backup.12wk
+    python -m src.cli migrate
+    python -m src.cli serve --port 8080
+"""
+import argparse
+import json
+import sys
+from typing import List
+
+from src.api import StoragePool, parse_weeks, serve, set_tactic_statuses, update_metrics
+from src.migrations import run_migrations
+from src.reports import REPORT_FORMATS, stream_wam_report, write_report
+from src.scoring import compile_rules, load_rules
+from src.snapshot import read_snapshot, read_snapshot_header, write_snapshot
+from src.storage import load_settings
+
+
+def _read_batch(path: str, pairs: List[str], id_key: str, value_key: str) -> List[dict]:
+    updates = []
+    if path:
+        with (sys.stdin if path == "-" else open(path)) as f:
+            data = json.load(f)
+        updates.extend(data.get("updates", []) if isinstance(data, dict) else data)
+    for pair in pairs or []:
+        key, _, value = pair.partition("=")
+        updates.append({id_key: key, value_key: value})
+    return updates
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="twelve-week", description="Headless access to the 12-Week Year sheet.")
+    parser.add_argument("--secrets", help="Path to secrets.toml (default: $TWELVE_WEEK_SECRETS or .streamlit/secrets.toml)")
+    parser.add_argument("--pool-size", type=int, default=4, help="Number of pooled storage connections")
+    parser.add_argument("--cycle", help="Cycle id to operate on (default: c1)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("cycle", help="Print the current cycle as JSON")
+    sub.add_parser("cycles", help="List registered cycles")
+
+    p_metrics = sub.add_parser("update-metrics", help="Batch update metric values")
+    p_metrics.add_argument("file", nargs="?", help="JSON file ('-' for stdin) of {metric_id, current_value} objects")
+    p_metrics.add_argument("--set", action="append", metavar="METRIC_ID=VALUE")
+
+    p_status = sub.add_parser("set-status", help="Batch set tactic statuses")
+    p_status.add_argument("file", nargs="?", help="JSON file ('-' for stdin) of {tactic_id, status} objects")
+    p_status.add_argument("--set", action="append", metavar="TACTIC_ID=STATUS")
+
+    p_report = sub.add_parser("report", help="Stream a WAM report to stdout")
+    p_report.add_argument("--weeks", default="1-13", help="Week or range, e.g. 5 or 1-4")
+    p_report.add_argument("--format", default="Markdown", choices=REPORT_FORMATS)
+
+    p_score = sub.add_parser("score", help="Score the cycle (and archives) under the scoring rules")
+    p_score.add_argument("--rules", help="Scoring rules TOML (default: $TWELVE_WEEK_SCORING_RULES, else unweighted)")
+    p_score.add_argument("--archived", action="store_true", help="Also score every archived cycle")
+
+    p_export = sub.add_parser("export", help="Write the cycle to a binary snapshot")
+    p_export.add_argument("file")
+    p_export.add_argument("--base", help="Full snapshot to diff against; writes only the changes since it")
+    p_export.add_argument("--compress", action="store_true", help="zlib-compress the snapshot")
+
+    p_import = sub.add_parser("import", help="Replace the cycle with a binary snapshot")
+    p_import.add_argument("file")
+    p_import.add_argument("--base", help="Full snapshot a delta snapshot was taken against")
+    p_import.add_argument("--dry-run", action="store_true", help="Only describe the snapshot")
+
+    sub.add_parser("migrate", help="Upgrade all worksheets to the current schema version")
+
+    p_serve = sub.add_parser("serve", help="Run the HTTP API")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8080)
+
+    args = parser.parse_args(argv)
+    pool = StoragePool(load_settings(args.secrets), size=args.pool_size, cycle_id=args.cycle)
+
+    if args.command == "cycle":
+        print(pool.load_cycle().model_dump_json(indent=2))
+    elif args.command == "cycles":
+        print(json.dumps([c.model_dump(mode="json") for c in pool.list_cycles()], indent=2))
+    elif args.command == "update-metrics":
+        result = update_metrics(pool, _read_batch(args.file, args.set, "metric_id", "current_value"))
+        print(json.dumps(result))
+    elif args.command == "set-status":
+        result = set_tactic_statuses(pool, _read_batch(args.file, args.set, "tactic_id", "status"))
+        print(json.dumps(result))
+    elif args.command == "report":
+        write_report(stream_wam_report(pool.load_cycle(), parse_weeks(args.weeks), args.format), sys.stdout)
+    elif args.command == "score":
+        engine = compile_rules(load_rules(args.rules))
+        with pool.connection() as storage:
+            cycles = [storage.get_cycle()]
+            if args.archived:
+                cycles += [storage.get_archived_cycle(label) for label in storage.list_archived_cycles()]
+        print(json.dumps([card.model_dump(mode="json") for card in engine.score_cycles(cycles)], indent=2))
+    elif args.command == "export":
+        base = read_snapshot(args.base) if args.base else None
+        size = write_snapshot(args.file, pool.load_cycle(), base=base, compress=args.compress)
+        print(json.dumps({"file": args.file, "bytes": size, "delta": base is not None}))
+    elif args.command == "import":
+        header = read_snapshot_header(args.file)
+        cycle = read_snapshot(args.file, base=read_snapshot(args.base) if args.base else None)
+        summary = {**header.model_dump(), "goals": len(cycle.goals), "tactics": cycle.scores.cycle.total}
+        if not args.dry_run:
+            with pool.connection() as storage:
+                summary["conflicts"] = [c.model_dump(mode="json") for c in storage.restore_cycle(cycle)]
+        print(json.dumps(summary))
+    elif args.command == "migrate":
+        with pool.connection() as storage:
+            print(json.dumps(run_migrations(storage)))
+    elif args.command == "serve":
+        serve(pool, args.host, args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
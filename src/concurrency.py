@@ -0,0 +1,158 @@
+"""
+Optimistic concurrency for saves: local edits are merged with whatever another
+session saved since the cycle was loaded, instead of overwriting it.
+
+Each section keeps the rows it was loaded (or last saved) with as its base.
+On save the current sheet rows are read back and merged row by row, keyed by
+entity id:
+
+- rows only one side changed take that side's version,
+- rows both sides changed are merged field by field,
+- the same field changed to different values on both sides is a conflict:
+  the saved row is kept and the local edit is reported.
+
+Versioned sheets compare the row Version (bumped on every write) to detect
+remote changes; the others compare row contents.
+"""
+from typing import Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from src.migrations import ROW_META_COLUMNS, UPDATED_COLUMN, VERSION_COLUMN
+
+
+class DuplicateKeyError(ValueError):
+    pass
+
+
+class Conflict(BaseModel):
+    section: str
+    key: str
+    label: str
+    fields: List[str] = []       # empty when one side deleted the row
+    local: Optional[dict] = None
+    remote: Optional[dict] = None
+
+    def describe(self) -> str:
+        if self.remote is None:
+            what = "deleted by another session"
+        elif self.local is None:
+            what = "deleted here but edited by another session"
+        elif self.fields:
+            what = f"{', '.join(self.fields)} changed by another session"
+        else:
+            what = "added by another session too"
+        return f"{self.section} '{self.label}': {what}"
+
+
+class MergeResult(BaseModel):
+    rows: List[dict]
+    conflicts: List[Conflict] = []
+    written: int = 0              # rows whose local edits were applied
+    pulled: int = 0               # rows that took another session's changes
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.written or self.pulled)
+
+
+def content(row: Optional[dict]) -> Optional[dict]:
+    """
+    The row without its Version/Updated_At bookkeeping.
+    """
+    if row is None:
+        return None
+    return {k: v for k, v in row.items() if k not in ROW_META_COLUMNS}
+
+
+def _version(row: dict) -> int:
+    return int(row.get(VERSION_COLUMN) or 0)
+
+
+def _remote_changed(base: Optional[dict], remote: Optional[dict], versioned: bool) -> bool:
+    if base is None or remote is None:
+        return base is not remote
+    if versioned:
+        return _version(remote) != _version(base)
+    return remote != base
+
+
+def _stamp(row: dict, version: int, now: str, versioned: bool) -> dict:
+    row = content(row)
+    if versioned:
+        row[VERSION_COLUMN] = version
+        row[UPDATED_COLUMN] = now
+    return row
+
+
+def merge_rows(section: str, base: Dict[str, dict], local: List[dict], remote: List[dict],
+               key: Callable[[dict], str], now: str, versioned: bool = True,
+               label: Optional[Callable[[dict], str]] = None) -> MergeResult:
+    """
+    Three-way merge of one section. base maps key -> row as loaded; local and remote are the
+    rows in memory and in the sheet. Returns the rows to write, in local order followed by
+    rows only the sheet has.
+    """
+    label = label or key
+    local_map = _keyed(section, "local", local, key)
+    remote_map = _keyed(section, "sheet", remote, key)
+    keys = list(local_map) + [k for k in remote_map if k not in local_map]
+    keys += [k for k in base if k not in local_map and k not in remote_map]
+
+    rows: List[dict] = []
+    conflicts: List[Conflict] = []
+    written = pulled = 0
+    for k in keys:
+        b, l, r = base.get(k), local_map.get(k), remote_map.get(k)
+        local_changed = content(l) != content(b)
+        remote_changed = _remote_changed(b, r, versioned)
+
+        if not local_changed:
+            merged = r
+            pulled += remote_changed
+        elif not remote_changed:
+            merged = None if l is None else _stamp(l, _version(b or {}) + 1, now, versioned)
+            written += 1
+        elif content(l) == content(r):
+            # Both sides made the same change
+            merged = r
+        elif l is None or r is None or b is None:
+            conflicts.append(Conflict(section=section, key=k, label=str(label(l or r)), local=content(l), remote=content(r)))
+            merged = r
+        else:
+            merged, clashes = _merge_fields(content(b), content(l), content(r))
+            if clashes:
+                conflicts.append(Conflict(section=section, key=k, label=str(label(l)), fields=clashes,
+                                          local=content(l), remote=content(r)))
+                merged = r
+            else:
+                merged = _stamp(merged, _version(r) + 1, now, versioned)
+                written += 1
+                pulled += 1
+        if merged is not None:
+            rows.append(merged)
+    return MergeResult(rows=rows, conflicts=conflicts, written=written, pulled=pulled)
+
+
+def _keyed(section: str, side: str, rows: List[dict], key: Callable[[dict], str]) -> Dict[str, dict]:
+    # Two rows under one key would collapse into one and the other would be lost silently
+    keyed = {}
+    for row in rows:
+        k = key(row)
+        if k in keyed:
+            raise DuplicateKeyError(f"{section}: two {side} rows share the id {k!r}; nothing was saved")
+        keyed[k] = row
+    return keyed
+
+
+def _merge_fields(base: dict, local: dict, remote: dict):
+    merged = dict(remote)
+    clashes = []
+    for field, value in local.items():
+        if value == base.get(field) or value == remote.get(field):
+            continue
+        if remote.get(field) == base.get(field):
+            merged[field] = value
+        else:
+            clashes.append(field)
+    return merged, clashes
@@ -7,8 +7,27 @@ import os
 # Add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.profiling import PROFILE_DIR, list_profiles, top_hotspots
+from src.transport import get_transport, transport_stats
+
 st.title("Debug Google Sheets (Direct Mode)")
 
+# --- Rerun profiles (written when the app runs with TWELVE_WEEK_PROFILE=1 or ?profile=1) ---
+st.header("Rerun Profiles")
+profiles = list_profiles()
+if not profiles:
+    st.info(f"No profiles in `{PROFILE_DIR}/`. Start the app with TWELVE_WEEK_PROFILE=1 or open it with ?profile=1.")
+else:
+    pages = sorted({p["page"] for p in profiles})
+    page_filter = st.multiselect("Pages", pages, default=pages)
+    selected = [p for p in profiles if p["page"] in page_filter]
+    col_n, col_sort = st.columns(2)
+    last_n = col_n.number_input("Most recent reruns", min_value=1, value=min(20, max(1, len(selected))), step=1)
+    sort = col_sort.radio("Sort by", ["cumulative", "tottime"], horizontal=True)
+    chosen = selected[:last_n]
+    st.caption(f"{len(profiles)} profiles on disk ({sum(p['bytes'] for p in profiles) / 1024:.0f} KB); aggregating {len(chosen)}.")
+    st.dataframe(top_hotspots([p["path"] for p in chosen], sort=sort), use_container_width=True)
+
 # Define Scopes explicitly
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -47,6 +66,16 @@ try:
     data = worksheet.get_all_records()
     st.write(f"✅ Data Read: {len(data)} rows")
     st.write(data)
+    
+    # 6. Same reads through the shared, pooled transport used by the app
+    st.header("Shared Transport")
+    transport = get_transport(creds_dict, SCOPES)
+    pooled = gspread.Client(transport.credentials, session=transport).open_by_url(url)
+    for _ in range(3):
+        pooled.worksheet("Tactics").get_all_records()
+    st.write("✅ 3 reads through the shared session")
+    st.json(transport_stats())
+    st.caption("connections_reused > 0 means requests rode on kept-alive TLS connections.")
 
 except Exception as e:
     st.error("❌ FAILED")
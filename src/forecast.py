@@ -0,0 +1,158 @@
+"""
+Lag-metric forecasts: will each metric reach its target by the end of the cycle?
+
+Every metric is projected at its pace so far: the line through its starting
+value at the cycle start and its latest reading (at last_updated), scaled by
+the momentum of lead-indicator execution (recent weekly execution scores
+relative to the cycle average so far). This is not a fitted trend; metrics
+keep only their latest reading, so there is no history to fit. All metrics
+are projected at once with numpy, and results are cached per input revision.
+"""
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.models import CYCLE_WEEKS, Cycle
+from src.scoring import active_engine
+
+# Projected % of target at week 12 at or above which a metric is "At Risk" rather than "Off Track"
+AT_RISK_PROGRESS = 0.8
+# Execution momentum is clipped so one unusual week cannot swing a projection wildly
+MOMENTUM_RANGE = (0.5, 1.5)
+# Number of most recent weeks compared against the cycle average
+MOMENTUM_WEEKS = 2
+# Completion dates further out than this are reported as "never"
+MAX_COMPLETION_WEEKS = 520
+
+STATUS_ACHIEVED = "Achieved"
+STATUS_ON_TRACK = "On Track"
+STATUS_AT_RISK = "At Risk"
+STATUS_OFF_TRACK = "Off Track"
+STATUS_NO_DATA = "No Data"
+
+_CACHE_SIZE = 32
+_forecast_cache: "OrderedDict[tuple, List[MetricForecast]]" = OrderedDict()
+# Sessions render concurrently; OrderedDict reordering and eviction are not thread-safe
+_forecast_lock = threading.Lock()
+
+
+class MetricForecast(BaseModel):
+    metric_id: str
+    title: str
+    progress: float            # fraction of the start -> target distance covered so far
+    projected_progress: float  # expected fraction at the end of week 12
+    projected_value: float
+    completion_date: Optional[date] = None
+    status: str
+
+
+def execution_momentum(week_scores: np.ndarray, current_week: int) -> float:
+    """
+    Ratio of the recent execution score to the average so far (1.0 without enough history).
+    week_scores[i] is the score of week i + 1 (NaN for weeks without tactics); only weeks
+    up to current_week are used.
+    """
+    elapsed = week_scores[:max(0, min(current_week, len(week_scores)))]
+    elapsed = elapsed[~np.isnan(elapsed)]
+    if len(elapsed) <= MOMENTUM_WEEKS or elapsed.mean() == 0:
+        return 1.0
+    return float(np.clip(elapsed[-MOMENTUM_WEEKS:].mean() / elapsed.mean(), *MOMENTUM_RANGE))
+
+
+def project(starting: np.ndarray, target: np.ndarray, current: np.ndarray, elapsed_weeks: np.ndarray,
+            momentum: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized projection. elapsed_weeks is the time from cycle start to each metric's latest reading.
+    Completion weeks are counted from the cycle start.
+    Returns (progress, projected_progress, projected_value, completion_week); completion_week is
+    NaN where the metric is not moving towards its target.
+    """
+    span = target - starting
+    flat = span == 0
+    safe_span = np.where(flat, 1.0, span)
+    # Fraction of the distance covered; works for decreasing targets too since span carries the sign
+    progress = np.where(flat, (current >= target).astype(float), (current - starting) / safe_span)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.where(elapsed_weeks > 0, progress / elapsed_weeks, 0.0) * momentum
+        remaining = np.clip(CYCLE_WEEKS - elapsed_weeks, 0.0, None)
+        projected_progress = np.where(progress >= 1, progress, progress + rate * remaining)
+        completion_week = np.where(
+            progress >= 1, elapsed_weeks,
+            np.where(rate > 0, elapsed_weeks + (1 - progress) / rate, np.nan),
+        )
+    completion_week[completion_week > MAX_COMPLETION_WEEKS] = np.nan
+    projected_value = starting + projected_progress * span
+    return progress, projected_progress, projected_value, completion_week
+
+
+def forecast_metrics(cycle: Cycle, today: Optional[date] = None) -> List[MetricForecast]:
+    """
+    Forecasts every metric of the cycle. Cached on the forecast inputs, so repeated
+    renders of an unchanged cycle cost one dictionary lookup.
+    """
+    today = today or date.today()
+    metrics = [m for g in cycle.goals for m in g.metrics]
+    # Momentum follows the execution scores the app shows, i.e. those of the active rules
+    engine = active_engine()
+    if engine.rules.is_default():
+        week_scores = tuple(
+            cycle.scores.week(w).score if cycle.scores.week(w).total else None for w in range(1, CYCLE_WEEKS + 1)
+        )
+    else:
+        weekly = engine.score_cycle(cycle).weeks
+        week_scores = tuple(weekly.get(w) for w in range(1, CYCLE_WEEKS + 1))
+    key = (
+        cycle.id, cycle.start_date, today, week_scores,
+        tuple((m.id, m.title, m.starting_value, m.target_value, m.current_value, m.last_updated) for m in metrics),
+    )
+    with _forecast_lock:
+        if key in _forecast_cache:
+            _forecast_cache.move_to_end(key)
+            return _forecast_cache[key]
+
+    forecasts = _forecast(cycle, metrics, np.array(week_scores, dtype=float), today)
+    with _forecast_lock:
+        _forecast_cache[key] = forecasts
+        if len(_forecast_cache) > _CACHE_SIZE:
+            _forecast_cache.popitem(last=False)
+    return forecasts
+
+
+def _forecast(cycle: Cycle, metrics, week_scores: np.ndarray, today: date) -> List[MetricForecast]:
+    if not metrics:
+        return []
+    current_week = min(CYCLE_WEEKS, cycle.calendar.week_of(today))
+    momentum = execution_momentum(week_scores, current_week)
+
+    starting = np.fromiter((m.starting_value for m in metrics), float, len(metrics))
+    target = np.fromiter((m.target_value for m in metrics), float, len(metrics))
+    current = np.fromiter((m.current_value for m in metrics), float, len(metrics))
+    elapsed = np.fromiter(((m.last_updated - cycle.start_date).days / 7 for m in metrics), float, len(metrics))
+    elapsed = np.clip(elapsed, 0.0, None)
+
+    progress, projected, projected_value, completion_week = project(starting, target, current, elapsed, momentum)
+
+    status = np.full(len(metrics), STATUS_OFF_TRACK, dtype=object)
+    status[projected >= AT_RISK_PROGRESS] = STATUS_AT_RISK
+    status[projected >= 1] = STATUS_ON_TRACK
+    status[(elapsed == 0) & (progress < 1)] = STATUS_NO_DATA
+    status[progress >= 1] = STATUS_ACHIEVED
+
+    forecasts = []
+    for i, m in enumerate(metrics):
+        week = completion_week[i]
+        forecasts.append(MetricForecast(
+            metric_id=m.id,
+            title=m.title,
+            progress=round(float(progress[i]), 3),
+            projected_progress=round(float(projected[i]), 3),
+            projected_value=round(float(projected_value[i]), 2),
+            completion_date=None if np.isnan(week) else cycle.start_date + timedelta(days=int(round(week * 7))),
+            status=status[i],
+        ))
+    return forecasts
@@ -0,0 +1,255 @@
+"""
+Load test: drives N concurrent simulated Streamlit sessions through src/app.py.
+
+Each session runs the scripted flow Dashboard -> Execute (status edit) -> Review
+(submit) with streamlit.testing's AppTest against the in-memory spreadsheet,
+so no Google credentials or network are involved.
+
+    python -m src.loadtest --sessions 1,5,10,20 --goals 5 --tactics 24
+
+Every level is run twice. With threads, all sessions share one process and
+one spreadsheet, so saves merge against each other, but reruns take turns (see
+_run_lock). With processes, each session runs in a process of its own against
+its own copy of the plan, so reruns truly overlap but sessions do not see each
+other's saves.
+
+Per level and mode it reports throughput (reruns/s), p50/p99 rerun latency,
+p50/p99 time spent queued for the run lock, backend calls per session
+(metadata/read/write against the spreadsheet) and the Python heap retained per
+live session (tracemalloc).
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+SPREADSHEET_KEY = "memory"
+
+# AppTest swaps process-wide runtime/config state on every run, so runs cannot overlap.
+# With the in-memory backend reruns are pure Python and would hold the GIL anyway,
+# so serializing them still models one server instance under load. Rerun latency is
+# measured once the lock is held; the wait for it is reported on its own.
+_run_lock = threading.Lock()
+# The module the load test was started from (see run_level_processes)
+_entry_main = None
+
+
+def seed_plan(goals: int, tactics_per_goal: int, metrics_per_goal: int = 2):
+    """
+    Writes a plan of the given size to the in-memory spreadsheet (once per process).
+    """
+    from src.models import Goal, Metric, MetricType, Tactic
+    from src.storage import HeadlessNotifier, Storage
+
+    storage = Storage({"backend": "memory", "spreadsheet": SPREADSHEET_KEY}, notifier=HeadlessNotifier())
+    cycle = storage.get_cycle()
+    if cycle.goals:
+        return
+    # The start date is kept in the cycle registry, not in the cycle's sheets
+    storage.update_cycle(storage.cycle_info.id, start_date=date.today())
+    cycle.start_date = storage.cycle_info.start_date
+    for g in range(goals):
+        goal = Goal(id=f"g{g + 1}", title=f"Goal {g + 1}")
+        for t in range(tactics_per_goal):
+            goal.tactics.append(Tactic(id=f"t{t + 100}_{g}", title=f"Tactic {t + 1} of goal {g + 1}", due_week=t % 12 + 1))
+        for m in range(metrics_per_goal):
+            goal.metrics.append(Metric(id=f"m{m + 1}_{goal.id}", title=f"Metric {m + 1}", type=MetricType.LAG, target_value=100.0))
+        cycle.goals.append(goal)
+    cycle.rebuild_scores()
+    storage.save_cycle(cycle)
+
+
+def _timed(timings: Dict[str, List[float]], at):
+    queued = time.perf_counter()
+    with _run_lock:
+        started = time.perf_counter()
+        at.run()
+        finished = time.perf_counter()
+    timings["wait"].append(started - queued)
+    timings["rerun"].append(finished - started)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def run_session(timings: Dict[str, List[float]], sessions: list, timeout: float):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    _timed(timings, at)  # Dashboard
+
+    at.radio(key="nav_page").set_value("Execute")
+    _timed(timings, at)
+    statuses = [s for s in at.selectbox if s.key and s.key.startswith("exec_status_")]
+    if statuses:
+        box = statuses[0]
+        box.set_value("Completed" if box.value != "Completed" else "In Progress")
+        _timed(timings, at)
+
+    at.radio(key="nav_page").set_value("Review")
+    _timed(timings, at)
+    for area in at.text_area:
+        if area.label == "Weekly Wins":
+            area.input("Load test wins")
+    submit = next(b for b in at.button if b.label == "Submit Review")
+    submit.click()
+    _timed(timings, at)
+
+    # Keep the session (and its state) alive so its memory is measured
+    sessions.append(at)
+
+
+def run_level(n: int, timeout: float) -> Dict[str, float]:
+    from src.memory_sheets import open_memory_spreadsheet
+
+    spreadsheet = open_memory_spreadsheet(SPREADSHEET_KEY)
+    calls_before = dict(spreadsheet.calls)
+    timings: Dict[str, List[float]] = {"rerun": [], "wait": []}
+    sessions: list = []
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=n) as executor:
+        for future in [executor.submit(run_session, timings, sessions, timeout) for _ in range(n)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    calls = {op: spreadsheet.calls[op] - calls_before.get(op, 0) for op in ("metadata", "read", "write")}
+    return _summary("threads", n, timings, elapsed, calls, retained)
+
+
+def _session_process(barrier, results, goals: int, tactics: int, timeout: float):
+    """
+    One session in a process of its own: seeds and warms up its own in-memory plan, waits
+    for every other session to be ready, then runs the flow once.
+    """
+    try:
+        os.environ["TWELVE_WEEK_STORAGE"] = "memory"
+        seed_plan(goals, tactics)
+        run_session({"rerun": [], "wait": []}, [], timeout)
+        from src.memory_sheets import open_memory_spreadsheet
+
+        spreadsheet = open_memory_spreadsheet(SPREADSHEET_KEY)
+        calls_before = dict(spreadsheet.calls)
+        timings: Dict[str, List[float]] = {"rerun": [], "wait": []}
+        sessions: list = []
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        barrier.wait()
+        started = time.time()
+        run_session(timings, sessions, timeout)
+        finished = time.time()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        calls = {op: spreadsheet.calls[op] - calls_before.get(op, 0) for op in ("metadata", "read", "write")}
+        results.put({"timings": timings, "started": started, "finished": finished, "calls": calls, "retained": retained})
+    except Exception as e:
+        barrier.abort()
+        results.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def run_level_processes(n: int, goals: int, tactics: int, timeout: float) -> Dict[str, float]:
+    """
+    Runs n sessions at once, one per process. Throughput spans the first session's start
+    to the last one's finish; process start-up and warm-up are not counted.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    barrier, results = ctx.Barrier(n), ctx.Queue()
+    processes = [ctx.Process(target=_session_process, args=(barrier, results, goals, tactics, timeout)) for _ in range(n)]
+    # Spawned processes re-import __main__, which AppTest has replaced with the app script
+    app_main = sys.modules["__main__"]
+    sys.modules["__main__"] = _entry_main or app_main
+    try:
+        for process in processes:
+            process.start()
+    finally:
+        sys.modules["__main__"] = app_main
+    outcomes = [results.get(timeout=timeout * 10) for _ in processes]
+    for process in processes:
+        process.join()
+    results.close()
+    errors = [o["error"] for o in outcomes if "error" in o]
+    if errors:
+        raise RuntimeError(errors[0])
+
+    timings: Dict[str, List[float]] = {"rerun": [], "wait": []}
+    for o in outcomes:
+        for name, values in o["timings"].items():
+            timings[name] += values
+    elapsed = max(o["finished"] for o in outcomes) - min(o["started"] for o in outcomes)
+    calls = {op: sum(o["calls"][op] for o in outcomes) for op in ("metadata", "read", "write")}
+    return _summary("processes", n, timings, elapsed, calls, sum(o["retained"] for o in outcomes))
+
+
+def _summary(mode: str, n: int, timings: Dict[str, List[float]], elapsed: float, calls: Dict[str, int], retained: int) -> Dict[str, float]:
+    reruns, waits = sorted(timings["rerun"]), sorted(timings["wait"])
+    return {
+        "mode": mode,
+        "sessions": n,
+        "reruns": len(reruns),
+        "throughput": len(reruns) / elapsed,
+        "p50_ms": statistics.median(reruns) * 1000,
+        "p99_ms": _p99(reruns) * 1000,
+        "wait_p50_ms": statistics.median(waits) * 1000,
+        "wait_p99_ms": _p99(waits) * 1000,
+        "calls_per_session": {op: count / n for op, count in calls.items()},
+        "kb_per_session": retained / n / 1024,
+    }
+
+
+def _p99(ordered: List[float]) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+def print_results(results: List[Dict]):
+    print(f"{'Mode':<10} {'Sessions':>8} {'Reruns':>7} {'Reruns/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'Wait p50':>9} {'Wait p99':>9} "
+          f"{'Meta':>7} {'Reads':>7} {'Writes':>8} {'KB/sess':>8}")
+    for r in results:
+        c = r["calls_per_session"]
+        print(f"{r['mode']:<10} {r['sessions']:>8} {r['reruns']:>7} {r['throughput']:>9.1f} {r['p50_ms']:>8.0f} {r['p99_ms']:>8.0f} "
+              f"{r['wait_p50_ms']:>9.0f} {r['wait_p99_ms']:>9.0f} "
+              f"{c['metadata']:>7.1f} {c['read']:>7.1f} {c['write']:>8.1f} {r['kb_per_session']:>8.0f}")
+    print("p50/p99: rerun time once running; Wait: time queued for the run lock (threaded runs cannot overlap)")
+    print("threads: one process, shared spreadsheet; processes: one process and spreadsheet copy per session")
+    print("Meta/Reads/Writes: backend calls per session over the whole flow")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="twelve-week-loadtest", description="Simulate concurrent app sessions offline.")
+    parser.add_argument("--sessions", default="1,5,10", help="Comma separated concurrency levels")
+    parser.add_argument("--goals", type=int, default=3)
+    parser.add_argument("--tactics", type=int, default=12, help="Tactics per goal")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds allowed per rerun")
+    parser.add_argument("--mode", choices=["threads", "processes", "both"], default="both",
+                        help="Run the sessions of a level as threads of this process, as separate processes, or both")
+    args = parser.parse_args(argv)
+
+    global _entry_main
+    _entry_main = sys.modules["__main__"]
+    # Must be set before src.storage is imported (here and by the app under test)
+    os.environ["TWELVE_WEEK_STORAGE"] = "memory"
+    seed_plan(args.goals, args.tactics)
+    # Warm-up session so imports and one-off caches are not charged to the first level
+    run_session({"rerun": [], "wait": []}, [], args.timeout)
+
+    results = []
+    for n in (int(n) for n in args.sessions.split(",")):
+        if args.mode in ("threads", "both"):
+            results.append(run_level(n, args.timeout))
+        if args.mode in ("processes", "both"):
+            results.append(run_level_processes(n, args.goals, args.tactics, args.timeout))
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,10 @@
-from typing import List
-from src.models import Tactic
+import hashlib
+from datetime import date
+from typing import Dict, List
+from src.models import Cycle, Tactic, TacticStatus
+
+# Weekly execution score a week needs to count as executed
+SCORE_THRESHOLD = 85.0
 
 def calculate_weekly_execution_score(tactics: List[Tactic]) -> float:
     if not tactics:
@@ -8,5 +13,55 @@ def calculate_weekly_execution_score(tactics: List[Tactic]) -> float:
     completed_count = sum(1 for t in tactics if t.is_completed or t.status == "Complete")
     return round((completed_count / len(tactics)) * 100.0, 1)
 
-def check_score_threshold(score: float) -> bool:
-    return score < 85.0
+def check_score_threshold(score: float, threshold: float = SCORE_THRESHOLD) -> bool:
+    return score < threshold
+
+def tactics_by_week(cycle: Cycle) -> Dict[int, List[Tactic]]:
+    """
+    Groups every tactic of the cycle by due week in a single pass.
+    """
+    index: Dict[int, List[Tactic]] = {}
+    for goal in cycle.goals:
+        for t in goal.tactics:
+            index.setdefault(t.due_week, []).append(t)
+    return index
+
+def cycle_revision(cycle: Cycle) -> str:
+    """
+    Returns a fingerprint of the cycle's data, used as a cache key by derived views.
+    Recomputed only after the cycle has changed since the last call.
+    """
+    return cycle.memo_revision(lambda: hashlib.sha1(cycle.model_dump_json().encode("utf-8")).hexdigest())
+
+def set_tactic_status(tactic: Tactic, status: TacticStatus):
+    """
+    Sets a tactic's status and keeps is_completed in sync with it.
+    """
+    tactic.status = status
+    tactic.is_completed = status == TacticStatus.COMPLETED
+
+def apply_tactic_statuses(cycle: Cycle, updates: Dict[str, TacticStatus]) -> List[str]:
+    """
+    Applies a batch of tactic_id -> status updates in one pass over the cycle.
+    Returns the ids that did not match any tactic.
+    """
+    remaining = dict(updates)
+    for goal in cycle.goals:
+        for t in goal.tactics:
+            if t.id in remaining:
+                with cycle.scores.tracking(goal.id, t):
+                    set_tactic_status(t, remaining.pop(t.id))
+    return list(remaining)
+
+def apply_metric_updates(cycle: Cycle, updates: Dict[str, float]) -> List[str]:
+    """
+    Applies a batch of metric_id -> current_value updates in one pass over the cycle.
+    Returns the ids that did not match any metric.
+    """
+    remaining = dict(updates)
+    for goal in cycle.goals:
+        for m in goal.metrics:
+            if m.id in remaining:
+                m.current_value = remaining.pop(m.id)
+                m.last_updated = date.today()
+    return list(remaining)
@@ -0,0 +1,197 @@
+"""
+In-process stand-in for a Google spreadsheet, used for offline runs and load tests.
+
+Select it with TWELVE_WEEK_STORAGE=memory (or backend = "memory" in the gsheets
+settings). Storage then runs its normal code paths against MemorySpreadsheet,
+which implements the subset of the gspread Spreadsheet/Worksheet API that
+Storage uses and counts every call, so backend traffic can be measured.
+"""
+import copy
+import itertools
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+import gspread
+
+_sheet_ids = itertools.count(1)
+
+
+def _numericise(value):
+    # Mirrors what the Sheets API hands back to get_all_records(): numbers and TRUE/FALSE
+    if value is True:
+        return "TRUE"
+    if value is False:
+        return "FALSE"
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return value
+    return value
+
+
+def _cell(value: dict):
+    # userEnteredValue of an updateCells request
+    for kind in ("stringValue", "numberValue", "boolValue"):
+        if kind in value:
+            return value[kind]
+    return ""
+
+
+class MemoryWorksheet:
+    def __init__(self, spreadsheet: "MemorySpreadsheet", title: str, rows: Optional[List[list]] = None,
+                 row_count: int = 1000, col_count: int = 26):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = next(_sheet_ids)
+        self._rows: List[list] = rows or []
+        self.row_count = max(row_count, len(self._rows))
+        self.col_count = col_count
+        self.deleted = False
+
+    def _count(self, op: str):
+        self.spreadsheet.calls[op] += 1
+        if self.deleted:
+            # A handle to a deleted sheet (e.g. from stale metadata) fails like the API does
+            raise gspread.WorksheetNotFound(self.title)
+
+    def get_all_records(self) -> List[dict]:
+        self._count("read")
+        with self.spreadsheet.lock:
+            if not self._rows:
+                return []
+            header = self._rows[0]
+            records = []
+            for row in self._rows[1:]:
+                row = list(row) + [""] * (len(header) - len(row))
+                records.append({h: _numericise(v) for h, v in zip(header, row)})
+            return records
+
+    def get_all_values(self) -> List[List[str]]:
+        self._count("read")
+        with self.spreadsheet.lock:
+            return [["" if v is None else str(v) for v in row] for row in self._rows]
+
+    def clear(self):
+        self._count("write")
+        with self.spreadsheet.lock:
+            self._rows = []
+
+    def update(self, values: List[list], *args, **kwargs):
+        self._count("write")
+        with self.spreadsheet.lock:
+            self._rows = copy.deepcopy(values)
+
+    def add_rows(self, rows: int):
+        self._count("write")
+        self.row_count += rows
+
+    def add_cols(self, cols: int):
+        self._count("write")
+        self.col_count += cols
+
+    def append_row(self, row: list, *args, **kwargs):
+        self._count("write")
+        with self.spreadsheet.lock:
+            self._rows.append(list(row))
+
+    def append_rows(self, rows: List[list], *args, **kwargs):
+        self._count("write")
+        with self.spreadsheet.lock:
+            self._rows.extend(copy.deepcopy(rows))
+
+
+class MemorySpreadsheet:
+    def __init__(self, key: str):
+        self.id = f"memory:{key}"
+        self.title = key
+        self.lock = threading.RLock()
+        self.calls: Counter = Counter()
+        self._worksheets: Dict[str, MemoryWorksheet] = {}
+        self.add_worksheet("Tactics", rows=1000, cols=26)
+        self.calls.clear()
+
+    def worksheets(self) -> List[MemoryWorksheet]:
+        self.calls["metadata"] += 1
+        with self.lock:
+            return list(self._worksheets.values())
+
+    def worksheet(self, title: str) -> MemoryWorksheet:
+        self.calls["metadata"] += 1
+        with self.lock:
+            if title not in self._worksheets:
+                raise gspread.WorksheetNotFound(title)
+            return self._worksheets[title]
+
+    def add_worksheet(self, title: str, rows: int, cols: int) -> MemoryWorksheet:
+        self.calls["write"] += 1
+        with self.lock:
+            if title in self._worksheets:
+                raise gspread.exceptions.GSpreadException(f"A sheet with the name \"{title}\" already exists")
+            ws = self._worksheets[title] = MemoryWorksheet(self, title, row_count=rows, col_count=cols)
+            return ws
+
+    def batch_update(self, body: dict):
+        """
+        Supports updateCells over whole rows: the range's rows are replaced by the given ones
+        (cells not given are cleared). A sheetId-only range covers the whole worksheet.
+        """
+        self.calls["write"] += 1
+        with self.lock:
+            by_id = {ws.id: ws for ws in self._worksheets.values()}
+            for request in body["requests"]:
+                update = request["updateCells"]
+                grid = update["range"]
+                if grid["sheetId"] not in by_id:
+                    raise gspread.exceptions.GSpreadException(f"No grid with id: {grid['sheetId']}")
+                ws = by_id[grid["sheetId"]]
+                rows = [[_cell(v) for v in row.get("values", [])] for row in update.get("rows", [])]
+                start = grid.get("startRowIndex", 0)
+                end = grid.get("endRowIndex", ws.row_count)
+                if start + len(rows) > ws.row_count or end > ws.row_count:
+                    raise gspread.exceptions.GSpreadException("Range exceeds grid limits")
+                rows += [[] for _ in range(end - start - len(rows))]
+                current = ws._rows + [[] for _ in range(end - len(ws._rows))]
+                current[start:end] = rows
+                # Trailing blank rows are not part of the data range
+                while current and not any(v != "" for v in current[-1]):
+                    current.pop()
+                ws._rows = current
+        return {}
+
+    def del_worksheet(self, ws: MemoryWorksheet):
+        self.calls["write"] += 1
+        with self.lock:
+            if self._worksheets.get(ws.title) is ws:
+                del self._worksheets[ws.title]
+                ws.deleted = True
+
+    def duplicate_sheet(self, source_sheet_id: int, new_sheet_name: str):
+        self.calls["write"] += 1
+        with self.lock:
+            if new_sheet_name in self._worksheets:
+                raise gspread.exceptions.GSpreadException(f"A sheet with the name \"{new_sheet_name}\" already exists")
+            source = next(ws for ws in self._worksheets.values() if ws.id == source_sheet_id)
+            ws = self._worksheets[new_sheet_name] = MemoryWorksheet(self, new_sheet_name, copy.deepcopy(source._rows))
+            return ws
+
+
+# One spreadsheet per key, shared by every Storage in the process like a real sheet would be
+_spreadsheets: Dict[str, MemorySpreadsheet] = {}
+_lock = threading.Lock()
+
+
+def open_memory_spreadsheet(key: str = "memory") -> MemorySpreadsheet:
+    with _lock:
+        if key not in _spreadsheets:
+            _spreadsheets[key] = MemorySpreadsheet(key)
+        return _spreadsheets[key]
+
+
+def drop_memory_spreadsheet(key: str = "memory"):
+    with _lock:
+        _spreadsheets.pop(key, None)
@@ -0,0 +1,159 @@
+"""
+Sheet schema versions and the one-time migrations between them.
+
+Each data worksheet carries its schema version as an extra header cell
+(e.g. "Schema_v1") after its real columns. Sheets at SCHEMA_VERSION are read
+with a strict parser; older sheets are upgraded in memory, written back once,
+and read strictly from then on.
+"""
+import sys
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+SCHEMA_VERSION = 2
+SCHEMA_MARKER_PREFIX = "Schema_v"
+VERSION_COLUMN = "Version"
+UPDATED_COLUMN = "Updated_At"
+ROW_META_COLUMNS = [VERSION_COLUMN, UPDATED_COLUMN]
+
+TACTIC_COLUMNS = ["Goal_ID", "Goal_Title", "Tactic_ID", "Tactic_Title", "Due_Week", "Status", "Block_Type", "Is_Completed"] + ROW_META_COLUMNS
+REVIEW_COLUMNS = ["Week_Num", "Score", "Wins", "Lessons", "Date_Submitted"] + ROW_META_COLUMNS
+METRIC_COLUMNS = ["Goal_ID", "Metric_ID", "Title", "Type", "Starting_Value", "Target_Value", "Current_Value", "Unit", "Last_Updated"] + ROW_META_COLUMNS
+
+COLUMNS = {
+    "Tactics": TACTIC_COLUMNS,
+    "Reviews": REVIEW_COLUMNS,
+    "Metrics": METRIC_COLUMNS,
+}
+
+
+def schema_marker(version: int = SCHEMA_VERSION) -> str:
+    return f"{SCHEMA_MARKER_PREFIX}{version}"
+
+
+def headers(sheet: str) -> List[str]:
+    """
+    The header row written for a versioned sheet: its columns followed by the version marker.
+    """
+    return COLUMNS[sheet] + [schema_marker()]
+
+
+def detect_version(records: List[dict]) -> Optional[int]:
+    """
+    Reads the schema version from the header keys of get_all_records() output.
+    Returns None for an empty sheet (nothing to migrate) and 0 for unversioned sheets.
+    """
+    if not records:
+        return None
+    for key in records[0]:
+        if isinstance(key, str) and key.startswith(SCHEMA_MARKER_PREFIX):
+            try:
+                return int(key[len(SCHEMA_MARKER_PREFIX):])
+            except ValueError:
+                continue
+    return 0
+
+
+# --- v0 -> v1: normalize the values the loaders used to coerce on every read ---
+
+def _blank(value) -> bool:
+    return value is None or str(value).strip() == ""
+
+
+def _v1_tactic(row: dict) -> Optional[dict]:
+    status = "Not Started" if _blank(row.get("Status")) else str(row["Status"])
+    if status == "Pending":
+        status = "Not Started"
+    is_comp = row.get("Is_Completed")
+    if isinstance(is_comp, str):
+        is_comp = is_comp.lower() == "true"
+    return {
+        "Goal_ID": str(row.get("Goal_ID", "")),
+        "Goal_Title": "Untitled Goal" if _blank(row.get("Goal_Title")) else str(row["Goal_Title"]),
+        "Tactic_ID": "" if _blank(row.get("Tactic_ID")) else str(row["Tactic_ID"]),
+        "Tactic_Title": "Untitled Tactic" if _blank(row.get("Tactic_Title")) else str(row["Tactic_Title"]),
+        "Due_Week": 1 if _blank(row.get("Due_Week")) else int(float(row["Due_Week"])),
+        "Status": status,
+        "Block_Type": "None" if _blank(row.get("Block_Type")) else str(row["Block_Type"]),
+        "Is_Completed": bool(is_comp),
+    }
+
+
+def _v1_review(row: dict) -> Optional[dict]:
+    if not row.get("Week_Num"):
+        return None
+    return {
+        "Week_Num": int(row["Week_Num"]),
+        "Score": float(row["Score"]),
+        "Wins": str(row.get("Wins", "")),
+        "Lessons": str(row.get("Lessons", "")),
+        "Date_Submitted": str(row["Date_Submitted"]) if row.get("Date_Submitted") else date.today().isoformat(),
+    }
+
+
+def _v1_metric(row: dict) -> Optional[dict]:
+    try:
+        return {
+            "Goal_ID": str(row["Goal_ID"]),
+            "Metric_ID": str(row["Metric_ID"]),
+            "Title": str(row["Title"]),
+            "Type": str(row["Type"]),
+            "Starting_Value": 0.0 if _blank(row.get("Starting_Value")) else float(row["Starting_Value"]),
+            "Target_Value": float(row["Target_Value"]),
+            "Current_Value": 0.0 if _blank(row.get("Current_Value")) else float(row["Current_Value"]),
+            "Unit": str(row.get("Unit", "")),
+            "Last_Updated": str(row["Last_Updated"]) if row.get("Last_Updated") else date.today().isoformat(),
+        }
+    except (KeyError, ValueError) as e:
+        print(f"Dropping unparseable metric row {row}: {e}", file=sys.stderr)
+        return None
+
+
+# --- v1 -> v2: per-row version and timestamp ---
+
+def _v2_row(row: dict) -> Optional[dict]:
+    # Rows written before versioning all start at version 1
+    return {**row, VERSION_COLUMN: 1, UPDATED_COLUMN: ""}
+
+
+# MIGRATIONS[v][sheet] upgrades one row from v-1 to v (returning None drops the row)
+MIGRATIONS: Dict[int, Dict[str, Callable[[dict], Optional[dict]]]] = {
+    1: {"Tactics": _v1_tactic, "Reviews": _v1_review, "Metrics": _v1_metric},
+    2: {"Tactics": _v2_row, "Reviews": _v2_row, "Metrics": _v2_row},
+}
+
+
+def migrate_records(sheet: str, records: List[dict], from_version: int) -> List[dict]:
+    """
+    Runs every migration above from_version over the records of one sheet.
+    """
+    for version in range(from_version + 1, SCHEMA_VERSION + 1):
+        step = MIGRATIONS[version].get(sheet)
+        if step is None:
+            continue
+        records = [r for r in (step(row) for row in records) if r is not None]
+    return records
+
+
+def to_rows(sheet: str, records: List[dict]) -> List[list]:
+    """
+    Serializes current-version records into the values written to the sheet (header included).
+    """
+    columns = COLUMNS[sheet]
+    return [headers(sheet)] + [[r[c] for c in columns] for r in records]
+
+
+def run_migrations(storage) -> Dict[str, int]:
+    """
+    Upgrades every outdated data sheet of the storage in place.
+    Returns {sheet: previous_version} for the sheets that were rewritten.
+    """
+    upgraded = {}
+    for sheet, ws in storage.versioned_worksheets():
+        records = ws.get_all_records()
+        version = detect_version(records)
+        if version is None or version >= SCHEMA_VERSION:
+            continue
+        storage.write_migrated(ws, sheet, migrate_records(sheet, records, version))
+        upgraded[ws.title] = version
+    return upgraded
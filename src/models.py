@@ -1,7 +1,15 @@
+import uuid
 from enum import Enum
-from datetime import date, timedelta
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from datetime import date, time, timedelta
+from contextlib import contextmanager
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+
+def new_id(prefix: str) -> str:
+    """
+    A collision-free id for a new goal ("g"), tactic ("t") or metric ("m").
+    """
+    return f"{prefix}{uuid.uuid4().hex}"
 
 class BlockType(str, Enum):
     STRATEGIC = "Strategic"
@@ -20,7 +28,159 @@ class MetricType(str, Enum):
     LEAD = "Lead"
     LAG = "Lag"
 
-class Metric(BaseModel):
+class CycleStatus(str, Enum):
+    ACTIVE = "Active"
+    CLOSED = "Closed"
+
+class ChangeTracker:
+    """
+    Which logical sections (worksheets) of one cycle have unsaved changes.
+    Shared by the cycle and every tracked model and list inside it.
+    """
+    __slots__ = ("dirty", "version")
+
+    def __init__(self):
+        self.dirty: Set[str] = set()
+        # Bumped on every change; lets derived values (e.g. the revision hash) be memoized
+        self.version = 0
+
+    def mark(self, sections: Tuple[str, ...]):
+        self.dirty.update(sections)
+        self.version += 1
+
+def _bind(item: Any, tracker: ChangeTracker):
+    if isinstance(item, TrackedModel):
+        item.bind_tracker(tracker)
+
+class TrackedList(list):
+    """
+    A list field of a tracked model: every mutation marks the field's sections dirty,
+    and items added to it start reporting to the same tracker.
+    """
+    __slots__ = ("_tracker", "_sections")
+
+    def __init__(self, items=(), tracker: Optional[ChangeTracker] = None, sections: Tuple[str, ...] = ()):
+        super().__init__(items)
+        self._tracker = tracker
+        self._sections = sections
+        if tracker is not None:
+            for item in self:
+                _bind(item, tracker)
+
+    def __reduce_ex__(self, protocol):
+        # Copies and pickles keep tracking (deepcopy shares one copied tracker across the tree)
+        return (TrackedList, (list(self), self._tracker, self._sections))
+
+    def _changed(self, items=()):
+        if self._tracker is not None:
+            for item in items:
+                _bind(item, self._tracker)
+            self._tracker.mark(self._sections)
+
+    def append(self, item):
+        super().append(item)
+        self._changed((item,))
+
+    def extend(self, items):
+        items = list(items)
+        super().extend(items)
+        self._changed(items)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed((item,))
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed(value if isinstance(index, slice) else (value,))
+
+    def __iadd__(self, items):
+        self.extend(items)
+        return self
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._changed()
+        return item
+
+    def remove(self, item):
+        super().remove(item)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+class TrackedModel(BaseModel):
+    """
+    Base for models saved by Storage: assigning a field marks the sections it is persisted in.
+    tracked_section applies to every field unless tracked_fields overrides it.
+    """
+    tracked_section: ClassVar[Tuple[str, ...]] = ()
+    tracked_fields: ClassVar[Dict[str, Tuple[str, ...]]] = {}
+    _tracker: Optional[ChangeTracker] = PrivateAttr(default=None)
+
+    @classmethod
+    def sections_for(cls, field: str) -> Tuple[str, ...]:
+        return cls.tracked_fields.get(field, cls.tracked_section)
+
+    def bind_tracker(self, tracker: ChangeTracker):
+        self._tracker = tracker
+        for name in type(self).model_fields:
+            value = self.__dict__.get(name)
+            if isinstance(value, list):
+                self.__dict__[name] = TrackedList(value, tracker, self.sections_for(name))
+
+    def __setattr__(self, name: str, value: Any):
+        tracker = self._tracker if name in type(self).model_fields else None
+        if tracker is not None and isinstance(value, list):
+            value = TrackedList(value, tracker, self.sections_for(name))
+        previous = self.__dict__.get(name) if tracker is not None else None
+        super().__setattr__(name, value)
+        # Forms re-assign every field on submit; only real changes make a section dirty
+        if tracker is not None and self.__dict__.get(name) != previous:
+            tracker.mark(self.sections_for(name))
+
+class VersionedRow(TrackedModel):
+    """
+    A model stored as one row of a versioned sheet; remembers the row's Version and
+    Updated_At so a save can tell whether someone else changed the row meanwhile.
+    """
+    _version: int = PrivateAttr(default=0)
+    _updated_at: str = PrivateAttr(default="")
+
+    @property
+    def row_version(self) -> int:
+        return self._version
+
+    @property
+    def row_updated_at(self) -> str:
+        return self._updated_at
+
+    def row_meta(self) -> Tuple[int, str]:
+        # One dict lookup instead of two trips through pydantic's __getattr__ (hot in bulk exports)
+        private = self.__pydantic_private__
+        return private["_version"], private["_updated_at"]
+
+    def set_row_meta(self, version: int, updated_at: str):
+        self._version = version
+        self._updated_at = updated_at
+
+class Metric(VersionedRow):
+    tracked_section: ClassVar[Tuple[str, ...]] = ("metrics",)
+
     id: str
     title: str
     type: MetricType
@@ -30,7 +190,8 @@ class Metric(BaseModel):
     unit: str = ""
     last_updated: date = Field(default_factory=date.today)
 
-class Tactic(BaseModel):
+class Tactic(VersionedRow):
+    tracked_section: ClassVar[Tuple[str, ...]] = ("tactics",)
     id: str
     title: str
     due_week: int = Field(..., ge=1, le=13)
@@ -38,25 +199,177 @@ class Tactic(BaseModel):
     block_type: BlockType = BlockType.NONE
     is_completed: bool = False
 
-class Goal(BaseModel):
+class Goal(TrackedModel):
+    # Goal titles are stored on the tactic rows, goal ids on both tactic and metric rows
+    tracked_section: ClassVar[Tuple[str, ...]] = ("tactics",)
+    tracked_fields: ClassVar[Dict[str, Tuple[str, ...]]] = {"id": ("tactics", "metrics"), "metrics": ("metrics",)}
     id: str
     title: str
     tactics: List[Tactic] = []
     metrics: List[Metric] = []
 
-class WeeklyReview(BaseModel):
+class WeeklyReview(VersionedRow):
+    tracked_section: ClassVar[Tuple[str, ...]] = ("reviews",)
     week_num: int
     score: float
     wins: str = ""
     lessons: str = ""
     date_submitted: date = Field(default_factory=date.today)
 
-class StrategicBlock(BaseModel):
+class StrategicBlock(TrackedModel):
+    tracked_section: ClassVar[Tuple[str, ...]] = ("settings",)
     day_of_week: str # "Monday", "Tuesday", etc.
     start_time: str # "09:00"
     end_time: str # "12:00"
 
-class Cycle(BaseModel):
+class CycleInfo(BaseModel):
+    """
+    Registry entry for one cycle (team/tenant) stored in the spreadsheet.
+    """
+    id: str
+    owner: str = ""
+    start_date: date = Field(default_factory=date.today)
+    status: CycleStatus = CycleStatus.ACTIVE
+
+class ScoreCount(BaseModel):
+    total: int = 0
+    completed: int = 0
+
+    @property
+    def progress(self) -> float:
+        return self.completed / self.total if self.total > 0 else 0.0
+
+    @property
+    def score(self) -> float:
+        # Same rounding as logic.calculate_weekly_execution_score
+        return round(self.progress * 100.0, 1)
+
+class ScoreRollup(BaseModel):
+    """
+    Materialized completion counts per week, per goal, per goal and week, and for the whole cycle.
+    Kept up to date incrementally as tactics change, so views never rescan tactics.
+    """
+    weeks: Dict[int, ScoreCount] = {}
+    goals: Dict[str, ScoreCount] = {}
+    goal_weeks: Dict[str, Dict[int, ScoreCount]] = {}
+    cycle: ScoreCount = Field(default_factory=ScoreCount)
+
+    @classmethod
+    def from_goals(cls, goals: List[Goal]) -> "ScoreRollup":
+        rollup = cls()
+        for goal in goals:
+            rollup.goals.setdefault(goal.id, ScoreCount())
+            for t in goal.tactics:
+                rollup.add(goal.id, t)
+        return rollup
+
+    def add(self, goal_id: str, tactic: Tactic, sign: int = 1):
+        done = sign if tactic.is_completed else 0
+        goal_week = self.goal_weeks.setdefault(goal_id, {}).setdefault(tactic.due_week, ScoreCount())
+        for count in (self.weeks.setdefault(tactic.due_week, ScoreCount()), self.goals.setdefault(goal_id, ScoreCount()), goal_week, self.cycle):
+            count.total += sign
+            count.completed += done
+
+    def remove(self, goal_id: str, tactic: Tactic):
+        self.add(goal_id, tactic, sign=-1)
+
+    def remove_goal(self, goal: Goal):
+        for t in goal.tactics:
+            self.remove(goal.id, t)
+        self.goals.pop(goal.id, None)
+        self.goal_weeks.pop(goal.id, None)
+
+    @contextmanager
+    def tracking(self, goal_id: str, tactic: Tactic):
+        """
+        Wrap an in-place edit of a tactic (status, week...) to move its contribution.
+        """
+        self.remove(goal_id, tactic)
+        try:
+            yield tactic
+        finally:
+            self.add(goal_id, tactic)
+
+    def week(self, week_num: int) -> ScoreCount:
+        return self.weeks.get(week_num) or ScoreCount()
+
+    def goal(self, goal_id: str, week_num: Optional[int] = None) -> ScoreCount:
+        """
+        Counts of one goal, optionally restricted to the tactics due in week_num.
+        """
+        if week_num is None:
+            return self.goals.get(goal_id) or ScoreCount()
+        return self.goal_weeks.get(goal_id, {}).get(week_num) or ScoreCount()
+
+CYCLE_WEEKS = 12
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+class CycleCalendar:
+    """
+    Week boundaries, weekday -> strategic block mapping and date -> week lookups for one cycle.
+    Built once per (start_date, blocks) by Cycle.calendar; every lookup is constant time.
+    """
+    __slots__ = ("start_date", "end_date", "week_starts", "_blocks_by_weekday")
+
+    def __init__(self, start_date: date, blocks: List[StrategicBlock]):
+        self.start_date = start_date
+        self.end_date = start_date + timedelta(weeks=CYCLE_WEEKS)
+        # week_starts[n - 1] is the first day of week n (week 13 is the review week)
+        self.week_starts = [start_date + timedelta(weeks=w) for w in range(CYCLE_WEEKS + 1)]
+        by_weekday: List[List[StrategicBlock]] = [[] for _ in WEEKDAYS]
+        for sb in blocks:
+            if sb.day_of_week in WEEKDAYS:
+                by_weekday[WEEKDAYS.index(sb.day_of_week)].append(sb)
+        self._blocks_by_weekday = [sorted(b, key=lambda sb: sb.start_time) for b in by_weekday]
+
+    def week_of(self, day: date) -> int:
+        """
+        Cycle week containing the date, clamped to 1..13.
+        """
+        return max(1, min(CYCLE_WEEKS + 1, (day - self.start_date).days // 7 + 1))
+
+    def current_week(self, today: Optional[date] = None) -> int:
+        return self.week_of(today or date.today())
+
+    def week_range(self, week_num: int) -> Tuple[date, date]:
+        """
+        First and last day of a week.
+        """
+        start = self.week_starts[week_num - 1]
+        return start, start + timedelta(days=6)
+
+    def week_type(self, week_num: int) -> str:
+        if week_num == CYCLE_WEEKS + 1:
+            return "Review_and_Celebrate"
+        return "Execution"
+
+    @staticmethod
+    def weekday_name(day: date) -> str:
+        return WEEKDAYS[day.weekday()]
+
+    def blocks_on(self, day: date) -> List[StrategicBlock]:
+        return self._blocks_by_weekday[day.weekday()]
+
+    def block_at(self, day: date, at: time) -> Optional[StrategicBlock]:
+        """
+        The strategic block covering the given time of day, if any.
+        """
+        hhmm = f"{at.hour:02d}:{at.minute:02d}"
+        for sb in self._blocks_by_weekday[day.weekday()]:
+            if sb.start_time <= hhmm < sb.end_time:
+                return sb
+        return None
+
+class Cycle(TrackedModel):
+    # id and start_date live in the cycle registry, which save_cycle does not write
+    tracked_fields: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "goals": ("tactics", "metrics"),
+        "reviews": ("reviews",),
+        "strategic_blocks": ("settings",),
+        "vision_3_year": ("vision",),
+        "vision_1_year": ("vision",),
+        "scores": ("scores",),
+    }
     id: str
     start_date: date
     goals: List[Goal] = []
@@ -64,12 +377,99 @@ class Cycle(BaseModel):
     strategic_blocks: List[StrategicBlock] = []
     vision_3_year: str = ""
     vision_1_year: str = ""
+    scores: ScoreRollup = Field(default_factory=ScoreRollup)
+    # Digest of what was last read from / written to each worksheet, so unchanged ones can be skipped
+    _persisted: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _calendar: Optional[CycleCalendar] = PrivateAttr(default=None)
+    _calendar_key: Optional[tuple] = PrivateAttr(default=None)
+    # Values derived from the cycle as (tracker version, key -> value). The pair is replaced
+    # as a whole, so a value stored from another thread never lands under a newer version
+    _memo: Tuple[int, Dict[Any, Any]] = PrivateAttr(default_factory=lambda: (-1, {}))
+    # Rows of each section as last loaded or saved (key -> row), the base of save-time merges
+    _base_rows: Dict[str, Dict[str, dict]] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any):
+        # The cycle owns the tracker; every nested model and list reports to it
+        self.bind_tracker(ChangeTracker())
+    
+    def dirty_sections(self) -> Set[str]:
+        return set(self._tracker.dirty)
+    
+    def mark_clean(self, sections: Optional[Set[str]] = None):
+        if sections is None:
+            self._tracker.dirty.clear()
+        else:
+            self._tracker.dirty.difference_update(sections)
+    
+    def mark_dirty(self, sections: Set[str]):
+        self._tracker.mark(tuple(sections))
+    
+    def memo(self, key: Any, compute):
+        """
+        Returns compute() memoized under key until the next tracked change.
+        """
+        version = self._tracker.version
+        memo_version, entries = self._memo
+        if memo_version != version:
+            entries = {}
+            self._memo = (version, entries)
+        if key not in entries:
+            entries[key] = compute()
+        return entries[key]
+    
+    def memo_version(self) -> int:
+        return self._tracker.version
+    
+    def memo_put(self, key: Any, value: Any, version: int) -> bool:
+        """
+        Stores a value computed (e.g. on another thread) from the cycle as of `version`,
+        unless the cycle changed since. Returns whether it was stored.
+        """
+        if self._tracker.version != version:
+            return False
+        memo_version, entries = self._memo
+        if memo_version != version:
+            entries = {}
+            self._memo = (version, entries)
+        entries.setdefault(key, value)
+        return True
+    
+    def memo_revision(self, compute) -> str:
+        return self.memo("revision", compute)
+    
+    def persisted_digest(self, unit: str) -> Optional[str]:
+        return self._persisted.get(unit)
+    
+    def mark_persisted(self, unit: str, digest: Optional[str]):
+        if digest is None:
+            self._persisted.pop(unit, None)
+        else:
+            self._persisted[unit] = digest
+    
+    def base_rows(self, section: str) -> Dict[str, dict]:
+        return self._base_rows.get(section, {})
+    
+    def set_base_rows(self, section: str, rows: Dict[str, dict]):
+        self._base_rows[section] = rows
+    
+    def rebuild_scores(self) -> ScoreRollup:
+        self.scores = ScoreRollup.from_goals(self.goals)
+        return self.scores
+    
+    @property
+    def calendar(self) -> CycleCalendar:
+        """
+        The cycle's calendar, rebuilt only when start_date or the strategic blocks change.
+        """
+        key = (self.start_date, tuple((sb.day_of_week, sb.start_time, sb.end_time) for sb in self.strategic_blocks))
+        if self._calendar is None or key != self._calendar_key:
+            self._calendar = CycleCalendar(self.start_date, self.strategic_blocks)
+            self._calendar_key = key
+        return self._calendar
     
     @property
     def end_date(self) -> date:
-        return self.start_date + timedelta(weeks=12)
+        return self.calendar.end_date
     
     def get_week_type(self, week_num: int) -> str:
-        if week_num == 13:
-            return "Review_and_Celebrate"
-        return "Execution"
+        return self.calendar.week_type(week_num)
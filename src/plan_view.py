@@ -0,0 +1,41 @@
+"""
+Week filtering and pagination for the Plan and Dashboard pages.
+
+Only the visible page of tactics is turned into widgets, so the widget tree
+and the payload sent on every rerun stay the same size however large the
+plan grows. Counts shown for hidden tactics come from the score rollup.
+"""
+import math
+import os
+from typing import List, Optional, Tuple
+
+from src.models import Tactic
+
+TACTICS_PER_PAGE = int(os.environ.get("TWELVE_WEEK_TACTICS_PER_PAGE", "20"))
+GOALS_PER_PAGE = int(os.environ.get("TWELVE_WEEK_GOALS_PER_PAGE", "5"))
+ALL_WEEKS = None
+WEEK_OPTIONS: List[Optional[int]] = [ALL_WEEKS] + list(range(1, 14))
+
+
+def week_label(week: Optional[int]) -> str:
+    return "All weeks" if week is ALL_WEEKS else f"Week {week}"
+
+
+def page_bounds(total: int, page: int, page_size: int) -> Tuple[int, int, int]:
+    """
+    Returns (start, end, page_count) for a 1-based page, clamped to the pages that exist.
+    """
+    page_count = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), page_count)
+    start = (page - 1) * page_size
+    return start, min(total, start + page_size), page_count
+
+
+def tactic_positions(tactics: List[Tactic], week: Optional[int]) -> List[int]:
+    """
+    Indexes (into the goal's tactic list) of the tactics shown for a week filter.
+    Indexes rather than tactics, so edits and deletes address the real list.
+    """
+    if week is ALL_WEEKS:
+        return list(range(len(tactics)))
+    return [j for j, t in enumerate(tactics) if t.due_week == week]
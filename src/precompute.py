@@ -0,0 +1,105 @@
+"""
+Week plans and the WAM draft for the Execute and Review pages.
+
+A plan holds the positions of the tactics due in one week and their
+completion counts. Plans are memoized on the cycle until its change tracker
+records the next edit, so reruns without edits reuse them.
+
+After each edit (and when the week rolls over) schedule() hands the cycle to
+one background thread, which builds the plans of the current and next week
+and the default WAM draft, and stores them on the cycle only if it has not
+changed since. Nothing is hashed or copied on the rerun thread; scheduling
+costs one memo lookup, and a page that renders before the worker is done
+builds the value itself.
+"""
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from src.models import Cycle, Goal, ScoreCount, Tactic
+from src.reports import REPORT_FORMATS, render_wam_report, stream_wam_report
+
+LAST_WEEK = 13
+# Format of the WAM draft prepared in the background (the Review page's default)
+DRAFT_FORMAT = REPORT_FORMATS[0]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+class WeekPlan(BaseModel):
+    week: int
+    positions: List[Tuple[int, int]]  # (goal index, tactic index) of the tactics due, in plan order
+    counts: ScoreCount
+
+    def tactics(self, cycle: Cycle) -> List[Tuple[Goal, Tactic]]:
+        """
+        Resolves the positions against the cycle the plan was built from.
+        """
+        return [(cycle.goals[g], cycle.goals[g].tactics[t]) for g, t in self.positions]
+
+
+def build_week_plan(cycle: Cycle, week: int) -> WeekPlan:
+    positions = []
+    counts = ScoreCount()
+    for g, goal in enumerate(cycle.goals):
+        for t, tactic in enumerate(goal.tactics):
+            if tactic.due_week == week:
+                positions.append((g, t))
+                counts.total += 1
+                counts.completed += int(tactic.is_completed)
+    return WeekPlan(week=week, positions=positions, counts=counts)
+
+
+def week_plan(cycle: Cycle, week: int) -> WeekPlan:
+    """
+    The plan of a week, rebuilt only after the cycle changed.
+    """
+    return cycle.memo(("week_plan", week), lambda: build_week_plan(cycle, week))
+
+
+def wam_draft(cycle: Cycle, weeks: Iterable[int], fmt: str = DRAFT_FORMAT) -> str:
+    """
+    The WAM report for the given weeks, taken from the background worker when it is ready.
+    """
+    weeks = tuple(weeks)
+    return cycle.memo(("wam", weeks, fmt), lambda: render_wam_report(cycle, weeks, fmt))
+
+
+def schedule(cycle: Cycle, week: int):
+    """
+    Queues the precompute of `week` and the week after, once per cycle version.
+    """
+    version = cycle.memo_version()
+    cycle.memo(("precompute", week), lambda: _submit(cycle, week, version))
+
+
+def _submit(cycle: Cycle, week: int, version: int) -> bool:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="precompute")
+    _executor.submit(_precompute, cycle, week, version)
+    return True
+
+
+def _precompute(cycle: Cycle, week: int, version: int):
+    """
+    Runs on the worker thread while the session may keep editing the cycle. Anything built
+    from a cycle that changed meanwhile is discarded by memo_put, as is a build that failed
+    because the plan changed under it.
+    """
+    try:
+        for w in range(week, min(week + 1, LAST_WEEK) + 1):
+            if cycle.memo_version() != version:
+                return
+            cycle.memo_put(("week_plan", w), build_week_plan(cycle, w), version)
+        weeks = (week,)
+        draft = "".join(stream_wam_report(cycle, weeks, DRAFT_FORMAT))
+        cycle.memo_put(("wam", weeks, DRAFT_FORMAT), draft, version)
+    except Exception as e:
+        if cycle.memo_version() == version:
+            print(f"Precompute of week {week} failed: {e}", file=sys.stderr)
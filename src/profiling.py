@@ -0,0 +1,118 @@
+"""
+Opt-in per-rerun profiling of the Streamlit app.
+
+Enable with TWELVE_WEEK_PROFILE=1 or by opening the app with ?profile=1.
+Each rerun is executed under cProfile and written to PROFILE_DIR as
+"<timestamp>_<page>.prof"; the oldest files are deleted once the directory
+exceeds MAX_PROFILES files or MAX_PROFILE_BYTES in total.
+Inspect them on the debug page or with `python -m pstats <file>`.
+"""
+import cProfile
+import os
+import pstats
+import runpy
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+PROFILE_ENV = "TWELVE_WEEK_PROFILE"
+PROFILE_DIR = os.environ.get("TWELVE_WEEK_PROFILE_DIR", "profiles")
+MAX_PROFILES = int(os.environ.get("TWELVE_WEEK_PROFILE_MAX_FILES", "100"))
+MAX_PROFILE_BYTES = int(os.environ.get("TWELVE_WEEK_PROFILE_MAX_MB", "50")) * 1024 * 1024
+
+# Set while a rerun is executing under the profiler, so the nested run skips the hook
+_active = threading.local()
+
+
+def profiling_enabled(query_params=None) -> bool:
+    if os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes"):
+        return True
+    return query_params is not None and query_params.get("profile") == "1"
+
+
+def run_profiled(script_path: str, page_name: Callable[[], str]) -> bool:
+    """
+    Re-executes the script under cProfile and records the result.
+    Returns False when called from inside the profiled run (the caller should carry on normally),
+    True once the profiled run has finished (the caller should stop).
+    Streamlit's rerun/stop exceptions propagate after the profile is written.
+    """
+    if getattr(_active, "running", False):
+        return False
+    _active.running = True
+    profiler = cProfile.Profile()
+    started = time.time()
+    try:
+        profiler.enable()
+        runpy.run_path(script_path, run_name="__main__")
+    finally:
+        profiler.disable()
+        _active.running = False
+        try:
+            save_profile(profiler, page_name(), started)
+        except OSError as e:
+            print(f"Error writing profile: {e}", file=sys.stderr)
+    return True
+
+
+def save_profile(profiler: cProfile.Profile, page: str, started: float) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(started)) + f"-{int(started * 1000) % 1000:03d}"
+    safe_page = "".join(c if c.isalnum() else "_" for c in page) or "unknown"
+    path = os.path.join(PROFILE_DIR, f"{stamp}_{safe_page}.prof")
+    profiler.dump_stats(path)
+    _rotate()
+    return path
+
+
+def _rotate():
+    """
+    Deletes the oldest profiles until both caps are respected.
+    """
+    files = list_profiles()
+    total = sum(f["bytes"] for f in files)
+    while files and (len(files) > MAX_PROFILES or total > MAX_PROFILE_BYTES):
+        oldest = files.pop()
+        total -= oldest["bytes"]
+        try:
+            os.remove(oldest["path"])
+        except OSError:
+            pass
+
+
+def list_profiles() -> List[Dict]:
+    """
+    Newest first: [{"path", "name", "page", "bytes", "mtime"}, ...]
+    """
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    profiles = []
+    for name in os.listdir(PROFILE_DIR):
+        if not name.endswith(".prof"):
+            continue
+        path = os.path.join(PROFILE_DIR, name)
+        stat = os.stat(path)
+        page = name[:-len(".prof")].split("_", 1)[-1]
+        profiles.append({"path": path, "name": name, "page": page, "bytes": stat.st_size, "mtime": stat.st_mtime})
+    profiles.sort(key=lambda p: p["mtime"], reverse=True)
+    return profiles
+
+
+def top_hotspots(paths: List[str], limit: int = 25, sort: str = "cumulative") -> List[Dict]:
+    """
+    Aggregates one or more profiles and returns the most expensive functions.
+    """
+    if not paths:
+        return []
+    stats = pstats.Stats(*paths)
+    rows = []
+    for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            "function": f"{func} ({os.path.basename(filename)}:{line})",
+            "calls": ncalls,
+            "tottime_ms": round(tottime * 1000, 2),
+            "cumtime_ms": round(cumtime * 1000, 2),
+        })
+    rows.sort(key=lambda r: r["cumtime_ms" if sort == "cumulative" else "tottime_ms"], reverse=True)
+    return rows[:limit]
@@ -0,0 +1,189 @@
+import csv
+import io
+import json
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Tuple
+from src.models import Cycle
+from src.logic import cycle_revision, tactics_by_week
+from src.scoring import active_engine
+
+REPORT_FORMATS = ["Markdown", "CSV", "JSON"]
+
+WAM_FIELDS = ["Week", "Score", "Wins", "Struggles", "Next_Week", "Commitments"]
+SUMMARY_FIELDS = ["Cycle", "Start_Date", "Goals", "Tactics", "Completed", "Progress", "Weeks_Reviewed", "Average_Score"]
+
+# Rendered reports keyed by (kind, data revision, weeks, format)
+_CACHE_SIZE = 32
+_report_cache: "OrderedDict[tuple, str]" = OrderedDict()
+# Streamlit runs each session's script on its own thread
+_report_lock = threading.Lock()
+
+
+# --- Rows ---
+
+def wam_rows(cycle: Cycle, weeks: Iterable[int]) -> Iterator[dict]:
+    """
+    Yields one WAM record per requested week.
+    Reviewed weeks use their submitted score; other weeks are scored live under the active scoring rules.
+    """
+    by_week = tactics_by_week(cycle)
+    reviews = {r.week_num: r for r in cycle.reviews}
+    live_scores = active_engine().score_cycle(cycle).weeks
+
+    for week in weeks:
+        review = reviews.get(week)
+        score = review.score if review else live_scores.get(week, 0.0)
+        yield {
+            "Week": week,
+            "Score": score,
+            "Wins": review.wins if review and review.wins else "No wins recorded.",
+            "Struggles": review.lessons if review and review.lessons else "No struggles recorded.",
+            "Next_Week": week + 1,
+            "Commitments": [t.title for t in by_week.get(week + 1, [])],
+        }
+
+
+def cycle_summary_rows(cycles: Iterable[Tuple[str, Cycle]]) -> Iterator[dict]:
+    """
+    Yields one summary record per (label, cycle) pair.
+    Cycles are consumed lazily, so archives can be loaded one at a time.
+    """
+    for label, cycle in cycles:
+        total = sum(len(g.tactics) for g in cycle.goals)
+        completed = sum(1 for g in cycle.goals for t in g.tactics if t.is_completed)
+        avg = round(sum(r.score for r in cycle.reviews) / len(cycle.reviews), 1) if cycle.reviews else 0.0
+        yield {
+            "Cycle": label,
+            "Start_Date": cycle.start_date.isoformat(),
+            "Goals": len(cycle.goals),
+            "Tactics": total,
+            "Completed": completed,
+            "Progress": round(completed / total * 100.0, 1) if total else 0.0,
+            "Weeks_Reviewed": len(cycle.reviews),
+            "Average_Score": avg,
+        }
+
+
+# --- Renderers ---
+
+def _markdown_wam(row: dict) -> str:
+    commitments = "\n".join(f"- {c}" for c in row["Commitments"]) if row["Commitments"] else "No tactics scheduled."
+    return f"""
+**12-Week Year WAM Report**
+**Week {row['Week']}**
+
+**Execution Score:** {row['Score']}%
+
+**Top Wins:**
+{row['Wins']}
+
+**Key Struggles:**
+{row['Struggles']}
+
+**Commitments for Week {row['Next_Week']}:**
+{commitments}
+"""
+
+
+def _markdown_summary(rows: Iterator[dict]) -> Iterator[str]:
+    yield "| " + " | ".join(SUMMARY_FIELDS) + " |\n"
+    yield "|" + "---|" * len(SUMMARY_FIELDS) + "\n"
+    for row in rows:
+        yield "| " + " | ".join(str(row[f]) for f in SUMMARY_FIELDS) + " |\n"
+
+
+def _csv_lines(rows: Iterator[dict], fields: List[str]) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow(["; ".join(row[f]) if isinstance(row[f], list) else row[f] for f in fields])
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    # Header only (no rows)
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def _json_array(rows: Iterator[dict]) -> Iterator[str]:
+    yield "["
+    for i, row in enumerate(rows):
+        yield ("," if i else "") + json.dumps(row)
+    yield "]"
+
+
+def _stream(rows: Iterator[dict], fmt: str, fields: List[str], markdown) -> Iterator[str]:
+    if fmt == "Markdown":
+        return markdown(rows)
+    if fmt == "CSV":
+        return _csv_lines(rows, fields)
+    if fmt == "JSON":
+        return _json_array(rows)
+    raise ValueError(f"Unknown report format: {fmt}")
+
+
+def stream_wam_report(cycle: Cycle, weeks: Iterable[int], fmt: str = "Markdown") -> Iterator[str]:
+    """
+    Streams a WAM report for the given weeks as text chunks.
+    """
+    return _stream(wam_rows(cycle, weeks), fmt, WAM_FIELDS, lambda rows: (_markdown_wam(r) for r in rows))
+
+
+def stream_cycle_summary(cycles: Iterable[Tuple[str, Cycle]], fmt: str = "Markdown") -> Iterator[str]:
+    """
+    Streams a cycle-summary report as text chunks.
+    """
+    return _stream(cycle_summary_rows(cycles), fmt, SUMMARY_FIELDS, _markdown_summary)
+
+
+def write_report(chunks: Iterator[str], fp) -> int:
+    """
+    Writes streamed chunks to a file object without buffering the whole report.
+    Returns the number of characters written.
+    """
+    written = 0
+    for chunk in chunks:
+        written += fp.write(chunk)
+    return written
+
+
+# --- Cached rendering ---
+
+def _cached(key: tuple, build) -> str:
+    with _report_lock:
+        if key in _report_cache:
+            _report_cache.move_to_end(key)
+            return _report_cache[key]
+    text = "".join(build())
+    with _report_lock:
+        _report_cache[key] = text
+        if len(_report_cache) > _CACHE_SIZE:
+            _report_cache.popitem(last=False)
+    return text
+
+
+def render_wam_report(cycle: Cycle, weeks: Iterable[int], fmt: str = "Markdown", revision: Optional[str] = None) -> str:
+    """
+    Renders a WAM report, reusing the cached text while the cycle data is unchanged.
+    """
+    weeks = tuple(weeks)
+    key = ("wam", cycle.id, revision or cycle_revision(cycle), weeks, fmt)
+    return _cached(key, lambda: stream_wam_report(cycle, weeks, fmt))
+
+
+def render_cycle_summary(storage, cycle: Cycle, fmt: str = "Markdown") -> str:
+    """
+    Renders the summary of all archived cycles plus the live one.
+    Archives never change once written, so their labels form the revision.
+    """
+    labels = tuple(storage.list_archived_cycles())
+    key = ("summary", cycle.id, labels, cycle_revision(cycle), fmt)
+
+    def cycles():
+        for label in labels:
+            yield label, storage.get_archived_cycle(label)
+        yield cycle.id, cycle
+
+    return _cached(key, lambda: stream_cycle_summary(cycles(), fmt))
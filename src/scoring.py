@@ -0,0 +1,203 @@
+"""
+Configurable execution scoring.
+
+ScoringRules is the team's configuration: per-tactic weights, statuses that
+do not count (e.g. Deferred, Cancelled) and multipliers per block type. It is
+compiled once into a ScoringEngine holding a (status x block type) weight
+table; scoring then flattens every tactic of one or many cycles into arrays
+and sums weighted totals per week, goal and cycle in a single numpy pass.
+
+The default rules weigh every tactic 1, so they reproduce
+logic.calculate_weekly_execution_score and the materialized score rollup.
+Rules are read from the TOML file named by $TWELVE_WEEK_SCORING_RULES, e.g.
+
+    excluded_statuses = ["Deferred", "Cancelled"]
+    threshold = 85.0
+
+    [block_multipliers]
+    Strategic = 2.0
+
+    [tactic_weights]
+    t100_0 = 3.0
+    "Weekly client call" = 2.0
+
+Tactic weights are keyed by tactic id or, failing that, by tactic title. Ids
+never change once saved, but a tactic deleted and added again gets a new one
+(and ids from older builds could be reused by a later tactic), so a title is
+the better key for recurring tactics; it stops matching if the tactic is
+renamed, and applies to every tactic with that title.
+"""
+import os
+import threading
+import tomllib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.logic import SCORE_THRESHOLD, check_score_threshold, cycle_revision
+from src.models import BlockType, Cycle, TacticStatus
+
+RULES_ENV = "TWELVE_WEEK_SCORING_RULES"
+# Week bins per cycle (due weeks are 1..13)
+WEEK_SLOTS = 14
+
+_STATUSES = list(TacticStatus)
+_BLOCKS = list(BlockType)
+_STATUS_CODES = {s: i for i, s in enumerate(_STATUSES)}
+_BLOCK_CODES = {b: i for i, b in enumerate(_BLOCKS)}
+
+_CACHE_SIZE = 32
+_engines: Dict[str, "ScoringEngine"] = {}
+_active: Optional["ScoringEngine"] = None
+_lock = threading.Lock()
+
+
+class ScoringRules(BaseModel):
+    tactic_weights: Dict[str, float] = {}            # tactic id or title -> weight (others weigh 1)
+    excluded_statuses: List[TacticStatus] = []       # tactics that neither count nor score
+    block_multipliers: Dict[BlockType, float] = {}   # applied on top of the tactic weight
+    threshold: float = SCORE_THRESHOLD
+
+    def is_default(self) -> bool:
+        return self == ScoringRules()
+
+
+class ScoreCard(BaseModel):
+    cycle_id: str
+    weeks: Dict[int, float]     # score per week that has weighted tactics
+    goals: Dict[str, float]
+    cycle: float
+    below_threshold: List[int]  # weeks scoring under the rules' threshold
+
+
+class ScoringEngine:
+    """
+    ScoringRules compiled into lookup tables. Build with compile_rules() to share engines.
+    """
+    __slots__ = ("rules", "_table", "_tactic_weights", "_cache")
+
+    def __init__(self, rules: ScoringRules):
+        self.rules = rules
+        table = np.ones((len(_STATUSES), len(_BLOCKS)))
+        for status in rules.excluded_statuses:
+            table[_STATUS_CODES[status], :] = 0.0
+        for block, multiplier in rules.block_multipliers.items():
+            table[:, _BLOCK_CODES[block]] *= multiplier
+        self._table = table
+        self._tactic_weights = dict(rules.tactic_weights)
+        self._cache: "OrderedDict[tuple, ScoreCard]" = OrderedDict()
+
+    def score_cycles(self, cycles: Iterable[Cycle]) -> List[ScoreCard]:
+        """
+        Scores several cycles (e.g. every archive) in one pass over all their tactics.
+        """
+        cycles = list(cycles)
+        cycle_idx, goal_idx, weeks, statuses, blocks, done, weights = [], [], [], [], [], [], []
+        goal_ids: List[str] = []
+        goal_cycle: List[int] = []
+        tactic_weights = self._tactic_weights
+        for c, cycle in enumerate(cycles):
+            for goal in cycle.goals:
+                g = len(goal_ids)
+                goal_ids.append(goal.id)
+                goal_cycle.append(c)
+                for t in goal.tactics:
+                    cycle_idx.append(c)
+                    goal_idx.append(g)
+                    weeks.append(t.due_week)
+                    statuses.append(_STATUS_CODES[t.status])
+                    blocks.append(_BLOCK_CODES[t.block_type])
+                    done.append(t.is_completed)
+                    weights.append(tactic_weights.get(t.id, tactic_weights.get(t.title, 1.0)))
+
+        cycle_idx = np.array(cycle_idx, dtype=np.intp)
+        goal_idx = np.array(goal_idx, dtype=np.intp)
+        week_bins = cycle_idx * WEEK_SLOTS + np.array(weeks, dtype=np.intp)
+        weight = self._table[np.array(statuses, dtype=np.intp), np.array(blocks, dtype=np.intp)] * np.array(weights, dtype=float)
+        earned = weight * np.array(done, dtype=bool)
+
+        n = len(cycles)
+        week_total = np.bincount(week_bins, weight, minlength=n * WEEK_SLOTS).reshape(n, WEEK_SLOTS)
+        week_done = np.bincount(week_bins, earned, minlength=n * WEEK_SLOTS).reshape(n, WEEK_SLOTS)
+        goal_total = np.bincount(goal_idx, weight, minlength=len(goal_ids))
+        goal_done = np.bincount(goal_idx, earned, minlength=len(goal_ids))
+        cycle_total = np.bincount(cycle_idx, weight, minlength=n)
+        cycle_done = np.bincount(cycle_idx, earned, minlength=n)
+
+        cards = []
+        for c, cycle in enumerate(cycles):
+            week_scores = {w: _score(week_done[c, w], week_total[c, w]) for w in range(1, WEEK_SLOTS) if week_total[c, w] > 0}
+            cards.append(ScoreCard(
+                cycle_id=cycle.id,
+                weeks=week_scores,
+                goals={goal_ids[g]: _score(goal_done[g], goal_total[g]) for g in range(len(goal_ids)) if goal_cycle[g] == c},
+                cycle=_score(cycle_done[c], cycle_total[c]),
+                below_threshold=[w for w, s in week_scores.items() if check_score_threshold(s, self.rules.threshold)],
+            ))
+        return cards
+
+    def score_cycle(self, cycle: Cycle) -> ScoreCard:
+        """
+        Scores one cycle, cached per cycle revision.
+        """
+        key = (cycle.id, cycle_revision(cycle))
+        with _lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        card = self.score_cycles([cycle])[0]
+        with _lock:
+            self._cache[key] = card
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return card
+
+
+def _score(earned: float, total: float) -> float:
+    # Same rounding as logic.calculate_weekly_execution_score
+    return round(float(earned) / float(total) * 100.0, 1) if total > 0 else 0.0
+
+
+def compile_rules(rules: ScoringRules) -> ScoringEngine:
+    """
+    Returns the engine for a configuration, compiling it on first use.
+    """
+    key = rules.model_dump_json()
+    with _lock:
+        if key not in _engines:
+            _engines[key] = ScoringEngine(rules)
+        return _engines[key]
+
+
+def load_rules(path: Optional[str] = None) -> ScoringRules:
+    """
+    Reads rules from a TOML file (default $TWELVE_WEEK_SCORING_RULES); the defaults without one.
+    """
+    path = path or os.environ.get(RULES_ENV)
+    if not path:
+        return ScoringRules()
+    with open(path, "rb") as f:
+        return ScoringRules.model_validate(tomllib.load(f))
+
+
+def active_engine() -> ScoringEngine:
+    """
+    The engine for the configured rules, loaded once per process.
+    """
+    global _active
+    if _active is None:
+        _active = compile_rules(load_rules())
+    return _active
+
+
+def week_score(cycle: Cycle, week: int) -> float:
+    """
+    Execution score of a week under the active rules. With the default rules this is read
+    from the materialized rollup, which holds the same numbers.
+    """
+    engine = active_engine()
+    if engine.rules.is_default():
+        return cycle.scores.week(week).score
+    return engine.score_cycle(cycle).weeks.get(week, 0.0)
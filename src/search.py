@@ -0,0 +1,347 @@
+"""
+Inverted-index search over tactics, goals, reviews and vision text of the live and archived cycles.
+
+Query syntax:
+    deep work            documents containing both terms (ranked with BM25)
+    "deep work"          exact phrase
+    launch*              any term starting with "launch"
+"""
+import base64
+import bisect
+import json
+import math
+import re
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+from pydantic import BaseModel
+from src.models import Cycle
+
+INDEX_FORMAT_VERSION = 2
+# Documents are spread over a fixed number of buckets (one sheet row each), so a save
+# rewrites only the rows of the buckets whose documents changed
+BUCKETS = 64
+# Google Sheets caps a cell at 50k characters; a bucket's data is split across cells of its row
+CHUNK_SIZE = 45000
+# Documents of each cycle section
+SECTION_KINDS = {
+    "tactics": ("Goal", "Tactic"),
+    "reviews": ("Review Wins", "Review Lessons"),
+    "vision": ("Vision",),
+}
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"([^"]+)"|(\S+)')
+
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def bucket_of(doc_id: str) -> int:
+    return zlib.crc32(doc_id.encode("utf-8")) % BUCKETS
+
+
+class SearchHit(BaseModel):
+    doc_id: str
+    cycle: str
+    kind: str
+    title: str
+    snippet: str
+    score: float
+
+
+class SearchIndex:
+    """
+    Positional inverted index. Documents are grouped by cycle label so a cycle
+    can be re-indexed or relabelled (on archive) without touching the others.
+    """
+    def __init__(self):
+        # doc_id -> (cycle label, kind, title, text)
+        self.docs: Dict[str, Tuple[str, str, str, str]] = {}
+        self.lengths: Dict[str, int] = {}
+        # term -> doc_id -> positions
+        self.postings: Dict[str, Dict[str, List[int]]] = {}
+        self.by_cycle: Dict[str, set] = {}
+        self.buckets: Dict[int, set] = {}
+        # Documents added, changed or removed since their buckets were last serialized
+        self.pending: set = set()
+        self._total_length = 0
+        self._sorted_terms: Optional[List[str]] = None
+
+    # --- Building ---
+
+    def add_document(self, doc_id: str, cycle: str, kind: str, title: str, text: str, track: bool = True) -> bool:
+        """
+        Adds or replaces a document. Returns False if it was already indexed unchanged.
+        Untracked changes (documents read from the sheet) are not marked pending.
+        """
+        if doc_id in self.docs:
+            if self.docs[doc_id] == (cycle, kind, title, text):
+                return False
+            self.remove_document(doc_id, track)
+        tokens = tokenize(text)
+        self.docs[doc_id] = (cycle, kind, title, text)
+        self.lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+        self.by_cycle.setdefault(cycle, set()).add(doc_id)
+        self.buckets.setdefault(bucket_of(doc_id), set()).add(doc_id)
+        if track:
+            self.pending.add(doc_id)
+        for pos, term in enumerate(tokens):
+            docs = self.postings.get(term)
+            if docs is None:
+                docs = self.postings[term] = {}
+                self._sorted_terms = None
+            docs.setdefault(doc_id, []).append(pos)
+        return True
+
+    def remove_document(self, doc_id: str, track: bool = True):
+        cycle, _, _, text = self.docs.pop(doc_id)
+        self._total_length -= self.lengths.pop(doc_id)
+        self.by_cycle.get(cycle, set()).discard(doc_id)
+        self.buckets.get(bucket_of(doc_id), set()).discard(doc_id)
+        if track:
+            self.pending.add(doc_id)
+        for term in set(tokenize(text)):
+            docs = self.postings.get(term)
+            if docs is None:
+                continue
+            docs.pop(doc_id, None)
+            if not docs:
+                del self.postings[term]
+                self._sorted_terms = None
+
+    def index_cycle(self, cycle: Cycle, label: Optional[str] = None, sections: Optional[Iterable[str]] = None) -> bool:
+        """
+        Brings the documents of one cycle up to date, only those of the given sections
+        (see SECTION_KINDS) if any. Unchanged documents are skipped.
+        Returns True if anything in the index changed.
+        """
+        label = label or cycle.id
+        kinds = None if sections is None else {k for s in sections for k in SECTION_KINDS.get(s, ())}
+        changed = False
+        seen = set()
+        for doc_id, kind, title, text in _cycle_documents(cycle, label, kinds):
+            changed |= self.add_document(doc_id, label, kind, title, text)
+            seen.add(doc_id)
+        for doc_id in list(self.by_cycle.get(label, set()) - seen):
+            if kinds is None or self.docs[doc_id][1] in kinds:
+                self.remove_document(doc_id)
+                changed = True
+        return changed
+
+    def relabel_cycle(self, old: str, new: str):
+        """
+        Moves the documents of a cycle under a new label (used when the live cycle is archived).
+        """
+        for doc_id in list(self.by_cycle.get(old, set())):
+            _, kind, title, text = self.docs[doc_id]
+            self.remove_document(doc_id)
+            self.add_document(new + doc_id[len(old):], new, kind, title, text)
+        self.by_cycle.pop(old, None)
+
+    # --- Querying ---
+
+    def _expand(self, term: str) -> List[str]:
+        if not term.endswith("*"):
+            return [term] if term in self.postings else []
+        prefix = term[:-1]
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        end = bisect.bisect_left(self._sorted_terms, prefix + "\uffff")
+        return self._sorted_terms[start:end]
+
+    def _bm25(self, term: str, doc_id: str) -> float:
+        docs = self.postings[term]
+        n = len(self.docs)
+        idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+        tf = len(docs[doc_id])
+        avgdl = self._total_length / n if n else 1.0
+        return idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * self.lengths[doc_id] / avgdl))
+
+    def _phrase_docs(self, terms: List[str]) -> Dict[str, float]:
+        if not terms or any(t not in self.postings for t in terms):
+            return {}
+        candidates = set(self.postings[terms[0]])
+        for t in terms[1:]:
+            candidates &= set(self.postings[t])
+        matches = {}
+        for doc_id in candidates:
+            following = [set(self.postings[t][doc_id]) for t in terms[1:]]
+            if any(all(p + i + 1 in positions for i, positions in enumerate(following)) for p in self.postings[terms[0]][doc_id]):
+                matches[doc_id] = sum(self._bm25(t, doc_id) for t in terms)
+        return matches
+
+    def search(self, query: str, limit: int = 20, cycle: Optional[str] = None) -> List[SearchHit]:
+        """
+        Every clause (term, prefix or phrase) must match; documents are ranked by summed BM25.
+        """
+        scores: Optional[Dict[str, float]] = None
+        for phrase, word in _QUERY_RE.findall(query.lower()):
+            if phrase:
+                clause = self._phrase_docs(tokenize(phrase))
+            else:
+                clause = {}
+                for raw in tokenize(word.rstrip("*")):
+                    for term in self._expand(raw + ("*" if word.endswith("*") else "")):
+                        for doc_id in self.postings[term]:
+                            clause[doc_id] = clause.get(doc_id, 0.0) + self._bm25(term, doc_id)
+            if scores is None:
+                scores = clause
+            else:
+                scores = {d: s + clause[d] for d, s in scores.items() if d in clause}
+            if not scores:
+                return []
+
+        ranked = sorted((scores or {}).items(), key=lambda kv: kv[1], reverse=True)
+        hits = []
+        for doc_id, score in ranked:
+            label, kind, title, text = self.docs[doc_id]
+            if cycle is not None and label != cycle:
+                continue
+            hits.append(SearchHit(doc_id=doc_id, cycle=label, kind=kind, title=title, snippet=text[:200], score=round(score, 3)))
+            if len(hits) >= limit:
+                break
+        return hits
+
+    # --- Persistence ---
+
+    def bucket_row(self, bucket: int) -> List[str]:
+        """
+        Serializes one bucket (its documents and their postings) as zlib-compressed base64 chunks.
+        """
+        docs = []
+        postings: Dict[str, list] = {}
+        for offset, doc_id in enumerate(sorted(self.buckets.get(bucket, ()))):
+            label, kind, title, text = self.docs[doc_id]
+            docs.append([doc_id, label, kind, title, text, self.lengths[doc_id]])
+            positions: Dict[str, List[int]] = {}
+            for pos, term in enumerate(tokenize(text)):
+                positions.setdefault(term, []).append(pos)
+            for term, pos in positions.items():
+                postings.setdefault(term, []).append([offset, *pos])
+        if not docs:
+            return []
+        payload = {"v": INDEX_FORMAT_VERSION, "docs": docs, "postings": postings}
+        blob = base64.b64encode(zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 9)).decode("ascii")
+        return [blob[i:i + CHUNK_SIZE] for i in range(0, len(blob), CHUNK_SIZE)]
+
+    def take_pending(self) -> set:
+        """
+        Returns the documents changed since the last call and marks them clean.
+        """
+        pending, self.pending = self.pending, set()
+        return pending
+
+    def merge_bucket_rows(self, stored: Dict[int, List[str]], pending: set) -> Dict[int, List[str]]:
+        """
+        Merges buckets as stored in the sheet (possibly written by another process since this
+        one read them) with the pending documents, and returns the rows to write back.
+        Pending documents keep their local state; every other document of those buckets
+        takes the stored one, so postings other writers added or removed are neither lost
+        nor resurrected.
+        """
+        local = pending | self.pending
+        for bucket, chunks in stored.items():
+            payload = _decode_bucket(chunks)
+            seen = set()
+            for doc_id, label, kind, title, text, _ in (payload or {}).get("docs", ()):
+                seen.add(doc_id)
+                if doc_id not in local:
+                    self.add_document(doc_id, label, kind, title, text, track=False)
+            for doc_id in list(self.buckets.get(bucket, ())):
+                if doc_id not in seen and doc_id not in local:
+                    self.remove_document(doc_id, track=False)
+        return {bucket: self.bucket_row(bucket) for bucket in sorted(stored)}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[int, List[str]]]) -> "SearchIndex":
+        index = cls()
+        for bucket, chunks in rows:
+            payload = _decode_bucket(chunks)
+            if payload is None:
+                continue
+            doc_ids = []
+            for doc_id, label, kind, title, text, length in payload["docs"]:
+                doc_ids.append(doc_id)
+                index.docs[doc_id] = (label, kind, title, text)
+                index.lengths[doc_id] = length
+                index._total_length += length
+                index.by_cycle.setdefault(label, set()).add(doc_id)
+                index.buckets.setdefault(bucket, set()).add(doc_id)
+            for term, entries in payload["postings"].items():
+                docs = index.postings.setdefault(term, {})
+                for e in entries:
+                    docs[doc_ids[e[0]]] = e[1:]
+        return index
+
+
+def _decode_bucket(chunks: List[str]) -> Optional[dict]:
+    blob = "".join(chunks)
+    if not blob:
+        return None
+    payload = json.loads(zlib.decompress(base64.b64decode(blob)))
+    if payload.get("v") != INDEX_FORMAT_VERSION:
+        raise ValueError(f"Unsupported search index version {payload.get('v')}")
+    return payload
+
+
+def _cycle_documents(cycle: Cycle, label: str, kinds: Optional[set] = None):
+    if kinds is None or "Tactic" in kinds:
+        for goal in cycle.goals:
+            yield f"{label}/goal/{goal.id}", "Goal", goal.title, goal.title
+            for t in goal.tactics:
+                yield f"{label}/tactic/{goal.id}/{t.id}", "Tactic", f"{t.title} (Week {t.due_week})", t.title
+    if kinds is None or "Review Wins" in kinds:
+        for r in cycle.reviews:
+            if r.wins:
+                yield f"{label}/wins/{r.week_num}", "Review Wins", f"Week {r.week_num} Wins", r.wins
+            if r.lessons:
+                yield f"{label}/lessons/{r.week_num}", "Review Lessons", f"Week {r.week_num} Lessons", r.lessons
+    if kinds is None or "Vision" in kinds:
+        if cycle.vision_3_year:
+            yield f"{label}/vision/3_year", "Vision", "3-Year Vision", cycle.vision_3_year
+        if cycle.vision_1_year:
+            yield f"{label}/vision/1_year", "Vision", "1-Year Vision", cycle.vision_1_year
+
+
+# --- Process-wide cache (one index per spreadsheet, shared by all sessions) ---
+
+_indexes: Dict[str, SearchIndex] = {}
+_lock = threading.Lock()
+# One loader per spreadsheet; held while loading, so readers of other indexes are not blocked
+_load_locks: Dict[str, threading.Lock] = {}
+
+
+def get_shared_index(key: str, load) -> SearchIndex:
+    """
+    Returns the cached index for a spreadsheet, calling load() only on first use.
+    load() (which may read every archive) runs outside the index lock.
+    """
+    with _lock:
+        if key in _indexes:
+            return _indexes[key]
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+    with load_lock:
+        with _lock:
+            if key in _indexes:
+                return _indexes[key]
+        index = load()
+        with _lock:
+            return _indexes.setdefault(key, index)
+
+
+def replace_shared_index(key: str, index: SearchIndex):
+    _indexes[key] = index
+
+
+def index_lock() -> threading.Lock:
+    """
+    Guards mutation of shared indexes; hold it while indexing or serializing, not while writing to the sheet.
+    """
+    return _lock
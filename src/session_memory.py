@@ -0,0 +1,203 @@
+"""
+Bounded per-session memory.
+
+Each Streamlit session holds one BlobCache in st.session_state for large
+derived values (decoded images, Plotly figures). Entries are evicted
+least-recently-used first once the session exceeds its budget, so resident
+memory per session stays bounded however many sessions are open. Evicted
+values are simply rebuilt on next use.
+
+The session's Cycle is held by a SessionCycle. Once a session has been idle
+for IDLE_PACK_SECONDS a background thread packs its cycle into a compact
+snapshot (src.snapshot) plus the little state saves need, and the pydantic
+models are materialized again on the session's next rerun.
+"""
+import os
+import pickle
+import sys
+import threading
+import time
+import weakref
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from src import snapshot
+from src.models import Cycle
+
+SESSION_BUDGET_BYTES = int(float(os.environ.get("TWELVE_WEEK_SESSION_BUDGET_MB", "8")) * 1024 * 1024)
+MAX_ENTRIES = 32
+# Sessions idle this long have their cycle packed (0 disables packing)
+IDLE_PACK_SECONDS = float(os.environ.get("TWELVE_WEEK_IDLE_PACK_SECONDS", "600"))
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Cheap size estimate for the value kinds cached here.
+    """
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if hasattr(value, "to_json"):
+        # Plotly figure: its serialized size is what Streamlit ships and roughly what it holds
+        return len(value.to_json())
+    return 1024
+
+
+class BlobCache:
+    def __init__(self, budget_bytes: int = SESSION_BUDGET_BYTES, max_entries: int = MAX_ENTRIES):
+        self.budget_bytes = budget_bytes
+        self.max_entries = max_entries
+        # key -> (value, size in bytes)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, build: Callable[[], Any], sizeof: Callable[[Any], int] = estimate_size) -> Any:
+        """
+        Returns the cached value for key, building (and caching) it on a miss.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+        self.misses += 1
+        value = build()
+        self.put(key, value, sizeof(value))
+        return value
+
+    def put(self, key: Hashable, value: Any, size: int):
+        self.discard(key)
+        if size > self.budget_bytes:
+            # Too large to keep at all; the caller still gets the value
+            return
+        self._entries[key] = (value, size)
+        self.nbytes += size
+        while self.nbytes > self.budget_bytes or len(self._entries) > self.max_entries:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def discard(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+
+class PackedCycle:
+    """
+    A Cycle as a snapshot, plus its merge bases, persisted digests and unsaved sections.
+    """
+    __slots__ = ("data", "state")
+
+    def __init__(self, cycle: Cycle):
+        self.data = snapshot.dumps(cycle)
+        state = (cycle._base_rows, cycle._persisted, cycle.dirty_sections())
+        self.state = zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + len(self.state)
+
+    def unpack(self) -> Cycle:
+        cycle = snapshot.loads(self.data)
+        base_rows, persisted, dirty = pickle.loads(zlib.decompress(self.state))
+        for section, rows in base_rows.items():
+            cycle.set_base_rows(section, rows)
+        for unit, digest in persisted.items():
+            cycle.mark_persisted(unit, digest)
+        cycle.mark_clean()
+        if dirty:
+            cycle.mark_dirty(dirty)
+        return cycle
+
+
+class SessionCycle:
+    """
+    Holds one session's cycle, live while the session is in use and packed while it is idle.
+    """
+    def __init__(self, cycle: Cycle):
+        self.cycle_id = cycle.id
+        self._cycle: Optional[Cycle] = cycle
+        self._packed: Optional[PackedCycle] = None
+        self._used = time.monotonic()
+        self._lock = threading.Lock()
+        _sessions.add(self)
+        _start_packer()
+
+    @property
+    def packed(self) -> bool:
+        return self._packed is not None
+
+    def get(self) -> Cycle:
+        """
+        The live cycle, materialized from its packed form if the session was idle.
+        """
+        with self._lock:
+            if self._cycle is None:
+                self._cycle = self._packed.unpack()
+                self._packed = None
+            self._used = time.monotonic()
+            return self._cycle
+
+    def pack_if_idle(self, idle_seconds: float = IDLE_PACK_SECONDS) -> int:
+        """
+        Packs the cycle if the session has not used it for idle_seconds. Returns the bytes packed.
+        """
+        if not self._lock.acquire(blocking=False):
+            return 0
+        try:
+            if self._cycle is None or time.monotonic() - self._used < idle_seconds:
+                return 0
+            self._packed = PackedCycle(self._cycle)
+            self._cycle = None
+            return self._packed.nbytes
+        finally:
+            self._lock.release()
+
+
+# Every SessionCycle of the process; entries vanish with the sessions that hold them
+_sessions: "weakref.WeakSet[SessionCycle]" = weakref.WeakSet()
+_packer: Optional[threading.Thread] = None
+_packer_lock = threading.Lock()
+
+
+def pack_idle_sessions(idle_seconds: float = IDLE_PACK_SECONDS) -> int:
+    """
+    Packs the cycles of every idle session. Returns the number packed.
+    """
+    packed = 0
+    for session in list(_sessions):
+        try:
+            packed += bool(session.pack_if_idle(idle_seconds))
+        except Exception as e:
+            print(f"Packing idle session cycle {session.cycle_id} failed: {e}", file=sys.stderr)
+    return packed
+
+
+def _start_packer():
+    global _packer
+    if IDLE_PACK_SECONDS <= 0:
+        return
+    with _packer_lock:
+        if _packer is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(max(1.0, IDLE_PACK_SECONDS / 4))
+                pack_idle_sessions()
+
+        _packer = threading.Thread(target=run, name="idle-session-packer", daemon=True)
+        _packer.start()
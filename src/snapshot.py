@@ -0,0 +1,542 @@
+"""
+Compact binary snapshots of a Cycle, for backups and environment clones.
+
+Layout (little endian):
+
+    header   magic "12WK", format version (u8), flags (u8), sheet schema version (u16),
+             CRC-32 of the uncompressed payload (u32)
+    [base]   digest() of the base cycle (20-byte SHA-1, delta snapshots only)
+    payload  the cycle, zlib-compressed if FLAG_ZLIB is set
+
+Integers are unsigned LEB128 varints, strings are varint-length-prefixed
+UTF-8, floats are f64 and dates are varint ordinals. Tactic status, block type
+and completion share one byte. The score rollup is stored too, so loading
+does not rescan the tactics.
+
+A delta snapshot holds only what changed since a base cycle: per list
+(tactics and metrics of each goal, reviews) the deleted keys, the added or
+changed items and, only if it cannot be inferred, the new order.
+
+Uncompressed snapshots are decoded straight from a read-only memory map.
+"""
+import hashlib
+import mmap
+import struct
+import zlib
+from contextlib import contextmanager
+from datetime import date
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from src.migrations import SCHEMA_VERSION
+from src.models import (BlockType, Cycle, Goal, Metric, MetricType, ScoreRollup, StrategicBlock, Tactic, TacticStatus,
+                        WeeklyReview)
+
+MAGIC = b"12WK"
+FORMAT_VERSION = 1
+FLAG_ZLIB = 0x01
+FLAG_DELTA = 0x02
+_HEADER = struct.Struct("<4sBBHI")
+_DIGEST_SIZE = 20
+_F64 = struct.Struct("<d")
+_F64x3 = struct.Struct("<3d")
+
+_STATUSES = list(TacticStatus)
+_BLOCKS = list(BlockType)
+_METRIC_TYPES = list(MetricType)
+_STATUS_CODES = {s: i for i, s in enumerate(_STATUSES)}
+_BLOCK_CODES = {b: i for i, b in enumerate(_BLOCKS)}
+_METRIC_TYPE_CODES = {t: i for i, t in enumerate(_METRIC_TYPES)}
+
+# Delta flags for the cycle's own fields
+_D_ID, _D_START, _D_VISION_3, _D_VISION_1, _D_BLOCKS = 0x01, 0x02, 0x04, 0x08, 0x10
+# Delta flags for a goal
+_G_TITLE = 0x01
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+class SnapshotHeader(BaseModel):
+    format_version: int
+    schema_version: int
+    compressed: bool
+    delta: bool
+    base_digest: Optional[str] = None
+    size: int
+
+
+# --- Primitive encoding ---
+
+class _Writer:
+    __slots__ = ("buf",)
+
+    def __init__(self):
+        self.buf = bytearray()
+
+    def uint(self, value: int):
+        buf = self.buf
+        while value > 0x7F:
+            buf.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buf.append(value)
+
+    def str(self, value: str):
+        data = value.encode("utf-8")
+        self.uint(len(data))
+        self.buf += data
+
+    def byte(self, value: int):
+        self.buf.append(value)
+
+    def f64(self, value: float):
+        self.buf += _F64.pack(value)
+
+    def date(self, value: date):
+        self.uint(value.toordinal())
+
+    def strs(self, values: List[str]):
+        self.uint(len(values))
+        for v in values:
+            self.str(v)
+
+
+class _Reader:
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: memoryview):
+        self.buf = buf
+        self.pos = 0
+
+    def uint(self) -> int:
+        buf = self.buf
+        result = shift = 0
+        while True:
+            b = buf[self.pos]
+            self.pos += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                return result
+            shift += 7
+
+    def str(self) -> str:
+        n = self.uint()
+        start = self.pos
+        self.pos += n
+        return str(self.buf[start:self.pos], "utf-8")
+
+    def byte(self) -> int:
+        b = self.buf[self.pos]
+        self.pos += 1
+        return b
+
+    def f64(self) -> float:
+        value = _F64.unpack_from(self.buf, self.pos)[0]
+        self.pos += 8
+        return value
+
+    def date(self) -> date:
+        return date.fromordinal(self.uint())
+
+    def strs(self) -> List[str]:
+        return [self.str() for _ in range(self.uint())]
+
+
+# --- Items ---
+# Readers return field dicts for pydantic to validate in bulk and append each row's
+# (version, updated at) to `metas`, in the order the rows are read.
+
+def _write_tactic(w: _Writer, t: Tactic):
+    w.str(t.id)
+    w.str(t.title)
+    w.byte(_STATUS_CODES[t.status] << 3 | _BLOCK_CODES[t.block_type] << 1 | int(t.is_completed))
+    w.uint(t.due_week)
+    version, updated_at = t.row_meta()
+    w.uint(version)
+    w.str(updated_at)
+
+
+def _read_tactic(r: _Reader, metas: list) -> dict:
+    tactic_id, title, packed = r.str(), r.str(), r.byte()
+    row = {
+        "id": tactic_id, "title": title, "due_week": r.uint(),
+        "status": _STATUSES[packed >> 3], "block_type": _BLOCKS[(packed >> 1) & 0x03], "is_completed": bool(packed & 0x01),
+    }
+    metas.append((r.uint(), r.str()))
+    return row
+
+
+def _write_metric(w: _Writer, m: Metric):
+    w.str(m.id)
+    w.str(m.title)
+    w.byte(_METRIC_TYPE_CODES[m.type])
+    w.buf += _F64x3.pack(m.starting_value, m.target_value, m.current_value)
+    w.str(m.unit)
+    w.date(m.last_updated)
+    version, updated_at = m.row_meta()
+    w.uint(version)
+    w.str(updated_at)
+
+
+def _read_metric(r: _Reader, metas: list) -> dict:
+    metric_id, title, type_code = r.str(), r.str(), r.byte()
+    starting, target, current = _F64x3.unpack_from(r.buf, r.pos)
+    r.pos += _F64x3.size
+    row = {
+        "id": metric_id, "title": title, "type": _METRIC_TYPES[type_code],
+        "starting_value": starting, "target_value": target, "current_value": current,
+        "unit": r.str(), "last_updated": r.date(),
+    }
+    metas.append((r.uint(), r.str()))
+    return row
+
+
+def _write_review(w: _Writer, rv: WeeklyReview):
+    w.uint(rv.week_num)
+    w.f64(rv.score)
+    w.str(rv.wins)
+    w.str(rv.lessons)
+    w.date(rv.date_submitted)
+    version, updated_at = rv.row_meta()
+    w.uint(version)
+    w.str(updated_at)
+
+
+def _read_review(r: _Reader, metas: list) -> dict:
+    row = {"week_num": r.uint(), "score": r.f64(), "wins": r.str(), "lessons": r.str(), "date_submitted": r.date()}
+    metas.append((r.uint(), r.str()))
+    return row
+
+
+def _write_block(w: _Writer, b: StrategicBlock):
+    w.str(b.day_of_week)
+    w.str(b.start_time)
+    w.str(b.end_time)
+
+
+def _read_block(r: _Reader, metas: list) -> dict:
+    return {"day_of_week": r.str(), "start_time": r.str(), "end_time": r.str()}
+
+
+def _write_list(w: _Writer, items, write):
+    w.uint(len(items))
+    for item in items:
+        write(w, item)
+
+
+def _read_list(r: _Reader, read, metas: list) -> list:
+    return [read(r, metas) for _ in range(r.uint())]
+
+
+def _write_counts(w: _Writer, counts: Dict):
+    w.uint(len(counts))
+    for key, count in counts.items():
+        if isinstance(key, int):
+            w.uint(key)
+        else:
+            w.str(key)
+        w.uint(count.total)
+        w.uint(count.completed)
+
+
+def _read_counts(r: _Reader, read_key) -> Dict:
+    return {read_key(): {"total": r.uint(), "completed": r.uint()} for _ in range(r.uint())}
+
+
+def _write_scores(w: _Writer, scores: ScoreRollup):
+    # Stored as is, so loading does not rescan the tactics
+    _write_counts(w, scores.weeks)
+    _write_counts(w, scores.goals)
+    w.uint(len(scores.goal_weeks))
+    for goal_id, weeks in scores.goal_weeks.items():
+        w.str(goal_id)
+        _write_counts(w, weeks)
+    w.uint(scores.cycle.total)
+    w.uint(scores.cycle.completed)
+
+
+def _read_scores(r: _Reader) -> dict:
+    return {
+        "weeks": _read_counts(r, r.uint),
+        "goals": _read_counts(r, r.str),
+        "goal_weeks": {r.str(): _read_counts(r, r.uint) for _ in range(r.uint())},
+        "cycle": {"total": r.uint(), "completed": r.uint()},
+    }
+
+
+def _validate(cycle_fields: dict, metas: list) -> Cycle:
+    cycle = Cycle.model_validate(cycle_fields)
+    # Rows were read goal by goal (tactics, then metrics), then the reviews
+    rows = [row for goal in cycle.goals for row in (*goal.tactics, *goal.metrics)] + list(cycle.reviews)
+    for row, (version, updated_at) in zip(rows, metas):
+        if version or updated_at:
+            row.set_row_meta(version, updated_at)
+    cycle.mark_clean()
+    return cycle
+
+
+# --- Full payload ---
+
+def _encode_cycle(cycle: Cycle, scores: bool = True) -> bytes:
+    w = _Writer()
+    w.str(cycle.id)
+    w.date(cycle.start_date)
+    w.str(cycle.vision_3_year)
+    w.str(cycle.vision_1_year)
+    w.uint(len(cycle.goals))
+    for goal in cycle.goals:
+        w.str(goal.id)
+        w.str(goal.title)
+        _write_list(w, goal.tactics, _write_tactic)
+        _write_list(w, goal.metrics, _write_metric)
+    _write_list(w, cycle.reviews, _write_review)
+    _write_list(w, cycle.strategic_blocks, _write_block)
+    if scores:
+        _write_scores(w, cycle.scores)
+    return bytes(w.buf)
+
+
+def _decode_cycle(r: _Reader) -> Cycle:
+    metas: list = []
+    fields = {"id": r.str(), "start_date": r.date(), "vision_3_year": r.str(), "vision_1_year": r.str()}
+    goals = []
+    for _ in range(r.uint()):
+        goal_id, title = r.str(), r.str()
+        goals.append({"id": goal_id, "title": title, "tactics": _read_list(r, _read_tactic, metas), "metrics": _read_list(r, _read_metric, metas)})
+    fields.update(goals=goals, reviews=_read_list(r, _read_review, metas), strategic_blocks=_read_list(r, _read_block, metas), scores=_read_scores(r))
+    return _validate(fields, metas)
+
+
+def digest(cycle: Cycle) -> str:
+    """
+    Identifies a cycle's contents (the derived score rollup aside); delta snapshots record the digest of their base.
+    """
+    return hashlib.sha1(_encode_cycle(cycle, scores=False)).hexdigest()
+
+
+# --- Delta payload ---
+
+def _encoded(items, key: Callable, write) -> Dict[str, bytes]:
+    out = {}
+    for item in items:
+        w = _Writer()
+        write(w, item)
+        out[key(item)] = bytes(w.buf)
+    return out
+
+
+def _write_list_delta(w: _Writer, base_items, items, key: Callable, write) -> bool:
+    """
+    Writes deleted keys, added/changed items and (when not implied) the order.
+    Returns whether anything changed.
+    """
+    base = _encoded(base_items, key, write)
+    local = _encoded(items, key, write)
+    deleted = [k for k in base if k not in local]
+    upserts = [k for k, data in local.items() if base.get(k) != data]
+    # Applying keeps base order, drops deletions and appends new items; record the order only if that is wrong
+    implied = [k for k in base if k in local] + [k for k in local if k not in base]
+    order = list(local) if implied != list(local) else None
+
+    w.strs(deleted)
+    w.uint(len(upserts))
+    for k in upserts:
+        w.buf += local[k]
+    w.byte(order is not None)
+    if order is not None:
+        w.strs(order)
+    return bool(deleted or upserts or order)
+
+
+def _read_list_delta(r: _Reader, base_items, key: Callable, read, model) -> list:
+    items = {key(item): item for item in base_items}
+    for k in r.strs():
+        items.pop(k, None)
+    for _ in range(r.uint()):
+        metas: list = []
+        item = model.model_validate(read(r, metas))
+        item.set_row_meta(*metas[0])
+        items[key(item)] = item
+    if r.byte():
+        return [items[k] for k in r.strs()]
+    return list(items.values())
+
+
+def _tactic_key(t: Tactic) -> str:
+    return t.id
+
+
+def _metric_key(m: Metric) -> str:
+    return m.id
+
+
+def _review_key(rv: WeeklyReview) -> str:
+    return str(rv.week_num)
+
+
+def _block_keys(cycle: Cycle) -> List[Tuple[str, str, str]]:
+    return [(b.day_of_week, b.start_time, b.end_time) for b in cycle.strategic_blocks]
+
+
+def _encode_delta(cycle: Cycle, base: Cycle) -> bytes:
+    w = _Writer()
+    flags = 0
+    flags |= _D_ID if cycle.id != base.id else 0
+    flags |= _D_START if cycle.start_date != base.start_date else 0
+    flags |= _D_VISION_3 if cycle.vision_3_year != base.vision_3_year else 0
+    flags |= _D_VISION_1 if cycle.vision_1_year != base.vision_1_year else 0
+    flags |= _D_BLOCKS if _block_keys(cycle) != _block_keys(base) else 0
+    w.byte(flags)
+    if flags & _D_ID:
+        w.str(cycle.id)
+    if flags & _D_START:
+        w.date(cycle.start_date)
+    if flags & _D_VISION_3:
+        w.str(cycle.vision_3_year)
+    if flags & _D_VISION_1:
+        w.str(cycle.vision_1_year)
+    if flags & _D_BLOCKS:
+        _write_list(w, cycle.strategic_blocks, _write_block)
+
+    w.strs([g.id for g in cycle.goals])
+    base_goals = {g.id: g for g in base.goals}
+    changed = _Writer()
+    count = 0
+    for goal in cycle.goals:
+        old = base_goals.get(goal.id)
+        gw = _Writer()
+        gw.str(goal.id)
+        title_changed = old is None or old.title != goal.title
+        gw.byte(_G_TITLE if title_changed else 0)
+        if title_changed:
+            gw.str(goal.title)
+        tactics_changed = _write_list_delta(gw, old.tactics if old else [], goal.tactics, _tactic_key, _write_tactic)
+        metrics_changed = _write_list_delta(gw, old.metrics if old else [], goal.metrics, _metric_key, _write_metric)
+        if title_changed or tactics_changed or metrics_changed:
+            changed.buf += gw.buf
+            count += 1
+    w.uint(count)
+    w.buf += changed.buf
+
+    _write_list_delta(w, base.reviews, cycle.reviews, _review_key, _write_review)
+    _write_scores(w, cycle.scores)
+    return bytes(w.buf)
+
+
+def _decode_delta(r: _Reader, base: Cycle) -> Cycle:
+    base = base.model_copy(deep=True)
+    flags = r.byte()
+    cycle_id = r.str() if flags & _D_ID else base.id
+    start_date = r.date() if flags & _D_START else base.start_date
+    vision_3 = r.str() if flags & _D_VISION_3 else base.vision_3_year
+    vision_1 = r.str() if flags & _D_VISION_1 else base.vision_1_year
+    blocks = _read_list(r, _read_block, []) if flags & _D_BLOCKS else list(base.strategic_blocks)
+
+    order = r.strs()
+    goals = {g.id: g for g in base.goals}
+    for _ in range(r.uint()):
+        goal_id = r.str()
+        old = goals.get(goal_id)
+        title = r.str() if r.byte() & _G_TITLE else old.title
+        tactics = _read_list_delta(r, old.tactics if old else [], _tactic_key, _read_tactic, Tactic)
+        metrics = _read_list_delta(r, old.metrics if old else [], _metric_key, _read_metric, Metric)
+        goals[goal_id] = Goal(id=goal_id, title=title, tactics=tactics, metrics=metrics)
+    reviews = _read_list_delta(r, base.reviews, _review_key, _read_review, WeeklyReview)
+    cycle = Cycle(id=cycle_id, start_date=start_date, goals=[goals[g] for g in order], reviews=reviews,
+                  strategic_blocks=blocks, vision_3_year=vision_3, vision_1_year=vision_1, scores=_read_scores(r))
+    cycle.mark_clean()
+    return cycle
+
+
+# --- Snapshots ---
+
+def dumps(cycle: Cycle, base: Optional[Cycle] = None, compress: bool = False) -> bytes:
+    """
+    Serializes a cycle: a full snapshot, or a delta against `base`.
+    """
+    flags = FLAG_ZLIB if compress else 0
+    prefix = b""
+    if base is not None:
+        flags |= FLAG_DELTA
+        prefix = bytes.fromhex(digest(base))
+        payload = _encode_delta(cycle, base)
+    else:
+        payload = _encode_cycle(cycle)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, SCHEMA_VERSION, zlib.crc32(payload))
+    return header + prefix + (zlib.compress(payload) if compress else payload)
+
+
+def read_header(data) -> SnapshotHeader:
+    if len(data) < _HEADER.size:
+        raise SnapshotError("Not a cycle snapshot (too short)")
+    magic, version, flags, schema, _ = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SnapshotError("Not a cycle snapshot (bad magic)")
+    if version > FORMAT_VERSION:
+        raise SnapshotError(f"Snapshot format v{version} is newer than this app (v{FORMAT_VERSION})")
+    if schema > SCHEMA_VERSION:
+        raise SnapshotError(f"Snapshot schema v{schema} is newer than this app (v{SCHEMA_VERSION})")
+    delta = bool(flags & FLAG_DELTA)
+    base_digest = bytes(data[_HEADER.size:_HEADER.size + _DIGEST_SIZE]).hex() if delta else None
+    return SnapshotHeader(format_version=version, schema_version=schema, compressed=bool(flags & FLAG_ZLIB),
+                          delta=delta, base_digest=base_digest, size=len(data))
+
+
+def loads(data, base: Optional[Cycle] = None) -> Cycle:
+    """
+    Deserializes a snapshot from any bytes-like object (bytes, mmap...).
+    Delta snapshots need the exact base they were taken against.
+    """
+    header = read_header(data)
+    with memoryview(data) as view:
+        payload = view[_HEADER.size + (_DIGEST_SIZE if header.delta else 0):]
+        try:
+            if header.compressed:
+                payload = memoryview(zlib.decompress(payload))
+            if zlib.crc32(payload) != _HEADER.unpack_from(data, 0)[4]:
+                raise SnapshotError("Snapshot is corrupt (checksum mismatch)")
+            reader = _Reader(payload)
+            if not header.delta:
+                return _decode_cycle(reader)
+            if base is None:
+                raise SnapshotError("This is a delta snapshot; its base snapshot is required")
+            if digest(base) != header.base_digest:
+                raise SnapshotError("The base does not match the one this delta was taken against")
+            return _decode_delta(reader, base)
+        finally:
+            payload.release()
+
+
+@contextmanager
+def mapped(path: str) -> Iterator[mmap.mmap]:
+    """
+    Maps a snapshot file read-only; uncompressed snapshots are decoded in place without copying the file.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise SnapshotError(f"{path} is empty")
+    try:
+        yield mm
+    finally:
+        mm.close()
+
+
+def write_snapshot(path: str, cycle: Cycle, base: Optional[Cycle] = None, compress: bool = False) -> int:
+    data = dumps(cycle, base=base, compress=compress)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_snapshot(path: str, base: Optional[Cycle] = None) -> Cycle:
+    with mapped(path) as mm:
+        return loads(mm, base=base)
+
+
+def read_snapshot_header(path: str) -> SnapshotHeader:
+    with mapped(path) as mm:
+        return read_header(mm)
@@ -1,332 +1,1104 @@
-import pandas as pd
-import streamlit as st
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import tomllib
 import gspread
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
 from datetime import date, datetime, timedelta
-from typing import List
-from src.models import Cycle, Goal, Tactic, BlockType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.models import Cycle, CycleInfo, CycleStatus, Goal, Tactic, TacticStatus, BlockType, Metric, MetricType, StrategicBlock, WeeklyReview, ScoreCount, ScoreRollup
+from src.search import BUCKETS, SECTION_KINDS, SearchHit, SearchIndex, bucket_of, get_shared_index, index_lock, replace_shared_index
+from src.memory_sheets import open_memory_spreadsheet
+from src.transport import get_transport, insert_calendar_event
+from src.migrations import SCHEMA_VERSION, COLUMNS as VERSIONED_SHEETS, UPDATED_COLUMN, VERSION_COLUMN, detect_version, headers, migrate_records, to_rows
+from src.concurrency import Conflict, content, merge_rows
 
 # Constants
 WORKSHEET_NAME = "Tactics"
+ARCHIVE_DATE_FORMAT = "%Y-%m-%d"
+SCORE_COLUMNS = ["Scope", "Key", "Total", "Completed"]
+SEARCH_WORKSHEET_NAME = "Search_Index"
+SEARCH_COLUMNS = ["Bucket", "Data"]
+# Tactics are split into "Tactics#<goal id>" (or "Tactics#w<week>") worksheets above this many rows
+SHARD_PREFIX = f"{WORKSHEET_NAME}#"
+SHARD_MANIFEST_NAME = "Shard_Manifest"
+SHARD_THRESHOLD = int(os.environ.get("TWELVE_WEEK_SHARD_THRESHOLD", "2000"))
+SHARD_BY = os.environ.get("TWELVE_WEEK_SHARD_BY", "goal")
+# Cycle registry; every cycle except the default one keeps its sheets under a "<cycle id>:" prefix
+REGISTRY_WORKSHEET_NAME = "Cycles"
+REGISTRY_COLUMNS = ["Cycle_ID", "Owner", "Start_Date", "Status"]
+DEFAULT_CYCLE_ID = "c1"
+# Seconds a process trusts its copy of the registry before reading it again
+REGISTRY_TTL = float(os.environ.get("TWELVE_WEEK_REGISTRY_TTL", "30"))
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
     "https://www.googleapis.com/auth/calendar",
 ]
 
+DEFAULT_SECRETS_PATH = os.path.join(".streamlit", "secrets.toml")
+# "gsheets" (default) or "memory" for the in-process stand-in in src.memory_sheets
+STORAGE_BACKEND = os.environ.get("TWELVE_WEEK_STORAGE", "gsheets")
+# Maximum number of worksheets fetched in parallel by get_cycle
+LOAD_CONCURRENCY = int(os.environ.get("TWELVE_WEEK_LOAD_CONCURRENCY", "6"))
+
+# Sections merged with the sheet on save (see src.concurrency): worksheet, row key and row label
+MERGED_SECTIONS = {
+    "tactics": ("Tactics", lambda r: str(r["Tactic_ID"]), lambda r: r["Tactic_Title"]),
+    "vision": ("Vision", lambda r: str(r["Type"]), lambda r: r["Type"]),
+    "reviews": ("Reviews", lambda r: str(r["Week_Num"]), lambda r: f"Week {r['Week_Num']}"),
+    "metrics": ("Metrics", lambda r: str(r["Metric_ID"]), lambda r: r["Title"]),
+    "settings": ("Settings", lambda r: f"{r['Key']} {r['Value']}-{r['Extra']}", lambda r: f"{r['Key']} {r['Value']}-{r['Extra']}"),
+}
+
+# Cycle registries, one per spreadsheet, shared by every Storage in the process: (read at, registry)
+_registries: Dict[str, Tuple[float, Dict[str, CycleInfo]]] = {}
+_registry_lock = threading.Lock()
+# Serializes taking dirty search-index buckets and writing them, so rows land in order
+_search_write_lock = threading.Lock()
+# Saves to one spreadsheet from this process run one at a time, so their read-merge-write is atomic
+_save_locks: Dict[str, threading.Lock] = {}
+# Tactic sheet rows this process last read or wrote, by (spreadsheet id, title): (digest, rows).
+# A sheet whose digest in the shard manifest still matches is parsed from here instead of fetched.
+_tactic_rows: Dict[Tuple[str, str], Tuple[str, List[dict]]] = {}
+
+
+def _digest(rows) -> str:
+    return hashlib.sha1(json.dumps(rows, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _dedupe_ids(items: list):
+    """
+    Renames repeated ids to "<id>-2", "<id>-3"... in row order. Older builds derived ids from
+    list lengths, so a delete followed by an add could reuse one; renaming the same rows the
+    same way on every read keeps loads and save-time read-backs keyed alike.
+    """
+    seen = set()
+    for item in items:
+        if item.id in seen:
+            n = 2
+            while f"{item.id}-{n}" in seen:
+                n += 1
+            item.id = f"{item.id}-{n}"
+        seen.add(item.id)
+
+
+def _cell_value(value) -> dict:
+    if value is None or value == "":
+        return {}
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, (int, float)):
+        return {"numberValue": value}
+    return {"stringValue": str(value)}
+
+
+def _overwrite(ws: gspread.Worksheet, values: List[list]):
+    """
+    Replaces a worksheet's contents in one request. updateCells over the whole grid writes
+    the new rows and clears every other cell together, so another process reading meanwhile
+    never sees the sheet empty (as between clear() and update()) or half replaced.
+    """
+    height, width = len(values), max((len(row) for row in values), default=0)
+    if height > ws.row_count:
+        ws.add_rows(height - ws.row_count)
+    if width > ws.col_count:
+        ws.add_cols(width - ws.col_count)
+    ws.spreadsheet.batch_update({"requests": [{"updateCells": {
+        "range": {"sheetId": ws.id},
+        "rows": [{"values": [_cell_value(v) for v in row]} for row in values],
+        "fields": "userEnteredValue",
+    }}]})
+
+
+def _overwrite_rows(ws: gspread.Worksheet, rows: Dict[int, list]):
+    """
+    Replaces whole rows (0-based index -> values) in one request; cells right of the new values are cleared.
+    """
+    if not rows:
+        return
+    height = max(rows) + 1
+    width = max(len(values) for values in rows.values())
+    if height > ws.row_count:
+        ws.add_rows(height - ws.row_count)
+    if width > ws.col_count:
+        ws.add_cols(width - ws.col_count)
+    ws.spreadsheet.batch_update({"requests": [{"updateCells": {
+        "range": {"sheetId": ws.id, "startRowIndex": i, "endRowIndex": i + 1},
+        "rows": [{"values": [_cell_value(v) for v in values]}],
+        "fields": "userEnteredValue",
+    }} for i, values in sorted(rows.items())]})
+
+
+def _save_lock(spreadsheet_id: str) -> threading.Lock:
+    with _registry_lock:
+        return _save_locks.setdefault(spreadsheet_id, threading.Lock())
+
+
+class StorageError(Exception):
+    pass
+
+
+class StreamlitNotifier:
+    """
+    Surfaces storage messages in the Streamlit UI.
+    """
+    def error(self, message: str):
+        import streamlit as st
+        st.error(message)
+
+    def warning(self, message: str):
+        import streamlit as st
+        # A toast, unlike st.warning, survives the st.rerun() that follows most saves
+        st.toast(message, icon="⚠️")
+
+    def toast(self, message: str, icon: Optional[str] = None):
+        import streamlit as st
+        st.toast(message, icon=icon)
+
+    def stop(self):
+        import streamlit as st
+        st.stop()
+
+
+class HeadlessNotifier:
+    """
+    Used by the API and CLI: errors are raised instead of rendered.
+    """
+    def error(self, message: str):
+        raise StorageError(message)
+
+    def warning(self, message: str):
+        print(message, file=sys.stderr)
+
+    def toast(self, message: str, icon: Optional[str] = None):
+        pass
+
+    def stop(self):
+        raise StorageError("Storage is not available")
+
+
+def load_settings(path: Optional[str] = None) -> dict:
+    """
+    Reads the [connections.gsheets] section of a Streamlit secrets file without importing Streamlit.
+    The path defaults to $TWELVE_WEEK_SECRETS, then .streamlit/secrets.toml.
+    """
+    path = path or os.environ.get("TWELVE_WEEK_SECRETS", DEFAULT_SECRETS_PATH)
+    with open(path, "rb") as f:
+        secrets = tomllib.load(f)
+    if "connections" not in secrets or "gsheets" not in secrets["connections"]:
+        raise StorageError(f"Secrets missing! Check {path}")
+    return secrets["connections"]["gsheets"]
+
+
 class Storage:
-    def __init__(self):
+    def __init__(self, settings: Optional[dict] = None, notifier=None, cycle_id: Optional[str] = None):
+        """
+        settings is the [connections.gsheets] secrets section; when omitted it is read from st.secrets.
+        cycle_id selects the registry entry whose partition is read and written (default "c1").
+        """
+        self.notifier = notifier or StreamlitNotifier()
         # Initialize direct gspread connection
         try:
-            if "connections" not in st.secrets or "gsheets" not in st.secrets["connections"]:
-                st.error("Secrets missing! Check .streamlit/secrets.toml")
-                st.stop()
-                
-            creds_dict = st.secrets["connections"]["gsheets"]["service_account"]
-            creds = Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
-            self.client = gspread.authorize(creds)
-            self.calendar_service = build('calendar', 'v3', credentials=creds)
-            
-            url = st.secrets["connections"]["gsheets"]["spreadsheet"]
-            self.sh = self.client.open_by_url(url)
-            self.worksheet = self.sh.worksheet(WORKSHEET_NAME)
+            if settings is None and STORAGE_BACKEND != "memory":
+                import streamlit as st
+                if "connections" not in st.secrets or "gsheets" not in st.secrets["connections"]:
+                    self.notifier.error("Secrets missing! Check .streamlit/secrets.toml")
+                    self.notifier.stop()
+                settings = st.secrets["connections"]["gsheets"]
+            self.settings = settings or {}
             
-            # Initialize Vision Worksheet
+            if STORAGE_BACKEND == "memory" or self.settings.get("backend") == "memory":
+                # Offline stand-in (load tests, demos): same code paths, no Google APIs
+                self.client = None
+                self.transport = None
+                self.sh = open_memory_spreadsheet(self.settings.get("spreadsheet", "memory"))
+            else:
+                # Sheets and Calendar share one pooled, process-wide authorized session
+                self.transport = get_transport(settings["service_account"], SCOPES)
+                self.client = gspread.Client(self.transport.credentials, session=self.transport)
+                
+                url = settings["spreadsheet"]
+                self.sh = self.client.open_by_url(url)
+            # One metadata read resolves every worksheet below
+            self._refresh_worksheets()
             try:
-                self.vision_worksheet = self.sh.worksheet("Vision")
-            except gspread.WorksheetNotFound:
-                self.vision_worksheet = self.sh.add_worksheet(title="Vision", rows=20, cols=2)
-                self.vision_worksheet.append_row(["Type", "Content"])
-                self.vision_worksheet.append_row(["3_Year", ""])
-                self.vision_worksheet.append_row(["1_Year", ""])
+                self.select_cycle(cycle_id or DEFAULT_CYCLE_ID)
+            except StorageError as e:
+                # e.g. a session still pointing at a cycle removed from the registry
+                print(f"{e}; using cycle {DEFAULT_CYCLE_ID}", file=sys.stderr)
+                self.select_cycle(DEFAULT_CYCLE_ID)
+            
+        except Exception as e:
+            self.notifier.error(f"Database Connection Error: {e}")
+            self.notifier.stop()
+    
+    # --- Cycle registry & partitions ---
 
-            # Initialize Reviews Worksheet
-            try:
-                self.reviews_worksheet = self.sh.worksheet("Reviews")
-            except gspread.WorksheetNotFound:
-                self.reviews_worksheet = self.sh.add_worksheet(title="Reviews", rows=50, cols=5)
-                self.reviews_worksheet.append_row(["Week_Num", "Score", "Wins", "Lessons", "Date_Submitted"])
+    def _title(self, base: str) -> str:
+        """
+        Worksheet title of `base` within the selected cycle's partition.
+        """
+        return base if self.cycle_info.id == DEFAULT_CYCLE_ID else f"{self.cycle_info.id}:{base}"
 
-            # Initialize Settings Worksheet (for Strategic Blocks etc)
-            try:
-                self.settings_worksheet = self.sh.worksheet("Settings")
-            except gspread.WorksheetNotFound:
-                self.settings_worksheet = self.sh.add_worksheet(title="Settings", rows=20, cols=4)
-                self.settings_worksheet.append_row(["Type", "Key", "Value", "Extra"])
+    def select_cycle(self, cycle_id: str):
+        """
+        Binds this Storage to one cycle's partition. Worksheet handles come from the cached
+        metadata, so switching costs the same however many cycles exist.
+        """
+        if cycle_id not in self.registry:
+            # Possibly created by another process since the registry was read
+            self.refresh_registry(reselect=False)
+            if cycle_id not in self.registry:
+                raise StorageError(f"Unknown cycle {cycle_id}")
+        self.cycle_info = self.registry[cycle_id]
+        if self._title(WORKSHEET_NAME) not in self._worksheets:
+            # The partition may have been created by another process after the metadata was read
+            self._refresh_worksheets()
 
-            # Initialize Vision Images Worksheet
-            try:
-                self.vision_images_worksheet = self.sh.worksheet("Vision_Images")
-            except gspread.WorksheetNotFound:
-                self.vision_images_worksheet = self.sh.add_worksheet(title="Vision_Images", rows=5, cols=2)
-                self.vision_images_worksheet.append_row(["Type", "Base64_Data"])
+        # Initialize Tactics Worksheet
+        try:
+            self.worksheet = self._worksheet(self._title(WORKSHEET_NAME))
+        except gspread.WorksheetNotFound:
+            self.worksheet = self._add_worksheet(self._title(WORKSHEET_NAME), rows=100, cols=len(headers("Tactics")))
+            self.worksheet.append_row(headers("Tactics"))
+
+        # Initialize Vision Worksheet
+        try:
+            self.vision_worksheet = self._worksheet(self._title("Vision"))
+        except gspread.WorksheetNotFound:
+            self.vision_worksheet = self._add_worksheet(self._title("Vision"), rows=20, cols=2)
+            self.vision_worksheet.append_row(["Type", "Content"])
+            self.vision_worksheet.append_row(["3_Year", ""])
+            self.vision_worksheet.append_row(["1_Year", ""])
+
+        # Initialize Reviews Worksheet
+        try:
+            self.reviews_worksheet = self._worksheet(self._title("Reviews"))
+        except gspread.WorksheetNotFound:
+            self.reviews_worksheet = self._add_worksheet(self._title("Reviews"), rows=50, cols=5)
+            self.reviews_worksheet.append_row(headers("Reviews"))
+
+        # Initialize Settings Worksheet (for Strategic Blocks etc)
+        try:
+            self.settings_worksheet = self._worksheet(self._title("Settings"))
+        except gspread.WorksheetNotFound:
+            self.settings_worksheet = self._add_worksheet(self._title("Settings"), rows=20, cols=4)
+            self.settings_worksheet.append_row(["Type", "Key", "Value", "Extra"])
+
+        # Initialize Vision Images Worksheet
+        try:
+            self.vision_images_worksheet = self._worksheet(self._title("Vision_Images"))
+        except gspread.WorksheetNotFound:
+            self.vision_images_worksheet = self._add_worksheet(self._title("Vision_Images"), rows=5, cols=2)
+            self.vision_images_worksheet.append_row(["Type", "Base64_Data"])
+
+        # Initialize Scores Worksheet (materialized rollup of tactic completion)
+        try:
+            self.scores_worksheet = self._worksheet(self._title("Scores"))
+        except gspread.WorksheetNotFound:
+            self.scores_worksheet = self._add_worksheet(self._title("Scores"), rows=50, cols=4)
+            self.scores_worksheet.append_row(SCORE_COLUMNS)
+
+        # Initialize Metrics Worksheet
+        try:
+            self.metrics_worksheet = self._worksheet(self._title("Metrics"))
+        except gspread.WorksheetNotFound:
+            self.metrics_worksheet = self._add_worksheet(self._title("Metrics"), rows=50, cols=9)
+            self.metrics_worksheet.append_row(headers("Metrics"))
+
+    @property
+    def registry(self) -> Dict[str, CycleInfo]:
+        """
+        The process-wide copy of the cycle registry, read again once it is REGISTRY_TTL old.
+        """
+        with _registry_lock:
+            read_at, registry = _registries.get(self.sh.id, (None, None))
+            if registry is None or time.monotonic() - read_at > REGISTRY_TTL:
+                registry = self._load_registry()
+                _registries[self.sh.id] = (time.monotonic(), registry)
+            return registry
+
+    def _load_registry(self) -> Dict[str, CycleInfo]:
+        try:
+            ws = self._worksheet(REGISTRY_WORKSHEET_NAME)
+            registry = {}
+            for row in ws.get_all_records():
+                registry[str(row["Cycle_ID"])] = CycleInfo(
+                    id=str(row["Cycle_ID"]),
+                    owner=str(row["Owner"]),
+                    start_date=date.fromisoformat(str(row["Start_Date"])),
+                    status=CycleStatus(row["Status"])
+                )
+        except gspread.WorksheetNotFound:
+            registry = {}
+        if DEFAULT_CYCLE_ID not in registry:
+            # First run: register the existing (unprefixed) sheets as the default cycle
+            registry[DEFAULT_CYCLE_ID] = CycleInfo(id=DEFAULT_CYCLE_ID, start_date=self._settings_start_date() or date.today())
+            self._write_registry(registry)
+        return registry
+
+    def _settings_start_date(self) -> Optional[date]:
+        """
+        The start date recorded in the default cycle's Settings sheet as a
+        "Cycle | Start_Date | YYYY-MM-DD" row, if any.
+        """
+        try:
+            rows = self._worksheet("Settings").get_all_records()
+        except gspread.WorksheetNotFound:
+            return None
+        for row in rows:
+            if row.get("Type") == "Cycle" and row.get("Key") == "Start_Date":
+                try:
+                    return date.fromisoformat(str(row["Value"]))
+                except ValueError:
+                    print(f"Ignoring Settings start date {row['Value']!r}", file=sys.stderr)
+        return None
+
+    def _change_registry(self, change: Callable[[Dict[str, CycleInfo]], CycleInfo]) -> CycleInfo:
+        """
+        Applies `change` to the registry as the sheet holds it now and writes it back, so
+        cycles registered or edited by other processes since the last read are kept.
+        """
+        with _registry_lock:
+            registry = self._load_registry()
+            info = change(registry)
+            self._write_registry(registry)
+            _registries[self.sh.id] = (time.monotonic(), registry)
+        if info.id == self.cycle_info.id:
+            self.cycle_info = info
+        return info
+
+    def _write_registry(self, registry: Dict[str, CycleInfo]):
+        try:
+            ws = self._worksheet(REGISTRY_WORKSHEET_NAME)
+        except gspread.WorksheetNotFound:
+            ws = self._add_worksheet(REGISTRY_WORKSHEET_NAME, rows=20, cols=len(REGISTRY_COLUMNS))
+        _overwrite(ws, [REGISTRY_COLUMNS] + [[c.id, c.owner, c.start_date.isoformat(), c.status.value] for c in registry.values()])
+
+    def list_cycles(self, status: Optional[CycleStatus] = None) -> List[CycleInfo]:
+        return [c for c in self.registry.values() if status is None or c.status == status]
+
+    def create_cycle(self, owner: str = "", start_date: Optional[date] = None) -> CycleInfo:
+        """
+        Registers a new cycle; its worksheets are created the first time it is selected.
+        """
+        def change(registry):
+            n = len(registry) + 1
+            while f"c{n}" in registry:
+                n += 1
+            registry[f"c{n}"] = CycleInfo(id=f"c{n}", owner=owner, start_date=start_date or date.today())
+            return registry[f"c{n}"]
+        return self._change_registry(change)
+
+    def update_cycle(self, cycle_id: str, **changes) -> CycleInfo:
+        def change(registry):
+            if cycle_id not in registry:
+                raise StorageError(f"Unknown cycle {cycle_id}")
+            registry[cycle_id] = registry[cycle_id].model_copy(update=changes)
+            return registry[cycle_id]
+        return self._change_registry(change)
+
+    def close_cycle(self, cycle_id: str) -> CycleInfo:
+        """
+        Marks a cycle as finished. Its sheets are kept (and stay searchable); the default
+        cycle cannot be closed, since it is what sessions fall back to.
+        """
+        if cycle_id == DEFAULT_CYCLE_ID:
+            raise StorageError(f"The default cycle {DEFAULT_CYCLE_ID} cannot be closed")
+        return self.update_cycle(cycle_id, status=CycleStatus.CLOSED)
+
+    def refresh_registry(self, reselect: bool = True):
+        """
+        Re-reads the registry and worksheet metadata. Tactic rows cached by this process are
+        dropped too, so the next load fetches every tactic sheet (e.g. after edits made by
+        hand in the spreadsheet, which do not update the shard manifest).
+        """
+        with _registry_lock:
+            _registries.pop(self.sh.id, None)
+        for key in [k for k in _tactic_rows if k[0] == self.sh.id]:
+            _tactic_rows.pop(key, None)
+        self._refresh_worksheets()
+        if reselect:
+            self.select_cycle(self.cycle_info.id if self.cycle_info.id in self.registry else DEFAULT_CYCLE_ID)
+
+    def _refresh_worksheets(self):
+        self._worksheets = {ws.title: ws for ws in self.sh.worksheets()}
+        self._worksheets_read_at = time.monotonic()
+
+    def _worksheet(self, title: str) -> gspread.Worksheet:
+        if title not in self._worksheets:
+            raise gspread.WorksheetNotFound(title)
+        return self._worksheets[title]
+
+    def _add_worksheet(self, title: str, rows: int, cols: int) -> gspread.Worksheet:
+        ws = self.sh.add_worksheet(title=title, rows=rows, cols=cols)
+        self._worksheets[title] = ws
+        return ws
+
+    def _delete_worksheet(self, title: str):
+        ws = self._worksheets.pop(title, None)
+        if ws is not None:
+            self.sh.del_worksheet(ws)
+
+    def _tactic_shard_titles(self) -> List[str]:
+        return sorted(t for t in self._worksheets if t.startswith(self._title(SHARD_PREFIX)))
+
+    def _tactic_sheets(self) -> Tuple[Dict[str, Optional[str]], Optional[str]]:
+        """
+        The worksheets holding the tactics (main sheet first) with the digest of their rows as of
+        the last save, per the shard manifest, and the Shard_By they were split with. Without a
+        manifest (never sharded, or sharded by an older build) shards are found by title and
+        their digests are unknown.
+        """
+        if time.monotonic() - self._worksheets_read_at > REGISTRY_TTL:
+            # Long-lived Storages (StoragePool) would otherwise miss shards created since
+            self._refresh_worksheets()
+        records = self._read_manifest()
+        if any(str(r["Shard"]) not in self._worksheets for r in records):
+            self._refresh_worksheets()
+        sheets: Dict[str, Optional[str]] = {self.worksheet.title: None}
+        shard_by = None
+        for r in records:
+            title = str(r["Shard"])
+            # A listed sheet may be gone if its deletion and the manifest update interleaved
+            if title in self._worksheets:
+                sheets[title] = str(r.get("Digest") or "") or None
+                shard_by = str(r.get("Shard_By") or "") or None
+        if not records:
+            sheets.update({t: None for t in self._tactic_shard_titles()})
+        return sheets, shard_by
+
+    def _read_manifest(self) -> List[dict]:
+        try:
+            return self._worksheet(self._title(SHARD_MANIFEST_NAME)).get_all_records()
+        except gspread.WorksheetNotFound:
+            return []
 
-            # Initialize Metrics Worksheet
-            try:
-                self.metrics_worksheet = self.sh.worksheet("Metrics")
-            except gspread.WorksheetNotFound:
-                self.metrics_worksheet = self.sh.add_worksheet(title="Metrics", rows=50, cols=9)
-                self.metrics_worksheet.append_row(["Goal_ID", "Metric_ID", "Title", "Type", "Starting_Value", "Target_Value", "Current_Value", "Unit", "Last_Updated"])
-            
-        except Exception as e:
-            st.error(f"Database Connection Error: {e}")
-            st.stop()
-    
     def get_cycle(self) -> Cycle:
         """
         Loads the cycle from Google Sheets.
+        All worksheets are fetched concurrently, so latency is roughly that of the slowest one.
         """
         try:
-            # 1. Load Tactics
-            data = self.worksheet.get_all_records()
-            if not data:
-                cycle = self._create_default_cycle()
-            else:
-                df = pd.DataFrame(data)
-                cycle = self._reconstruct_cycle(df)
-            
-            # 2. Load Vision
-            try:
-                vision_data = self.vision_worksheet.get_all_records()
-                for row in vision_data:
-                    if row.get('Type') == '3_Year':
-                        cycle.vision_3_year = str(row.get('Content', ''))
-                    elif row.get('Type') == '1_Year':
-                        cycle.vision_1_year = str(row.get('Content', ''))
-            except Exception as v_err:
-                print(f"Vision load error: {v_err}")
-
-            # 3. Load Reviews
-            try:
-                from src.models import WeeklyReview # Import here to avoid circular issues if any
-                review_data = self.reviews_worksheet.get_all_records()
-                for row in review_data:
-                    # Basic validation
-                    if row.get('Week_Num'):
-                        cycle.reviews.append(WeeklyReview(
-                            week_num=int(row['Week_Num']),
-                            score=float(row['Score']),
-                            wins=str(row.get('Wins', '')),
-                            lessons=str(row.get('Lessons', '')),
-                            date_submitted=date.fromisoformat(str(row['Date_Submitted'])) if row.get('Date_Submitted') else date.today()
-                        ))
-            except Exception as r_err:
-                print(f"Reviews load error: {r_err}")
-
-            # 4. Load Metrics
-            try:
-                from src.models import Metric, MetricType
-                metric_data = self.metrics_worksheet.get_all_records()
-                
-                # Create a map of Goal_ID -> List[Metric]
-                metrics_map = {}
-                for row in metric_data:
-                    g_id = str(row['Goal_ID'])
-                    if g_id not in metrics_map:
-                        metrics_map[g_id] = []
-                    
-                    try:
-                        m = Metric(
-                            id=str(row['Metric_ID']),
-                            title=str(row['Title']),
-                            type=MetricType(row['Type']),
-                            starting_value=float(row['Starting_Value']) if row['Starting_Value'] != '' else 0.0,
-                            target_value=float(row['Target_Value']),
-                            current_value=float(row['Current_Value']) if row['Current_Value'] != '' else 0.0,
-                            unit=str(row.get('Unit', '')),
-                            last_updated=date.fromisoformat(str(row['Last_Updated'])) if row.get('Last_Updated') else date.today()
-                        )
-                        metrics_map[g_id].append(m)
-                    except Exception as m_parse_err:
-                        print(f"Error parsing metric row {row}: {m_parse_err}")
-
-                # Attach metrics to goals
-                for goal in cycle.goals:
-                    if goal.id in metrics_map:
-                        goal.metrics = metrics_map[goal.id]
-
-            except Exception as m_err:
-                print(f"Metrics load error: {m_err}")
-                
-            except Exception as m_err:
-                print(f"Metrics load error: {m_err}")
+            sheets, _ = self._tactic_sheets()
+            tactic_jobs, cached = self._tactic_jobs(sheets)
+            loaded = self._load_concurrently({
+                **tactic_jobs,
+                **self._section_jobs(["vision", "reviews", "metrics", "settings"]),
+                "Scores": (self.scores_worksheet, self._parse_scores),
+            }, required=list(tactic_jobs))
+            loaded.update(cached)
 
-            # 5. Load Strategic Blocks (Settings)
-            try:
-                from src.models import StrategicBlock
-                settings_data = self.settings_worksheet.get_all_records()
-                for row in settings_data:
-                    if row.get('Type') == 'StrategicBlock':
-                        cycle.strategic_blocks.append(StrategicBlock(
-                            day_of_week=str(row['Key']),
-                            start_time=str(row['Value']),
-                            end_time=str(row['Extra'])
-                        ))
-            except Exception as s_err:
-                print(f"Settings load error: {s_err}")
-                
+            cycle = self._merge_loaded_tactics(loaded, list(sheets))
+            for field, value in loaded.get("Vision", {}).items():
+                setattr(cycle, field, value)
+            cycle.reviews.extend(loaded.get("Reviews", []))
+            self._apply_metrics(cycle, loaded.get("Metrics", {}))
+            cycle.strategic_blocks.extend(loaded.get("Settings", []))
+
+            # Trust the materialized rollup only if it was computed from the tactic rows loaded
+            scores, source = loaded.get("Scores") or (None, "")
+            if scores is not None and source == self._tactics_digest(cycle, list(sheets)):
+                cycle.scores = scores
+            else:
+                cycle.rebuild_scores()
+            # Everything above mirrors the sheets; only later edits need saving
+            for section in MERGED_SECTIONS:
+                self._set_base(cycle, section, self._section_records(cycle, section))
+            cycle.mark_clean()
             return cycle
             
         except Exception as e:
-            st.error(f"Error loading data: {e}")
+            self.notifier.error(f"Error loading data: {e}")
             return self._create_default_cycle()
 
-    def save_cycle(self, cycle: Cycle):
+    def _tactic_jobs(self, sheets: Dict[str, Optional[str]], fresh: set = frozenset()) -> Tuple[Dict[str, Tuple[gspread.Worksheet, Callable]], Dict[str, Cycle]]:
+        """
+        Splits the tactic sheets into fetch jobs and partial cycles parsed from the rows this
+        process last read or wrote. A sheet is fetched when it is in `fresh`, or when its
+        manifest digest is unknown or no longer matches those rows.
+        """
+        jobs, cached = {}, {}
+        for title, digest in sheets.items():
+            hit = _tactic_rows.get((self.sh.id, title))
+            if title not in fresh and digest is not None and hit is not None and hit[0] == digest:
+                cached[title] = self._parse_tactics(hit[1])
+            else:
+                ws = self._worksheets[title]
+                jobs[title] = (ws, self._versioned(ws, "Tactics", self._parse_tactics))
+        return jobs, cached
+
+    def _touched_tactic_sheets(self, cycle: Cycle, sheets: Dict[str, Optional[str]], shard_by: Optional[str]) -> set:
+        """
+        The tactic sheets holding rows edited since the cycle was loaded or last saved, i.e. the
+        ones a save must read back before merging. Every sheet when the tactics are not sharded
+        or the edits change how they are sharded.
+        """
+        records = self._tactic_records(cycle)
+        if len(sheets) == 1 or len(self._plan_tactic_shards(records)) == 1 or shard_by != self.settings.get("tactic_shard_by", SHARD_BY):
+            return set(sheets)
+        key = MERGED_SECTIONS["tactics"][1]
+        base = cycle.base_rows("tactics")
+        touched, seen = set(), set()
+        for row in records:
+            seen.add(key(row))
+            b = base.get(key(row))
+            if content(row) != content(b):
+                touched.add(self._shard_title(row, shard_by))
+                if b is not None:
+                    touched.add(self._shard_title(b, shard_by))
+        touched |= {self._shard_title(b, shard_by) for k, b in base.items() if k not in seen}
+        return touched
+
+    def _section_jobs(self, sections: List[str]) -> Dict[str, Tuple[gspread.Worksheet, Callable]]:
+        jobs = {
+            "Vision": (self.vision_worksheet, self._parse_vision),
+            "Reviews": (self.reviews_worksheet, self._versioned(self.reviews_worksheet, "Reviews", self._parse_reviews)),
+            "Metrics": (self.metrics_worksheet, self._versioned(self.metrics_worksheet, "Metrics", self._parse_metrics)),
+            "Settings": (self.settings_worksheet, self._parse_settings),
+        }
+        return {MERGED_SECTIONS[s][0]: jobs[MERGED_SECTIONS[s][0]] for s in sections if s != "tactics"}
+
+    def _merge_loaded_tactics(self, loaded: Dict[str, Any], titles: List[str]) -> Cycle:
+        # Remember what each tactic sheet held so an unchanged save can skip it and a later
+        # load can reuse the rows while the manifest digest still matches
+        digests = {}
+        for title in titles:
+            records = self._tactic_records(loaded[title])
+            digests[title] = _digest(records)
+            _tactic_rows[(self.sh.id, title)] = (digests[title], records)
+        cycle = self._merge_tactic_shards([loaded[title] for title in titles])
+        _dedupe_ids([t for g in cycle.goals for t in g.tactics])
+        for title, digest in digests.items():
+            cycle.mark_persisted(title, digest)
+        return cycle
+
+    def _load_concurrently(self, jobs: Dict[str, Tuple[gspread.Worksheet, Callable]], required: List[str]) -> Dict[str, Any]:
+        """
+        Fetches the given worksheets in parallel (at most LOAD_CONCURRENCY at a time) and parses each one as it arrives.
+        A failure in a required sheet cancels the fetches still queued and is raised; other failures are logged and skipped.
+        """
+        results = {}
+        pool = ThreadPoolExecutor(max_workers=max(1, min(LOAD_CONCURRENCY, len(jobs))))
+        futures = {pool.submit(ws.get_all_records): name for name, (ws, _) in jobs.items()}
+        try:
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = jobs[name][1](future.result())
+                except Exception as e:
+                    if name in required:
+                        raise
+                    print(f"{name} load error: {e}", file=sys.stderr)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def save_cycle(self, cycle: Cycle) -> List[Conflict]:
         """
         Flattens the cycle object and writes it to Google Sheets.
+        Only sections changed since the last load or save are written, each merged with
+        the rows other sessions saved meanwhile (compare-and-swap on the row versions).
+        Returns the conflicting edits, which were not applied.
         """
-        # 1. Save Tactics
-        rows = []
-        for goal in cycle.goals:
-            for tactic in goal.tactics:
-                rows.append({
-                    "Goal_ID": goal.id,
-                    "Goal_Title": goal.title,
-                    "Tactic_ID": tactic.id,
-                    "Tactic_Title": tactic.title,
-                    "Due_Week": tactic.due_week,
-                    "Status": tactic.status,
-                    "Block_Type": tactic.block_type.value,
-                    "Is_Completed": tactic.is_completed
-                })
+        dirty = cycle.dirty_sections()
+        if not dirty:
+            self.notifier.toast("No changes to save.", icon="☁️")
+            return []
         
         try:
-            if not rows:
-                self.worksheet.clear()
-                headers = ["Goal_ID", "Goal_Title", "Tactic_ID", "Tactic_Title", "Due_Week", "Status", "Block_Type", "Is_Completed"]
-                self.worksheet.append_row(headers)
-            else:
-                df = pd.DataFrame(rows)
-                data_to_write = [df.columns.values.tolist()] + df.values.tolist()
-                self.worksheet.clear()
-                self.worksheet.update(data_to_write)
+            with _save_lock(self.sh.id):
+                conflicts, pulled, cleaned = self._merge_and_write(cycle, dirty)
+            # Sections edited by someone else while this save ran stay dirty
+            cycle.mark_clean(cleaned)
             
-            # 2. Save Vision
-            self.vision_worksheet.clear()
-            self.vision_worksheet.append_row(["Type", "Content"])
-            self.vision_worksheet.append_row(["3_Year", cycle.vision_3_year])
-            self.vision_worksheet.append_row(["1_Year", cycle.vision_1_year])
-
-            # 3. Save Reviews
-            self.reviews_worksheet.clear()
-            self.reviews_worksheet.append_row(["Week_Num", "Score", "Wins", "Lessons", "Date_Submitted"])
-            
-            review_rows = []
-            for r in cycle.reviews:
-                review_rows.append([
-                    r.week_num,
-                    r.score,
-                    r.wins,
-                    r.lessons,
-                    r.date_submitted.isoformat()
-                ])
+            if conflicts:
+                details = "; ".join(c.describe() for c in conflicts[:5])
+                more = f" (and {len(conflicts) - 5} more)" if len(conflicts) > 5 else ""
+                self.notifier.warning(f"{len(conflicts)} edit(s) conflicted with changes saved from another session and were not applied: {details}{more}")
+            if pulled:
+                self.notifier.toast(f"Merged {pulled} change(s) saved from another session.", icon="🔀")
+            self.notifier.toast("Saved to Google Sheets!", icon="☁️")
+            return conflicts
             
-            if review_rows:
-                self.reviews_worksheet.append_rows(review_rows)
+        except Exception as e:
+            self.notifier.error(f"Failed to save to Google Sheets: {e}")
+            return []
 
-            # 4. Save Metrics
-            self.metrics_worksheet.clear()
-            self.metrics_worksheet.append_row(["Goal_ID", "Metric_ID", "Title", "Type", "Starting_Value", "Target_Value", "Current_Value", "Unit", "Last_Updated"])
-            
-            metric_rows = []
-            for goal in cycle.goals:
-                for m in goal.metrics:
-                    metric_rows.append([
-                        goal.id,
-                        m.id,
-                        m.title,
-                        m.type.value,
-                        m.starting_value,
-                        m.target_value,
-                        m.current_value,
-                        m.unit,
-                        m.last_updated.isoformat()
-                    ])
-            
-            if metric_rows:
-                self.metrics_worksheet.append_rows(metric_rows)
+    def restore_cycle(self, cycle: Cycle) -> List[Conflict]:
+        """
+        Replaces the selected cycle's data with `cycle` (e.g. read from a snapshot).
+        Every section is written; rows the cycle does not have are deleted from the sheet.
+        """
+        current = self.get_cycle()
+        cycle.id = current.id
+        # Merging against what the sheet holds now makes every difference a local edit
+        for section in MERGED_SECTIONS:
+            cycle.set_base_rows(section, current.base_rows(section))
+        if cycle.start_date != self.cycle_info.start_date:
+            self.update_cycle(self.cycle_info.id, start_date=cycle.start_date)
+        cycle.mark_dirty(set(MERGED_SECTIONS) | {"scores"})
+        return self.save_cycle(cycle)
 
-            # 5. Save Strategic Blocks (Settings)
-            self.settings_worksheet.clear()
-            self.settings_worksheet.append_row(["Type", "Key", "Value", "Extra"])
-            
-            settings_rows = []
-            for sb in cycle.strategic_blocks:
-                settings_rows.append([
-                    "StrategicBlock",
-                    sb.day_of_week,
-                    sb.start_time,
-                    sb.end_time
-                ])
-            
-            if settings_rows:
-                self.settings_worksheet.append_rows(settings_rows)
-                
-            st.toast("Saved to Google Sheets!", icon="☁️")
+    def _merge_and_write(self, cycle: Cycle, dirty: set) -> Tuple[List[Conflict], int, set]:
+        """
+        Reads back the dirty sections, merges them with the local edits and writes the result.
+        Returns (conflicts, rows pulled from other sessions, sections now in sync).
+        """
+        sections = [s for s in MERGED_SECTIONS if s in dirty]
+        sheets, tactic_jobs, cached = {}, {}, {}
+        if "tactics" in dirty:
+            # Only the shards holding edited rows are read back; the others are taken as of
+            # their manifest digest (fetched only if another session changed them). The sheet
+            # listing is refreshed first, so shards and manifest rows other sessions added are seen
+            self._refresh_worksheets()
+            sheets, shard_by = self._tactic_sheets()
+            tactic_jobs, cached = self._tactic_jobs(sheets, fresh=self._touched_tactic_sheets(cycle, sheets, shard_by))
+        jobs = {**tactic_jobs, **self._section_jobs(sections)}
+        if "Settings" in jobs:
+            # Read as is, so rows other than Strategic Blocks (e.g. the legacy cycle start
+            # date) can be written back unchanged
+            jobs["Settings"] = (self.settings_worksheet, list)
+        loaded = self._load_concurrently(jobs, required=list(jobs))
+        loaded.update(cached)
+
+        remote = self._create_default_cycle()
+        if sheets:
+            # Shard digests now describe the sheet as it is, so only shards that differ are written
+            remote = self._merge_loaded_tactics(loaded, list(sheets))
+            for title in sheets:
+                cycle.mark_persisted(title, remote.persisted_digest(title))
+        for field, value in loaded.get("Vision", {}).items():
+            setattr(remote, field, value)
+        remote.reviews = loaded.get("Reviews", [])
+        settings_rows = loaded.get("Settings", [])
+        remote.strategic_blocks = self._parse_settings(settings_rows)
+        remote_metrics = loaded.get("Metrics", {})
+
+        now = datetime.now().isoformat(timespec="seconds")
+        conflicts: List[Conflict] = []
+        pulled = 0
+        cleaned = set(dirty)
+        for section in sections:
+            sheet, key, label = MERGED_SECTIONS[section]
+            remote_rows = self._metric_records(remote_metrics) if section == "metrics" else self._section_records(remote, section)
+            result = merge_rows(
+                sheet, cycle.base_rows(section), self._section_records(cycle, section), remote_rows,
+                key=key, now=now, versioned=sheet in VERSIONED_SHEETS, label=label,
+            )
+            conflicts += result.conflicts
+            pulled += result.pulled
+            if section == "tactics" or result.rows != remote_rows:
+                kept = [r for r in settings_rows if r.get("Type") != "StrategicBlock"] if section == "settings" else []
+                self._write_section(cycle, section, result.rows + kept)
+            cleaned |= self._apply_merged(cycle, section, result.rows, rebuild=bool(result.pulled or result.conflicts))
+            # Rows the cycle cannot hold (metrics of goals it does not have) stay out of the
+            # base, so the next save keeps them instead of deleting them
+            self._set_base(cycle, section, self._section_records(cycle, section))
+
+        # Scores rollup, recounted from the tactics just written and stamped with their digest
+        if "tactics" in dirty:
+            cycle.rebuild_scores()
+        if dirty & {"tactics", "scores"}:
+            source = self._tactics_digest(cycle, [self.worksheet.title] + self._tactic_shard_titles())
+            _overwrite(self.scores_worksheet, [SCORE_COLUMNS] + self._score_rows(cycle.scores, source))
+            cleaned.add("scores")
             
-        except Exception as e:
-            st.error(f"Failed to save to Google Sheets: {e}")
+        if dirty & set(SECTION_KINDS):
+            self._update_search_index(cycle, dirty & set(SECTION_KINDS))
+        return conflicts, pulled, cleaned
 
-    def _reconstruct_cycle(self, df: pd.DataFrame) -> Cycle:
+    def _write_section(self, cycle: Cycle, section: str, rows: List[dict]):
+        if section == "tactics":
+            self._save_tactic_shards(cycle, rows)
+        elif section == "vision":
+            _overwrite(self.vision_worksheet, [["Type", "Content"]] + [[r["Type"], r["Content"]] for r in rows])
+        elif section == "reviews":
+            _overwrite(self.reviews_worksheet, to_rows("Reviews", rows))
+        elif section == "metrics":
+            _overwrite(self.metrics_worksheet, to_rows("Metrics", rows))
+        elif section == "settings":
+            # 5. Strategic Blocks (Settings), followed by any other rows the sheet held
+            _overwrite(self.settings_worksheet, [["Type", "Key", "Value", "Extra"]] + [[r.get("Type", ""), r.get("Key", ""), r.get("Value", ""), r.get("Extra", "")] for r in rows])
+
+    def _apply_merged(self, cycle: Cycle, section: str, rows: List[dict], rebuild: bool) -> set:
+        """
+        Brings the cycle in line with the rows just written. Without changes pulled from the
+        sheet only the row versions are updated, so the objects the UI holds stay valid.
+        Returns the sections whose fields were reassigned.
+        """
+        if not rebuild:
+            if section in ("tactics", "reviews", "metrics"):
+                key = MERGED_SECTIONS[section][1]
+                meta = {key(r): (r[VERSION_COLUMN], r[UPDATED_COLUMN]) for r in rows}
+                for row_key, obj in self._row_objects(cycle, section):
+                    if row_key in meta:
+                        obj.set_row_meta(*meta[row_key])
+            return set()
+        if section == "tactics":
+            metrics = {g.id: g.metrics for g in cycle.goals}
+            goals = self._parse_tactics(rows).goals
+            for goal in goals:
+                goal.metrics = metrics.get(goal.id, [])
+            # Goals without tactics have no rows yet
+            present = {g.id for g in goals}
+            goals += [g for g in cycle.goals if not g.tactics and g.id not in present]
+            cycle.goals = goals
+            cycle.rebuild_scores()
+            return {"tactics", "metrics", "scores"}
+        if section == "vision":
+            for field, value in self._parse_vision(rows).items():
+                setattr(cycle, field, value)
+        elif section == "reviews":
+            cycle.reviews = self._parse_reviews(rows)
+        elif section == "metrics":
+            self._apply_metrics(cycle, self._parse_metrics(rows))
+        elif section == "settings":
+            cycle.strategic_blocks = self._parse_settings(rows)
+        return {section}
+
+    def _row_objects(self, cycle: Cycle, section: str):
+        if section == "tactics":
+            return [(t.id, t) for g in cycle.goals for t in g.tactics]
+        if section == "reviews":
+            return [(str(r.week_num), r) for r in cycle.reviews]
+        return [(m.id, m) for g in cycle.goals for m in g.metrics]
+
+    def _set_base(self, cycle: Cycle, section: str, rows: List[dict]):
+        key = MERGED_SECTIONS[section][1]
+        cycle.set_base_rows(section, {key(r): r for r in rows})
+
+    def versioned_worksheets(self) -> List[Tuple[str, gspread.Worksheet]]:
         """
-        Rebuilds the Cycle object hierarchy from the flat DataFrame.
+        Returns (sheet kind, worksheet) for every schema-versioned worksheet, archives included.
         """
-        # Ensure columns exist (handle potential schema drift)
-        expected_cols = ["Goal_ID", "Goal_Title", "Tactic_ID", "Tactic_Title", "Due_Week", "Status", "Block_Type", "Is_Completed"]
-        for col in expected_cols:
-            if col not in df.columns:
-                df[col] = None # Fill missing cols
+        found = []
+        for ws in self.sh.worksheets():
+            base = ws.title.split(":", 1)[-1]
+            for sheet in VERSIONED_SHEETS:
+                if base == sheet or base.startswith(f"{sheet}_") or base.startswith(f"{sheet}#"):
+                    found.append((sheet, ws))
+        return found
 
+    def write_migrated(self, ws: gspread.Worksheet, sheet: str, records: List[dict]):
+        _overwrite(ws, to_rows(sheet, records))
+
+    def _versioned(self, ws: gspread.Worksheet, sheet: str, parser: Callable) -> Callable:
+        """
+        Wraps a strict parser so outdated sheets are migrated (and written back once) before parsing.
+        """
+        def parse(records: List[dict]):
+            version = detect_version(records)
+            if version is not None and version < SCHEMA_VERSION:
+                records = migrate_records(sheet, records, version)
+                try:
+                    self.write_migrated(ws, sheet, records)
+                    print(f"Migrated {ws.title} from schema v{version} to v{SCHEMA_VERSION}", file=sys.stderr)
+                except Exception as e:
+                    print(f"Migration write-back failed for {ws.title}: {e}", file=sys.stderr)
+            return parser(records)
+        return parse
+
+    def _parse_tactics(self, data: List[dict]) -> Cycle:
+        """
+        Rebuilds the Cycle object hierarchy from current-schema Tactics rows.
+        """
         goals_map = {}
         
-        for _, row in df.iterrows():
+        for row in data:
             g_id = str(row["Goal_ID"])
             
             # Create Goal if not exists
-            if g_id not in goals_map:
-                goals_map[g_id] = Goal(
-                    id=g_id,
-                    title=str(row["Goal_Title"]) if pd.notna(row["Goal_Title"]) else "Untitled Goal",
-                    tactics=[]
-                )
+            goal = goals_map.get(g_id)
+            if goal is None:
+                goal = goals_map[g_id] = Goal.model_construct(id=g_id, title=str(row["Goal_Title"]), tactics=[], metrics=[])
             
             # Create Tactic
-            if pd.notna(row["Tactic_ID"]) and str(row["Tactic_ID"]) != "":
-                # Handle boolean conversion safely
-                is_comp = row["Is_Completed"]
-                if isinstance(is_comp, str):
-                    is_comp = is_comp.lower() == 'true'
-                
-                # Handle status mapping
-                raw_status = str(row["Status"]) if pd.notna(row["Status"]) else "Not Started"
-                if raw_status == "Pending":
-                    raw_status = "Not Started"
-                
-                tactic = Tactic(
+            if row["Tactic_ID"] != "":
+                goal.tactics.append(Tactic.model_construct(
                     id=str(row["Tactic_ID"]),
-                    title=str(row["Tactic_Title"]) if pd.notna(row["Tactic_Title"]) else "Untitled Tactic",
-                    due_week=int(row["Due_Week"]) if pd.notna(row["Due_Week"]) and row["Due_Week"] != "" else 1,
-                    status=raw_status,
-                    block_type=row["Block_Type"] if pd.notna(row["Block_Type"]) else "None",
-                    is_completed=bool(is_comp)
-                )
-                goals_map[g_id].tactics.append(tactic)
+                    title=str(row["Tactic_Title"]),
+                    due_week=int(row["Due_Week"]),
+                    status=TacticStatus(row["Status"]),
+                    block_type=BlockType(row["Block_Type"]),
+                    is_completed=row["Is_Completed"] in (True, "TRUE")
+                ))
+                goal.tactics[-1].set_row_meta(int(row[VERSION_COLUMN]), str(row[UPDATED_COLUMN]))
         
         return Cycle(
-            id="c1", 
-            start_date=date.today(),
+            id=self.cycle_info.id, 
+            start_date=self.cycle_info.start_date,
             goals=list(goals_map.values())
         )
 
+    def _parse_reviews(self, review_data: List[dict]) -> List[WeeklyReview]:
+        reviews = []
+        for row in review_data:
+            review = WeeklyReview.model_construct(
+                week_num=int(row['Week_Num']),
+                score=float(row['Score']),
+                wins=str(row['Wins']),
+                lessons=str(row['Lessons']),
+                date_submitted=date.fromisoformat(str(row['Date_Submitted']))
+            )
+            review.set_row_meta(int(row[VERSION_COLUMN]), str(row[UPDATED_COLUMN]))
+            reviews.append(review)
+        return reviews
+
+    def _parse_metrics(self, metric_data: List[dict]) -> Dict[str, List[Metric]]:
+        # Create a map of Goal_ID -> List[Metric]
+        metrics_map = {}
+        for row in metric_data:
+            metric = Metric.model_construct(
+                id=str(row['Metric_ID']),
+                title=str(row['Title']),
+                type=MetricType(row['Type']),
+                starting_value=float(row['Starting_Value']),
+                target_value=float(row['Target_Value']),
+                current_value=float(row['Current_Value']),
+                unit=str(row['Unit']),
+                last_updated=date.fromisoformat(str(row['Last_Updated']))
+            )
+            metric.set_row_meta(int(row[VERSION_COLUMN]), str(row[UPDATED_COLUMN]))
+            metrics_map.setdefault(str(row['Goal_ID']), []).append(metric)
+        _dedupe_ids([m for metrics in metrics_map.values() for m in metrics])
+        return metrics_map
+
+    def _tactic_records(self, cycle: Cycle) -> List[dict]:
+        records = []
+        for goal in cycle.goals:
+            for tactic in goal.tactics:
+                records.append({
+                    "Goal_ID": goal.id,
+                    "Goal_Title": goal.title,
+                    "Tactic_ID": tactic.id,
+                    "Tactic_Title": tactic.title,
+                    "Due_Week": tactic.due_week,
+                    "Status": tactic.status.value,
+                    "Block_Type": tactic.block_type.value,
+                    "Is_Completed": tactic.is_completed,
+                    VERSION_COLUMN: tactic.row_version,
+                    UPDATED_COLUMN: tactic.row_updated_at,
+                })
+        return records
+
+    def _review_records(self, reviews: List[WeeklyReview]) -> List[dict]:
+        return [{
+            "Week_Num": r.week_num,
+            "Score": r.score,
+            "Wins": r.wins,
+            "Lessons": r.lessons,
+            "Date_Submitted": r.date_submitted.isoformat(),
+            VERSION_COLUMN: r.row_version,
+            UPDATED_COLUMN: r.row_updated_at,
+        } for r in reviews]
+
+    def _metric_records(self, metrics_map: Dict[str, List[Metric]]) -> List[dict]:
+        records = []
+        for goal_id, metrics in metrics_map.items():
+            for m in metrics:
+                records.append({
+                    "Goal_ID": goal_id,
+                    "Metric_ID": m.id,
+                    "Title": m.title,
+                    "Type": m.type.value,
+                    "Starting_Value": m.starting_value,
+                    "Target_Value": m.target_value,
+                    "Current_Value": m.current_value,
+                    "Unit": m.unit,
+                    "Last_Updated": m.last_updated.isoformat(),
+                    VERSION_COLUMN: m.row_version,
+                    UPDATED_COLUMN: m.row_updated_at,
+                })
+        return records
+
+    def _section_records(self, cycle: Cycle, section: str) -> List[dict]:
+        """
+        The rows a section of the cycle is saved as.
+        """
+        if section == "tactics":
+            return self._tactic_records(cycle)
+        if section == "vision":
+            return [{"Type": "3_Year", "Content": cycle.vision_3_year}, {"Type": "1_Year", "Content": cycle.vision_1_year}]
+        if section == "reviews":
+            return self._review_records(cycle.reviews)
+        if section == "metrics":
+            return self._metric_records({g.id: g.metrics for g in cycle.goals})
+        return [{"Type": "StrategicBlock", "Key": sb.day_of_week, "Value": sb.start_time, "Extra": sb.end_time}
+                for sb in cycle.strategic_blocks]
+
+    # --- Tactic sharding ---
+
+    def _plan_tactic_shards(self, records: List[dict]) -> Dict[str, List[dict]]:
+        """
+        Splits tactic rows into {worksheet title: rows}.
+        Below the threshold everything stays in the main Tactics sheet (left empty once sharded).
+        """
+        threshold = int(self.settings.get("tactic_shard_threshold", SHARD_THRESHOLD))
+        if len(records) <= threshold:
+            return {self._title(WORKSHEET_NAME): records}
+        shard_by = self.settings.get("tactic_shard_by", SHARD_BY)
+        shards: Dict[str, List[dict]] = {self._title(WORKSHEET_NAME): []}
+        for r in records:
+            shards.setdefault(self._shard_title(r, shard_by), []).append(r)
+        return shards
+
+    def _shard_title(self, row: dict, shard_by: str) -> str:
+        key = f"w{int(row['Due_Week']):02d}" if shard_by == "week" else str(row["Goal_ID"])
+        return self._title(f"{SHARD_PREFIX}{key}")
+
+    def _save_tactic_shards(self, cycle: Cycle, records: List[dict]):
+        """
+        Writes only the shards whose rows changed since they were last loaded or saved,
+        removes shards that are no longer needed and refreshes the manifest.
+        """
+        shards = self._plan_tactic_shards(records)
+        written = set()
+        for title, rows in shards.items():
+            digest = _digest(rows)
+            if cycle.persisted_digest(title) == digest and title in self._worksheets:
+                continue
+            ws = self._worksheets.get(title) or self._add_worksheet(title, rows=len(rows) + 1, cols=len(headers("Tactics")))
+            _overwrite(ws, to_rows("Tactics", rows))
+            cycle.mark_persisted(title, digest)
+            _tactic_rows[(self.sh.id, title)] = (digest, [dict(r) for r in rows])
+            written.add(title)
+
+        # Only shards this save read back and merged can be emptied; one another session
+        # created since then holds rows this cycle has not seen
+        deleted = [t for t in self._tactic_shard_titles() if t not in shards and cycle.persisted_digest(t) is not None]
+        for title in deleted:
+            self._delete_worksheet(title)
+            cycle.mark_persisted(title, None)
+            _tactic_rows.pop((self.sh.id, title), None)
+
+        manifest_title = self._title(SHARD_MANIFEST_NAME)
+        if len(shards) == 1 and manifest_title not in self._worksheets:
+            return
+        self._write_manifest(cycle, shards, written, deleted)
+
+    def _write_manifest(self, cycle: Cycle, shards: Dict[str, List[dict]], written: set, deleted: List[str]):
+        """
+        Merges this save into the manifest as the sheet holds it now: rows of shards written
+        here are replaced, rows of deleted shards removed, and every other row (including
+        shards this process does not know about) kept as it is.
+        """
+        current = {str(r["Shard"]): [str(r["Shard"]), int(r.get("Rows") or 0), str(r.get("Shard_By") or ""), str(r.get("Digest") or "")]
+                   for r in self._read_manifest()}
+        shard_by = self.settings.get("tactic_shard_by", SHARD_BY)
+        manifest = {}
+        for title, rows in shards.items():
+            if title in written or title not in current:
+                manifest[title] = [title, len(rows), shard_by, cycle.persisted_digest(title) or ""]
+            else:
+                # Another session may have saved it since the read-back; its digest is newer
+                manifest[title] = current[title]
+        for title, row in current.items():
+            if title not in manifest and title not in deleted:
+                manifest[title] = row
+        if list(manifest.values()) != list(current.values()):
+            try:
+                ws = self._worksheet(self._title(SHARD_MANIFEST_NAME))
+            except gspread.WorksheetNotFound:
+                ws = self._add_worksheet(self._title(SHARD_MANIFEST_NAME), rows=len(manifest) + 1, cols=4)
+            _overwrite(ws, [["Shard", "Rows", "Shard_By", "Digest"]] + list(manifest.values()))
+
+    def _merge_tactic_shards(self, parts: List[Cycle]) -> Cycle:
+        """
+        Combines the partial cycles parsed from the main Tactics sheet and its shards.
+        """
+        cycle = parts[0]
+        goals = {g.id: g for g in cycle.goals}
+        for part in parts[1:]:
+            for goal in part.goals:
+                if goal.id in goals:
+                    goals[goal.id].tactics.extend(goal.tactics)
+                else:
+                    goals[goal.id] = goal
+                    cycle.goals.append(goal)
+        return cycle
+
+    def _tactics_digest(self, cycle: Cycle, titles: List[str]) -> str:
+        """
+        Digest of the rows of every tactic sheet, as last loaded or saved. Stored with the
+        Scores rollup so a load can tell whether the rollup still matches the tactics.
+        """
+        return _digest(sorted(cycle.persisted_digest(title) or "" for title in titles))
+
+    def _score_rows(self, scores: ScoreRollup, source: str) -> List[list]:
+        rows = [["Source", source, 0, 0], ["Cycle", "", scores.cycle.total, scores.cycle.completed]]
+        rows += [["Week", w, c.total, c.completed] for w, c in sorted(scores.weeks.items())]
+        rows += [["Goal", g_id, c.total, c.completed] for g_id, c in scores.goals.items()]
+        rows += [["GoalWeek", f"{g_id}|{w}", c.total, c.completed]
+                 for g_id, weeks in scores.goal_weeks.items() for w, c in sorted(weeks.items())]
+        return rows
+
+    def _parse_scores(self, score_data: List[dict]) -> Tuple[Optional[ScoreRollup], str]:
+        """
+        Returns the rollup and the digest of the tactic rows it was computed from
+        ("" if not recorded).
+        """
+        if not score_data:
+            return None, ""
+        scores = ScoreRollup()
+        source = ""
+        for row in score_data:
+            count = ScoreCount(total=int(row['Total']), completed=int(row['Completed']))
+            if row['Scope'] == 'Source':
+                source = str(row['Key'])
+            elif row['Scope'] == 'Cycle':
+                scores.cycle = count
+            elif row['Scope'] == 'Week':
+                scores.weeks[int(row['Key'])] = count
+            elif row['Scope'] == 'Goal':
+                scores.goals[str(row['Key'])] = count
+            elif row['Scope'] == 'GoalWeek':
+                g_id, _, week = str(row['Key']).rpartition("|")
+                scores.goal_weeks.setdefault(g_id, {})[int(week)] = count
+        if scores.cycle.total and not scores.goal_weeks:
+            # Saved before per-goal week counts existed; rebuilt from the tactics instead
+            return None, source
+        return scores, source
+
+    def _apply_metrics(self, cycle: Cycle, metrics_map: Dict[str, List[Metric]]):
+        # Attach metrics to goals
+        for goal in cycle.goals:
+            goal.metrics = metrics_map.get(goal.id, [])
+
+    def _parse_vision(self, vision_data: List[dict]) -> Dict[str, str]:
+        vision = {}
+        for row in vision_data:
+            if row.get('Type') == '3_Year':
+                vision["vision_3_year"] = str(row.get('Content', ''))
+            elif row.get('Type') == '1_Year':
+                vision["vision_1_year"] = str(row.get('Content', ''))
+        return vision
+
+    def _parse_settings(self, settings_data: List[dict]) -> List[StrategicBlock]:
+        blocks = []
+        for row in settings_data:
+            if row.get('Type') == 'StrategicBlock':
+                blocks.append(StrategicBlock(
+                    day_of_week=str(row['Key']),
+                    start_time=str(row['Value']),
+                    end_time=str(row['Extra'])
+                ))
+        return blocks
+
     def _create_default_cycle(self) -> Cycle:
-        return Cycle(id="c1", start_date=date.today(), goals=[])
+        return Cycle(id=self.cycle_info.id, start_date=self.cycle_info.start_date, goals=[])
 
     def create_calendar_event(self, title: str, start_datetime: str, duration_minutes: int = 60):
         """
         Creates an event in the primary calendar.
         start_datetime should be ISO format string (e.g. '2023-11-21T10:00:00')
         """
+        if self.transport is None:
+            return False, "Calendar is not available with the in-memory storage backend"
         try:
             start_time = datetime.fromisoformat(start_datetime)
             end_time = start_time + timedelta(minutes=duration_minutes)
@@ -344,9 +1116,9 @@ class Storage:
             }
 
             # Get Calendar ID from secrets, default to 'primary' (which is the service account's calendar)
-            calendar_id = st.secrets["connections"]["gsheets"].get("calendar_id", "primary")
+            calendar_id = self.settings.get("calendar_id", "primary")
 
-            event = self.calendar_service.events().insert(calendarId=calendar_id, body=event).execute()
+            event = insert_calendar_event(self.transport, calendar_id, event)
             return True, event.get('htmlLink')
         except Exception as e:
             return False, str(e)
@@ -356,48 +1128,220 @@ class Storage:
         Archives the current cycle by duplicating sheets and clearing active ones.
         """
         try:
-            archive_suffix = f"_{date.today().strftime('%Y-%m-%d')}"
+            archive_label = date.today().strftime(ARCHIVE_DATE_FORMAT)
             
-            # 1. Duplicate Sheets
-            self.sh.duplicate_sheet(self.worksheet.id, new_sheet_name=f"Tactics{archive_suffix}")
-            self.sh.duplicate_sheet(self.reviews_worksheet.id, new_sheet_name=f"Reviews{archive_suffix}")
-            self.sh.duplicate_sheet(self.metrics_worksheet.id, new_sheet_name=f"Metrics{archive_suffix}")
+            # 1. Duplicate Sheets (sharded tactics are consolidated into one archive tab)
+            shard_titles = self._tactic_shard_titles()
+            if shard_titles:
+                records = self._tactic_records(cycle)
+                archive_ws = self._add_worksheet(self._title(f"Tactics_{archive_label}"), rows=len(records) + 1, cols=len(headers("Tactics")))
+                archive_ws.update(to_rows("Tactics", records))
+            else:
+                self.sh.duplicate_sheet(self.worksheet.id, new_sheet_name=self._title(f"Tactics_{archive_label}"))
+            self.sh.duplicate_sheet(self.reviews_worksheet.id, new_sheet_name=self._title(f"Reviews_{archive_label}"))
+            self.sh.duplicate_sheet(self.metrics_worksheet.id, new_sheet_name=self._title(f"Metrics_{archive_label}"))
             
             # 2. Clear Active Sheets (Keep Headers)
             # Tactics
-            self.worksheet.clear()
-            self.worksheet.append_row(["Goal_ID", "Goal_Title", "Tactic_ID", "Tactic_Title", "Due_Week", "Status", "Block_Type", "Is_Completed"])
+            _overwrite(self.worksheet, [headers("Tactics")])
+            for title in shard_titles + [self._title(SHARD_MANIFEST_NAME)]:
+                self._delete_worksheet(title)
+            for title in [self.worksheet.title] + shard_titles:
+                cycle.mark_persisted(title, None)
+                _tactic_rows.pop((self.sh.id, title), None)
             
             # Reviews
-            self.reviews_worksheet.clear()
-            self.reviews_worksheet.append_row(["Week_Num", "Score", "Wins", "Lessons", "Date_Submitted"])
+            _overwrite(self.reviews_worksheet, [headers("Reviews")])
             
             # Metrics
-            self.metrics_worksheet.clear()
-            self.metrics_worksheet.append_row(["Goal_ID", "Metric_ID", "Title", "Type", "Starting_Value", "Target_Value", "Current_Value", "Unit", "Last_Updated"])
+            _overwrite(self.metrics_worksheet, [headers("Metrics")])
+            
+            # Scores
+            _overwrite(self.scores_worksheet, [SCORE_COLUMNS])
             
             # Note: We do NOT clear Vision or Settings as those persist or evolve.
             
-            st.toast("Cycle Archived Successfully!", icon="📦")
+            # The partition now holds the next cycle, starting today
+            self.update_cycle(self.cycle_info.id, start_date=date.today())
+            
+            # 3. Move the cycle's search documents under the archive label
+            try:
+                index = self.search_index()
+                with index_lock():
+                    index.relabel_cycle(cycle.id, self._archive_search_label(archive_label))
+                self._persist_search_index(index)
+            except Exception as idx_err:
+                print(f"Search index archive error: {idx_err}", file=sys.stderr)
+            
+            self.notifier.toast("Cycle Archived Successfully!", icon="📦")
             return True
         except Exception as e:
-            st.error(f"Archival Failed: {e}")
+            self.notifier.error(f"Archival Failed: {e}")
             return False
 
+    def list_archived_cycles(self) -> List[str]:
+        """
+        Returns the labels (archive dates) of all archived cycles, oldest first.
+        """
+        prefix = self._title(f"{WORKSHEET_NAME}_")
+        labels = []
+        for ws in self.sh.worksheets():
+            if not ws.title.startswith(prefix):
+                continue
+            label = ws.title[len(prefix):]
+            try:
+                datetime.strptime(label, ARCHIVE_DATE_FORMAT)
+            except ValueError:
+                continue
+            labels.append(label)
+        return sorted(labels)
+
+    def get_archived_cycle(self, label: str) -> Cycle:
+        """
+        Loads an archived cycle from its dated Tactics/Reviews/Metrics tabs.
+        """
+        jobs = {}
+        for name, parser in (("Tactics", self._parse_tactics), ("Reviews", self._parse_reviews), ("Metrics", self._parse_metrics)):
+            try:
+                ws = self.sh.worksheet(self._title(f"{name}_{label}"))
+                jobs[name] = (ws, self._versioned(ws, name, parser))
+            except gspread.WorksheetNotFound:
+                if name == "Tactics":
+                    raise
+        loaded = self._load_concurrently(jobs, required=["Tactics"])
+
+        cycle = loaded["Tactics"]
+        cycle.id = label
+        # Start dates of archived cycles are not recorded; archives are taken at the end of week 12
+        cycle.start_date = datetime.strptime(label, ARCHIVE_DATE_FORMAT).date() - timedelta(weeks=12)
+        cycle.reviews.extend(loaded.get("Reviews", []))
+        self._apply_metrics(cycle, loaded.get("Metrics", {}))
+        cycle.mark_clean()
+        return cycle
+
+    def iter_archived_cycles(self):
+        """
+        Yields (label, Cycle) for every archived cycle, loading one at a time.
+        """
+        for label in self.list_archived_cycles():
+            yield label, self.get_archived_cycle(label)
+
+    # --- Search ---
+
+    def search_index(self) -> SearchIndex:
+        """
+        Returns the search index for this spreadsheet, shared by every session of the process.
+        It is read from the Search_Index sheet once, and built from all cycles if that sheet is empty.
+        """
+        return get_shared_index(self.sh.id, self._load_search_index)
+
+    def _search_worksheet(self) -> gspread.Worksheet:
+        try:
+            return self._worksheet(SEARCH_WORKSHEET_NAME)
+        except gspread.WorksheetNotFound:
+            ws = self._add_worksheet(SEARCH_WORKSHEET_NAME, rows=BUCKETS + 1, cols=2)
+            ws.append_row(SEARCH_COLUMNS)
+            return ws
+
+    def _load_search_index(self) -> SearchIndex:
+        try:
+            values = self._search_worksheet().get_all_values()
+            # Sheets in an older layout are rebuilt
+            if values and values[0][:1] == SEARCH_COLUMNS[:1]:
+                index = SearchIndex.from_rows((int(row[0]), [c for c in row[1:] if c]) for row in values[1:] if row and row[0])
+                if index.docs:
+                    return index
+        except Exception as e:
+            print(f"Search index load error: {e}", file=sys.stderr)
+        return self._build_search_index()
+
+    def _archive_search_label(self, label: str) -> str:
+        return label if self.cycle_info.id == DEFAULT_CYCLE_ID else f"{self.cycle_info.id}@{label}"
+
+    def _build_search_index(self) -> SearchIndex:
+        """
+        Indexes every live and archived cycle. Reads go through a Storage of its own, so the
+        cycle selected on this one (which may be in the middle of a save) never changes.
+        """
+        index = SearchIndex()
+        reader = Storage(self.settings, notifier=HeadlessNotifier())
+        for info in reader.list_cycles():
+            reader.select_cycle(info.id)
+            for label, archived in reader.iter_archived_cycles():
+                index.index_cycle(archived, reader._archive_search_label(label))
+            index.index_cycle(reader.get_cycle())
+        self._persist_search_index(index, full=True)
+        return index
+
+    def rebuild_search_index(self) -> SearchIndex:
+        """
+        Re-reads every live and archived sheet and replaces the shared index.
+        """
+        index = self._build_search_index()
+        with index_lock():
+            replace_shared_index(self.sh.id, index)
+        return index
+
+    def _persist_search_index(self, index: SearchIndex, full: bool = False):
+        """
+        Writes the rows of the buckets changed since the last write (every bucket if full).
+        Changed buckets are re-read and merged first, so documents another process wrote to
+        the same bucket are kept. Merging and serializing hold the index lock; reading and
+        writing the sheet do not.
+        """
+        with _search_write_lock:
+            with index_lock():
+                pending = index.take_pending()
+                if full:
+                    rows = {b: index.bucket_row(b) for b in range(BUCKETS)}
+            try:
+                ws = self._search_worksheet()
+                if full:
+                    _overwrite(ws, [SEARCH_COLUMNS] + [[b, *rows[b]] for b in range(BUCKETS)])
+                    return
+                if not pending:
+                    return
+                buckets = {bucket_of(doc_id) for doc_id in pending}
+                stored = {b: [] for b in buckets}
+                for row in ws.get_all_values()[1:]:
+                    if row and row[0] and int(row[0]) in stored:
+                        stored[int(row[0])] = [c for c in row[1:] if c]
+                with index_lock():
+                    rows = index.merge_bucket_rows(stored, pending)
+                _overwrite_rows(ws, {b + 1: [b, *chunks] for b, chunks in rows.items()})
+            except Exception:
+                with index_lock():
+                    index.pending.update(pending)
+                raise
+
+    def _update_search_index(self, cycle: Cycle, sections: Optional[set] = None):
+        try:
+            index = self.search_index()
+            with index_lock():
+                changed = index.index_cycle(cycle, sections=sections)
+            if changed:
+                self._persist_search_index(index)
+        except Exception as e:
+            print(f"Search index update error: {e}", file=sys.stderr)
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        index = self.search_index()
+        # Saves and archives of other sessions mutate the postings under the same lock
+        with index_lock():
+            return index.search(query, limit=limit)
+
     def save_vision_image(self, image_data: str):
         """
         Saves the base64 image string to the Vision_Images worksheet.
         """
         try:
-            self.vision_images_worksheet.clear()
-            self.vision_images_worksheet.append_row(["Type", "Base64_Data"])
             # Split data if too long? Cell limit is 50k chars. 
             # For now, assume it fits or user uploads small image.
             # We'll just save it in one cell for simplicity, but warn user if it fails.
-            self.vision_images_worksheet.append_row(["Main_Vision_Board", image_data])
+            _overwrite(self.vision_images_worksheet, [["Type", "Base64_Data"], ["Main_Vision_Board", image_data]])
             return True
         except Exception as e:
-            st.error(f"Failed to save image: {e}")
+            self.notifier.error(f"Failed to save image: {e}")
             return False
 
     def get_vision_image(self) -> str:
@@ -411,5 +1355,5 @@ class Storage:
                     return row.get('Base64_Data', '')
             return ""
         except Exception as e:
-            print(f"Image load error: {e}")
+            print(f"Image load error: {e}", file=sys.stderr)
             return ""
@@ -0,0 +1,120 @@
+"""
+One pooled, authorized HTTP session per service account, shared by every Storage in the process.
+
+Sheets (through gspread) and Calendar (plain REST) both go through it, so TLS
+connections are kept alive and reused across sessions and reruns, responses
+are gzip-compressed, and the access token is refreshed once, shortly before
+it expires, instead of by every client that notices it has gone stale.
+"""
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2.service_account import Credentials
+
+# Connections kept per host; sized for LOAD_CONCURRENCY parallel loads from several sessions
+POOL_SIZE = int(os.environ.get("TWELVE_WEEK_HTTP_POOL_SIZE", "32"))
+# Refresh the access token this long before it expires
+REFRESH_MARGIN = timedelta(minutes=5)
+CALENDAR_API = "https://www.googleapis.com/calendar/v3"
+
+
+class SharedTransport(AuthorizedSession):
+    """
+    AuthorizedSession with a larger keep-alive pool, gzip, a lock-guarded early token
+    refresh and request counters.
+    """
+    def __init__(self, credentials: Credentials):
+        super().__init__(credentials)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE)
+        self.mount("https://", adapter)
+        self._adapter = adapter
+        self.headers["Accept-Encoding"] = "gzip"
+        # Google APIs only compress responses for clients whose User-Agent mentions gzip
+        self.headers["User-Agent"] = "12-week-year (gzip)"
+        self._refresh_lock = threading.Lock()
+        self.requests_sent = 0
+        self.token_refreshes = 0
+
+    def _token_expiring(self) -> bool:
+        expiry = self.credentials.expiry
+        if not self.credentials.token or expiry is None:
+            return True
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return expiry - now < REFRESH_MARGIN
+
+    def ensure_token(self):
+        """
+        Refreshes the shared token once if it is missing or about to expire.
+        """
+        if not self._token_expiring():
+            return
+        with self._refresh_lock:
+            if self._token_expiring():
+                self.credentials.refresh(self._auth_request)
+                self.token_refreshes += 1
+
+    def request(self, method, url, *args, **kwargs):
+        self.ensure_token()
+        self.requests_sent += 1
+        return super().request(method, url, *args, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Requests sent versus TCP/TLS connections opened; the difference is connection reuse.
+        """
+        connections = 0
+        pooled_requests = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools[key]
+            connections += pool.num_connections
+            pooled_requests += pool.num_requests
+        return {
+            "requests": self.requests_sent,
+            "connections_opened": connections,
+            "connections_reused": max(0, pooled_requests - connections),
+            "token_refreshes": self.token_refreshes,
+        }
+
+
+_transports: Dict[Tuple[str, Tuple[str, ...]], SharedTransport] = {}
+_lock = threading.Lock()
+
+
+def get_transport(service_account: dict, scopes) -> SharedTransport:
+    """
+    Returns the process-wide transport for a service account, creating it on first use.
+    """
+    key = (service_account.get("client_email", ""), tuple(scopes))
+    with _lock:
+        if key not in _transports:
+            creds = Credentials.from_service_account_info(dict(service_account), scopes=list(scopes))
+            _transports[key] = SharedTransport(creds)
+        return _transports[key]
+
+
+def transport_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Stats of every shared transport, keyed by service account email.
+    """
+    with _lock:
+        return {email: t.stats() for (email, _), t in _transports.items()}
+
+
+def insert_calendar_event(transport: SharedTransport, calendar_id: str, event: dict, timeout: Optional[float] = 30) -> dict:
+    """
+    Calendar API events.insert over the shared transport.
+    """
+    response = transport.post(
+        f"{CALENDAR_API}/calendars/{requests.utils.quote(calendar_id, safe='')}/events",
+        json=event,
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return response.json()
@@ -0,0 +1,40 @@
+"""
+Tests run against the in-memory spreadsheet (src.memory_sheets); no credentials or network.
+"""
+import itertools
+import os
+import sys
+
+# Must be set before src.storage is imported
+os.environ["TWELVE_WEEK_STORAGE"] = "memory"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from src.memory_sheets import drop_memory_spreadsheet, open_memory_spreadsheet
+from src.storage import HeadlessNotifier, Storage
+
+_keys = itertools.count(1)
+
+
+@pytest.fixture
+def spreadsheet_key():
+    key = f"test-{next(_keys)}"
+    yield key
+    drop_memory_spreadsheet(key)
+
+
+@pytest.fixture
+def spreadsheet(spreadsheet_key):
+    return open_memory_spreadsheet(spreadsheet_key)
+
+
+@pytest.fixture
+def make_storage(spreadsheet_key):
+    """
+    Storage factory; every Storage made by one test shares that test's spreadsheet, like
+    sessions of one deployment would.
+    """
+    def make(**settings):
+        return Storage({"backend": "memory", "spreadsheet": spreadsheet_key, **settings}, notifier=HeadlessNotifier())
+    return make
@@ -0,0 +1,48 @@
+import json
+import threading
+from http.server import ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from src.api import ApiHandler, StoragePool
+
+
+@pytest.fixture
+def api(spreadsheet_key):
+    pool = StoragePool({"backend": "memory", "spreadsheet": spreadsheet_key}, size=1)
+    handler = type("BoundApiHandler", (ApiHandler,), {"pool": pool})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield pool, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def get(url: str):
+    try:
+        with urlopen(url) as response:
+            return response.status, json.load(response)
+    except HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_cycle_and_bad_request(api):
+    pool, base = api
+    status, cycle = get(f"{base}/cycle")
+    assert status == 200 and "goals" in cycle
+    assert get(f"{base}/reports/wam?format=XML")[0] == 400
+
+
+@pytest.mark.parametrize("error, status", [(RuntimeError("bug"), 500), (ConnectionError("reset"), 502)])
+def test_unexpected_errors_answer_with_json(api, monkeypatch, error, status):
+    pool, base = api
+
+    def fail(*args, **kwargs):
+        raise error
+    monkeypatch.setattr(pool, "list_cycles", fail)
+    code, body = get(f"{base}/cycles")
+    assert code == status
+    assert body == {"error": f"{type(error).__name__}: {error}"}
@@ -0,0 +1,85 @@
+import pytest
+
+from src.concurrency import DuplicateKeyError, merge_rows
+from src.models import Goal, Tactic
+
+NOW = "2026-03-02T10:00:00"
+
+
+def row(key: str, version: int = 1, **fields) -> dict:
+    return {"Id": key, "Title": f"Title {key}", "Week": 1, **fields, "Version": version, "Updated_At": ""}
+
+
+def merge(base, local, remote):
+    return merge_rows("Tactics", {r["Id"]: r for r in base}, local, remote, key=lambda r: r["Id"], now=NOW)
+
+
+def test_edits_on_one_side_are_taken():
+    base = [row("a"), row("b")]
+    result = merge(base, [row("a", Title="Local"), row("b")], [row("a"), row("b", 2, Week=3)])
+    assert [(r["Title"], r["Week"], r["Version"]) for r in result.rows] == [("Local", 1, 2), ("Title b", 3, 2)]
+    assert (result.written, result.pulled, result.conflicts) == (1, 1, [])
+
+
+def test_different_fields_of_one_row_are_merged():
+    result = merge([row("a")], [row("a", Title="Local")], [row("a", 2, Week=5)])
+    assert (result.rows[0]["Title"], result.rows[0]["Week"], result.rows[0]["Version"]) == ("Local", 5, 3)
+    assert result.conflicts == []
+
+
+def test_same_field_changed_on_both_sides_conflicts_and_keeps_the_sheet():
+    result = merge([row("a")], [row("a", Title="Local")], [row("a", 2, Title="Remote")])
+    assert result.rows == [row("a", 2, Title="Remote")]
+    assert [(c.fields, c.describe()) for c in result.conflicts] == [(["Title"], "Tactics 'a': Title changed by another session")]
+
+
+def test_same_change_on_both_sides_is_not_a_conflict():
+    result = merge([row("a")], [row("a", Title="Same")], [row("a", 2, Title="Same")])
+    assert result.rows == [row("a", 2, Title="Same")] and result.conflicts == []
+
+
+@pytest.mark.parametrize("local, remote, what", [
+    ([], [row("a", 2, Title="Remote")], "deleted here but edited by another session"),
+    ([row("a", Title="Local")], [], "deleted by another session"),
+])
+def test_delete_against_edit_conflicts(local, remote, what):
+    result = merge([row("a")], local, remote)
+    assert [c.describe() for c in result.conflicts] == [f"Tactics 'a': {what}"]
+    assert result.rows == remote
+
+
+def test_rows_added_on_both_sides_under_one_key_conflict():
+    result = merge([], [row("a", Title="Local")], [row("a", 1, Title="Remote")])
+    assert [c.describe() for c in result.conflicts] == ["Tactics 'a': added by another session too"]
+
+
+def test_unchanged_local_delete_and_remote_add_are_kept():
+    result = merge([row("a"), row("b")], [row("a")], [row("a"), row("b"), row("c")])
+    assert [r["Id"] for r in result.rows] == ["a", "c"]
+
+
+def test_duplicate_keys_refuse_the_save():
+    with pytest.raises(DuplicateKeyError):
+        merge([], [row("a"), row("a")], [])
+
+
+def test_sessions_editing_the_same_tactic(make_storage):
+    first = make_storage()
+    cycle = first.get_cycle()
+    cycle.goals.append(Goal(id="g1", title="Goal", tactics=[Tactic(id="t1", title="Draft", due_week=1)]))
+    first.save_cycle(cycle)
+
+    second = make_storage()
+    theirs = second.get_cycle()
+    theirs.goals[0].tactics[0].due_week = 4
+    assert second.save_cycle(theirs) == []
+
+    # A different field merges; the same field conflicts and keeps the saved value
+    cycle.goals[0].tactics[0].title = "Final"
+    assert first.save_cycle(cycle) == []
+    theirs.goals[0].tactics[0].title = "Other"
+    conflicts = second.save_cycle(theirs)
+    assert [c.fields for c in conflicts] == [["Tactic_Title"]]
+
+    tactic = make_storage().get_cycle().goals[0].tactics[0]
+    assert (tactic.title, tactic.due_week) == ("Final", 4)
@@ -0,0 +1,42 @@
+from datetime import date
+
+import pytest
+
+from src.models import CycleStatus, StrategicBlock
+from src.storage import DEFAULT_CYCLE_ID, StorageError
+
+
+def settings_rows(spreadsheet):
+    return [[str(v) for v in row] for row in spreadsheet.worksheet("Settings").get_all_values()[1:]]
+
+
+def test_legacy_start_date_is_registered_and_kept(spreadsheet, make_storage):
+    ws = spreadsheet.add_worksheet("Settings", rows=20, cols=4)
+    ws.update([["Type", "Key", "Value", "Extra"], ["Cycle", "Start_Date", "2026-01-05", ""]])
+
+    storage = make_storage()
+    assert storage.cycle_info.start_date == date(2026, 1, 5)
+
+    cycle = storage.get_cycle()
+    cycle.strategic_blocks.append(StrategicBlock(day_of_week="Monday", start_time="09:00", end_time="12:00"))
+    storage.save_cycle(cycle)
+    assert settings_rows(spreadsheet) == [["StrategicBlock", "Monday", "09:00", "12:00"], ["Cycle", "Start_Date", "2026-01-05", ""]]
+    assert storage._settings_start_date() == date(2026, 1, 5)
+
+    cycle.strategic_blocks.clear()
+    storage.save_cycle(cycle)
+    assert settings_rows(spreadsheet) == [["Cycle", "Start_Date", "2026-01-05", ""]]
+    assert make_storage().get_cycle().strategic_blocks == []
+
+
+def test_cycles_are_registered_and_closed(make_storage):
+    storage = make_storage()
+    info = storage.create_cycle(owner="Team B", start_date=date(2026, 4, 6))
+    other = make_storage()
+    assert [c.id for c in other.list_cycles()] == [DEFAULT_CYCLE_ID, info.id]
+
+    other.close_cycle(info.id)
+    storage.refresh_registry()
+    assert [c.id for c in storage.list_cycles(CycleStatus.ACTIVE)] == [DEFAULT_CYCLE_ID]
+    with pytest.raises(StorageError):
+        storage.close_cycle(DEFAULT_CYCLE_ID)
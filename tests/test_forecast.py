@@ -0,0 +1,37 @@
+from datetime import date, timedelta
+
+from src import scoring
+from src.forecast import forecast_metrics
+from src.models import Cycle, Goal, Metric, MetricType, Tactic, TacticStatus
+from src.scoring import ScoringRules, compile_rules
+
+TODAY = date(2026, 3, 2)
+
+
+def cycle_with_slowing_execution() -> Cycle:
+    """
+    Weeks 1-2 fully done; weeks 3-4 each have one tactic done and one deferred.
+    """
+    goal = Goal(id="g1", title="Goal")
+    for week in range(1, 5):
+        goal.tactics.append(Tactic(id=f"t{week}a", title=f"A{week}", due_week=week,
+                                  status=TacticStatus.COMPLETED, is_completed=True))
+        late = TacticStatus.DEFERRED if week > 2 else TacticStatus.COMPLETED
+        goal.tactics.append(Tactic(id=f"t{week}b", title=f"B{week}", due_week=week, status=late,
+                                  is_completed=late == TacticStatus.COMPLETED))
+    goal.metrics.append(Metric(id="m1", title="Revenue", type=MetricType.LAG, target_value=100,
+                               current_value=30, last_updated=TODAY))
+    cycle = Cycle(id="c1", start_date=TODAY - timedelta(weeks=4, days=1), goals=[goal])
+    cycle.rebuild_scores()
+    return cycle
+
+
+def test_momentum_follows_the_active_rules(monkeypatch):
+    cycle = cycle_with_slowing_execution()
+    default = forecast_metrics(cycle, today=TODAY)[0]
+
+    monkeypatch.setattr(scoring, "_active", compile_rules(ScoringRules(excluded_statuses=[TacticStatus.DEFERRED])))
+    excluding_deferred = forecast_metrics(cycle, today=TODAY)[0]
+
+    # Without the deferred tactics every week scores 100%, so execution is not slowing
+    assert excluding_deferred.projected_progress > default.projected_progress
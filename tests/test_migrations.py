@@ -0,0 +1,60 @@
+from src.migrations import SCHEMA_VERSION, detect_version, migrate_records, run_migrations, schema_marker
+from src.models import TacticStatus
+
+V0_TACTICS = [
+    ["Goal_ID", "Goal_Title", "Tactic_ID", "Tactic_Title", "Due_Week", "Status", "Block_Type", "Is_Completed"],
+    ["g1", "", "t1", "Write intro", "2.0", "Pending", "", "TRUE"],
+    ["g1", "", "t2", "", "", "", "", "FALSE"],
+]
+V0_REVIEWS = [
+    ["Week_Num", "Score", "Wins", "Lessons", "Date_Submitted"],
+    ["1", "85.5", "Shipped", "", "2026-01-11"],
+    ["", "", "", "", ""],
+]
+V0_METRICS = [
+    ["Goal_ID", "Metric_ID", "Title", "Type", "Starting_Value", "Target_Value", "Current_Value", "Unit", "Last_Updated"],
+    ["g1", "m1", "Words", "Lag", "", "5000", "1200", "words", "2026-01-10"],
+    ["g1", "m2", "Broken", "Lag", "", "not a number", "", "", ""],
+]
+
+
+def seed_v0(spreadsheet):
+    # A new spreadsheet starts with an empty Tactics sheet, like a new Google Sheet's Sheet1
+    spreadsheet.worksheet("Tactics").update(V0_TACTICS)
+    for title, values in (("Reviews", V0_REVIEWS), ("Metrics", V0_METRICS)):
+        spreadsheet.add_worksheet(title, rows=10, cols=10).update(values)
+
+
+def test_v0_records_migrate_to_current_schema():
+    records = [dict(zip(V0_TACTICS[0], r)) for r in V0_TACTICS[1:]]
+    assert detect_version(records) == 0
+    migrated = migrate_records("Tactics", records, 0)
+    assert migrated[0]["Status"] == "Not Started" and migrated[0]["Due_Week"] == 2 and migrated[0]["Is_Completed"] is True
+    assert migrated[1]["Tactic_Title"] == "Untitled Tactic" and migrated[1]["Goal_Title"] == "Untitled Goal"
+    assert all((r["Version"], r["Updated_At"]) == (1, "") for r in migrated)
+
+
+def test_loading_v0_sheets_migrates_and_writes_them_back_once(spreadsheet, make_storage):
+    seed_v0(spreadsheet)
+    cycle = make_storage().get_cycle()
+
+    tactics = cycle.goals[0].tactics
+    assert [(t.title, t.due_week, t.status, t.is_completed) for t in tactics] == [
+        ("Write intro", 2, TacticStatus.NOT_STARTED, True), ("Untitled Tactic", 1, TacticStatus.NOT_STARTED, False)]
+    assert all(t.row_version == 1 for t in tactics)
+    assert [(r.week_num, r.score) for r in cycle.reviews] == [(1, 85.5)]
+    assert [m.id for m in cycle.goals[0].metrics] == ["m1"]
+
+    for title in ("Tactics", "Reviews", "Metrics"):
+        header = spreadsheet.worksheet(title).get_all_values()[0]
+        assert header[-1] == schema_marker(SCHEMA_VERSION)
+    writes = spreadsheet.calls["write"]
+    make_storage().get_cycle()
+    assert spreadsheet.calls["write"] == writes
+
+
+def test_run_migrations_upgrades_every_outdated_sheet(spreadsheet, make_storage):
+    seed_v0(spreadsheet)
+    storage = make_storage()
+    assert run_migrations(storage) == {"Tactics": 0, "Reviews": 0, "Metrics": 0}
+    assert run_migrations(storage) == {}
@@ -0,0 +1,50 @@
+import time
+
+from src.models import Cycle, Goal, Tactic
+from src.precompute import DRAFT_FORMAT, build_week_plan, schedule, wam_draft, week_plan
+from src.reports import render_wam_report
+
+
+def make_cycle() -> Cycle:
+    goal = Goal(id="g1", title="Goal", tactics=[
+        Tactic(id=f"t{i}", title=f"Tactic {i}", due_week=1 + i % 3, is_completed=i % 2 == 0) for i in range(9)
+    ])
+    return Cycle(id="c1", start_date="2026-01-05", goals=[goal])
+
+
+def wait_for(cycle: Cycle, key, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        version, entries = cycle._memo
+        if version == cycle.memo_version() and key in entries:
+            return entries[key]
+        time.sleep(0.01)
+    raise AssertionError(f"{key} was not precomputed")
+
+
+def test_schedule_prepares_this_and_next_week_and_the_wam_draft():
+    cycle = make_cycle()
+    schedule(cycle, 1)
+    assert wait_for(cycle, ("week_plan", 2)) == build_week_plan(cycle, 2)
+    assert wait_for(cycle, ("week_plan", 1)) == build_week_plan(cycle, 1)
+    draft = wait_for(cycle, ("wam", (1,), DRAFT_FORMAT))
+    assert draft == render_wam_report(cycle, [1], DRAFT_FORMAT)
+    assert wam_draft(cycle, [1]) is draft
+
+
+def test_results_of_an_older_version_are_discarded():
+    cycle = make_cycle()
+    version = cycle.memo_version()
+    stale = build_week_plan(cycle, 1)
+    cycle.goals[0].tactics[0].due_week = 5
+    assert not cycle.memo_put(("week_plan", 1), stale, version)
+    assert week_plan(cycle, 1).counts.total == stale.counts.total - 1
+
+
+def test_an_edit_schedules_again():
+    cycle = make_cycle()
+    schedule(cycle, 1)
+    wait_for(cycle, ("week_plan", 1))
+    cycle.goals[0].tactics[1].is_completed = True
+    schedule(cycle, 1)
+    assert wait_for(cycle, ("week_plan", 1)).counts.completed == build_week_plan(cycle, 1).counts.completed
@@ -0,0 +1,77 @@
+from src.models import Goal, Tactic
+from src.search import SearchIndex, bucket_of
+
+
+def same_bucket_ids(prefix: str, count: int):
+    ids, bucket = [], None
+    n = 0
+    while len(ids) < count:
+        doc_id = f"{prefix}/{n}"
+        if bucket is None:
+            bucket = bucket_of(doc_id)
+        if bucket_of(doc_id) == bucket:
+            ids.append(doc_id)
+        n += 1
+    return ids
+
+
+def stored_index(spreadsheet) -> SearchIndex:
+    values = spreadsheet.worksheet("Search_Index").get_all_values()
+    return SearchIndex.from_rows((int(r[0]), [c for c in r[1:] if c]) for r in values[1:] if r and r[0])
+
+
+def test_query_syntax():
+    index = SearchIndex()
+    index.add_document("a", "c1", "Tactic", "A", "deep work block every morning")
+    index.add_document("b", "c1", "Tactic", "B", "work deep into the night")
+    index.add_document("c", "c1", "Tactic", "C", "launch the newsletter")
+    assert {h.doc_id for h in index.search("deep work")} == {"a", "b"}
+    assert [h.doc_id for h in index.search('"deep work"')] == ["a"]
+    assert [h.doc_id for h in index.search("laun*")] == ["c"]
+    assert index.search("deep launch") == []
+
+
+def test_saved_tactics_are_searchable(make_storage):
+    storage = make_storage()
+    cycle = storage.get_cycle()
+    cycle.goals.append(Goal(id="g1", title="Write a book", tactics=[Tactic(id="t1", title="Outline zebra chapter", due_week=2)]))
+    storage.save_cycle(cycle)
+    assert [h.title for h in storage.search("zebra")] == ["Outline zebra chapter (Week 2)"]
+
+
+def test_bucket_writes_keep_documents_of_other_writers(make_storage, spreadsheet):
+    storage = make_storage()
+    mine = storage.search_index()
+    ours, theirs, gone = same_bucket_ids("c1/note", 3)
+    mine.add_document(gone, "c1", "Vision", "Gone", "soon removed")
+    storage._persist_search_index(mine)
+
+    # Another process, which read the sheet earlier, writes to the same bucket
+    other = stored_index(spreadsheet)
+    other.add_document(theirs, "c1", "Vision", "Theirs", "written elsewhere")
+    other.remove_document(gone)
+    storage._persist_search_index(other)
+
+    mine.add_document(ours, "c1", "Vision", "Ours", "written here")
+    storage._persist_search_index(mine)
+
+    stored = stored_index(spreadsheet)
+    assert set(stored.buckets[bucket_of(ours)]) >= {ours, theirs}
+    assert gone not in stored.docs
+    # The merge also brings this process's index up to date
+    assert theirs in mine.docs and gone not in mine.docs
+
+
+def test_failed_write_keeps_documents_pending(make_storage, monkeypatch):
+    storage = make_storage()
+    index = storage.search_index()
+    index.add_document("c1/note/x", "c1", "Vision", "X", "pending text")
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("quota")
+    monkeypatch.setattr("src.storage._overwrite_rows", fail)
+    try:
+        storage._persist_search_index(index)
+    except RuntimeError:
+        pass
+    assert "c1/note/x" in index.pending
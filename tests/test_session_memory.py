@@ -0,0 +1,50 @@
+from src.models import Goal, Metric, MetricType, Tactic
+from src.session_memory import BlobCache, PackedCycle, SessionCycle, pack_idle_sessions
+
+
+def test_blob_cache_evicts_least_recently_used_over_budget():
+    cache = BlobCache(budget_bytes=10, max_entries=8)
+    cache.get("a", lambda: b"12345")
+    cache.get("b", lambda: b"12345")
+    cache.get("a", lambda: b"never built")
+    cache.get("c", lambda: b"12345")
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert (cache.nbytes, cache.hits, cache.evictions) == (10, 1, 1)
+
+
+def loaded_cycle(make_storage):
+    storage = make_storage()
+    cycle = storage.get_cycle()
+    goal = Goal(id="g1", title="Goal", tactics=[Tactic(id=f"t{i}", title=f"T{i}", due_week=i + 1) for i in range(3)],
+                metrics=[Metric(id="m1", title="M", type=MetricType.LAG, target_value=10)])
+    cycle.goals.append(goal)
+    cycle.rebuild_scores()
+    storage.save_cycle(cycle)
+    return storage, cycle
+
+
+def test_packed_cycle_keeps_what_saves_need(make_storage):
+    storage, cycle = loaded_cycle(make_storage)
+    cycle.goals[0].tactics[1].is_completed = True
+    unpacked = PackedCycle(cycle).unpack()
+
+    assert unpacked.model_dump() == cycle.model_dump()
+    assert unpacked.dirty_sections() == cycle.dirty_sections()
+    assert unpacked.base_rows("tactics") == cycle.base_rows("tactics")
+    assert unpacked.goals[0].tactics[1].row_meta() == cycle.goals[0].tactics[1].row_meta()
+    assert storage.save_cycle(unpacked) == []
+    assert make_storage().get_cycle().goals[0].tactics[1].is_completed
+
+
+def test_idle_sessions_are_packed_and_materialized_on_use(make_storage):
+    _, cycle = loaded_cycle(make_storage)
+    held = SessionCycle(cycle)
+    assert held.get() is cycle
+    assert held.pack_if_idle(idle_seconds=3600) == 0
+
+    assert pack_idle_sessions(idle_seconds=0) >= 1
+    assert held.packed
+    restored = held.get()
+    assert not held.packed
+    assert restored is not cycle and restored.model_dump() == cycle.model_dump()
+    assert held.get() is restored
@@ -0,0 +1,103 @@
+import pytest
+
+from src.memory_sheets import MemoryWorksheet
+from src import storage as storage_module
+from src.models import Goal, Tactic
+
+THRESHOLD = 3
+
+
+def add_goal(cycle, goal_id: str, tactics: int = 2):
+    goal = Goal(id=goal_id, title=f"Goal {goal_id}")
+    for t in range(tactics):
+        goal.tactics.append(Tactic(id=f"{goal_id}-t{t}", title=f"Tactic {t} of {goal_id}", due_week=t + 1))
+    cycle.goals.append(goal)
+    cycle.rebuild_scores()
+    return goal
+
+
+def tactic_ids(cycle):
+    return sorted(t.id for g in cycle.goals for t in g.tactics)
+
+
+def manifest_titles(spreadsheet):
+    return [r["Shard"] for r in spreadsheet.worksheet("Shard_Manifest").get_all_records()]
+
+
+@pytest.fixture
+def sharded(make_storage):
+    storage = make_storage(tactic_shard_threshold=THRESHOLD)
+    cycle = storage.get_cycle()
+    add_goal(cycle, "g0")
+    add_goal(cycle, "g1")
+    storage.save_cycle(cycle)
+    return storage, cycle
+
+
+def test_plan_is_split_into_shards_listed_in_the_manifest(sharded, spreadsheet):
+    assert manifest_titles(spreadsheet) == ["Tactics", "Tactics#g0", "Tactics#g1"]
+    assert spreadsheet.worksheet("Tactics").get_all_records() == []
+
+
+def test_load_reads_only_shards_whose_manifest_digest_changed(sharded, make_storage, monkeypatch):
+    storage, cycle = sharded
+    reader = make_storage(tactic_shard_threshold=THRESHOLD)
+    assert tactic_ids(reader.get_cycle()) == tactic_ids(cycle)
+
+    # Storages in one process share the row cache; put back what it held before the save so
+    # the save looks like it came from another process
+    seen = dict(storage_module._tactic_rows)
+    cycle.goals[1].tactics[0].title = "Renamed"
+    storage.save_cycle(cycle)
+    storage_module._tactic_rows.clear()
+    storage_module._tactic_rows.update(seen)
+    fetched = []
+    read = MemoryWorksheet.get_all_records
+    monkeypatch.setattr(MemoryWorksheet, "get_all_records", lambda ws: (fetched.append(ws.title), read(ws))[1])
+    reloaded = reader.get_cycle()
+    assert [t for t in fetched if t.startswith("Tactics")] == ["Tactics#g1"]
+    assert reloaded.goals[1].tactics[0].title == "Renamed"
+
+
+def test_shard_created_by_another_session_survives_a_stale_save(sharded, make_storage):
+    storage, cycle = sharded
+    other = make_storage(tactic_shard_threshold=THRESHOLD)
+    theirs = other.get_cycle()
+    add_goal(theirs, "g9")
+    other.save_cycle(theirs)
+
+    # `storage` still has the worksheet listing from before Tactics#g9 existed
+    cycle.goals[0].tactics[0].title = "Edited here"
+    assert storage.save_cycle(cycle) == []
+
+    fresh = make_storage(tactic_shard_threshold=THRESHOLD).get_cycle()
+    assert "g9-t0" in tactic_ids(fresh)
+    assert fresh.goals[0].tactics[0].title == "Edited here"
+    assert len(tactic_ids(fresh)) == 6
+
+
+def test_deleted_goal_is_removed_from_the_manifest(sharded, make_storage, spreadsheet):
+    storage, cycle = sharded
+    stale = make_storage(tactic_shard_threshold=THRESHOLD)
+    add_goal(cycle, "g2")
+    storage.save_cycle(cycle)
+    assert "Tactics#g2" in manifest_titles(spreadsheet)
+
+    cycle.scores.remove_goal(cycle.goals[2])
+    del cycle.goals[2]
+    storage.save_cycle(cycle)
+    assert "Tactics#g2" not in manifest_titles(spreadsheet)
+
+    # A Storage whose listing predates the deletion still loads the remaining goals
+    assert tactic_ids(stale.get_cycle()) == tactic_ids(cycle)
+
+
+def test_unsharding_moves_rows_back_to_the_main_sheet(sharded, make_storage, spreadsheet):
+    storage, cycle = sharded
+    unsharded = make_storage(tactic_shard_threshold=100)
+    loaded = unsharded.get_cycle()
+    loaded.goals[0].tactics[0].title = "Back home"
+    unsharded.save_cycle(loaded)
+    assert manifest_titles(spreadsheet) == ["Tactics"]
+    assert len(spreadsheet.worksheet("Tactics").get_all_records()) == 4
+    assert tactic_ids(make_storage(tactic_shard_threshold=100).get_cycle()) == tactic_ids(cycle)
@@ -0,0 +1,85 @@
+from datetime import date
+
+import pytest
+
+from src.models import BlockType, Cycle, Goal, Metric, MetricType, StrategicBlock, Tactic, TacticStatus, WeeklyReview
+from src.snapshot import SnapshotError, digest, dumps, loads, read_header, read_snapshot, write_snapshot
+
+
+def make_cycle() -> Cycle:
+    goals = []
+    for g in range(3):
+        goal = Goal(id=f"g{g}", title=f"Goal {g} ✓")
+        for t in range(4):
+            tactic = Tactic(id=f"t{g}_{t}", title=f"Tactic {t}", due_week=t + 1, status=TacticStatus.IN_PROGRESS,
+                            block_type=BlockType.STRATEGIC, is_completed=t % 2 == 0)
+            tactic.set_row_meta(t + 1, "2026-01-05T09:00:00")
+            goal.tactics.append(tactic)
+        goal.metrics.append(Metric(id=f"m{g}", title="Revenue", type=MetricType.LAG, starting_value=1.5,
+                                   target_value=100, current_value=42.25, unit="€", last_updated=date(2026, 2, 1)))
+        goals.append(goal)
+    cycle = Cycle(id="c1", start_date=date(2026, 1, 5), goals=goals, vision_3_year="Far", vision_1_year="Near",
+                  reviews=[WeeklyReview(week_num=1, score=87.5, wins="Shipped", lessons="", date_submitted=date(2026, 1, 11))],
+                  strategic_blocks=[StrategicBlock(day_of_week="Monday", start_time="09:00", end_time="12:00")])
+    cycle.rebuild_scores()
+    return cycle
+
+
+def assert_same(a: Cycle, b: Cycle):
+    assert a.model_dump() == b.model_dump()
+    metas = lambda c: [t.row_meta() for g in c.goals for t in g.tactics]
+    assert metas(a) == metas(b)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_full_snapshot_round_trip(compress, tmp_path):
+    cycle = make_cycle()
+    data = dumps(cycle, compress=compress)
+    header = read_header(data)
+    assert (header.compressed, header.delta) == (compress, False)
+    assert_same(loads(data), cycle)
+
+    path = tmp_path / "cycle.12wk"
+    write_snapshot(str(path), cycle, compress=compress)
+    assert_same(read_snapshot(str(path)), cycle)
+
+
+def test_delta_applies_edits_adds_deletes_and_reorders():
+    base = make_cycle()
+    cycle = loads(dumps(base))
+    cycle.goals[0].tactics[1].title = "Renamed"
+    cycle.goals[0].tactics[1].set_row_meta(9, "2026-02-01T10:00:00")
+    del cycle.goals[1].tactics[0]
+    cycle.goals[2].tactics.append(Tactic(id="new", title="Added", due_week=7))
+    cycle.goals.reverse()
+    cycle.goals.append(Goal(id="g9", title="New goal"))
+    cycle.reviews.append(WeeklyReview(week_num=2, score=50.0, date_submitted=date(2026, 1, 18)))
+    cycle.vision_1_year = "Nearer"
+    cycle.rebuild_scores()
+
+    delta = dumps(cycle, base=base)
+    assert read_header(delta).base_digest == digest(base)
+    assert len(delta) < len(dumps(cycle)) / 2
+    assert_same(loads(delta, base=base), cycle)
+
+
+def test_delta_needs_its_exact_base():
+    base = make_cycle()
+    cycle = loads(dumps(base))
+    cycle.goals[0].title = "Changed"
+    delta = dumps(cycle, base=base)
+    with pytest.raises(SnapshotError, match="base snapshot is required"):
+        loads(delta)
+    other = make_cycle()
+    other.vision_3_year = "Different"
+    with pytest.raises(SnapshotError, match="does not match"):
+        loads(delta, base=other)
+
+
+def test_corrupt_or_foreign_data_is_rejected():
+    data = bytearray(dumps(make_cycle()))
+    data[-1] ^= 0xFF
+    with pytest.raises(SnapshotError, match="checksum"):
+        loads(bytes(data))
+    with pytest.raises(SnapshotError, match="bad magic"):
+        loads(b"PK\x03\x04" + bytes(20))